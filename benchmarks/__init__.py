@@ -0,0 +1 @@
+"""Reproducible benchmarks for the org scripts and hooks (see run.py)."""
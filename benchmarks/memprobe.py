@@ -0,0 +1,40 @@
+"""
+Retained memory of a parsed vault index, per note.
+
+    python -m benchmarks.memprobe VAULT
+
+Builds the shared VaultIndex under tracemalloc and prints one JSON object:
+bytes still allocated once the build finishes (what generators hold while
+they render), peak bytes during the build, and both divided by note count.
+Run in a fresh interpreter so earlier allocations don't skew the numbers.
+"""
+
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "setup" / "hooks"))
+
+import yaml  # noqa: E402
+from orglib import VaultIndex, yaml_loader  # noqa: E402
+
+
+def probe(vault: Path) -> dict:
+    tracemalloc.start()
+    index = VaultIndex(vault, yaml_loader(yaml))
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    notes = max(1, len(index.docs))
+    return {
+        "notes": len(index.docs),
+        "retained_bytes": retained,
+        "peak_bytes": peak,
+        "retained_bytes_per_note": round(retained / notes, 1),
+        "peak_bytes_per_note": round(peak / notes, 1),
+    }
+
+
+if __name__ == "__main__":
+    print(json.dumps(probe(Path(sys.argv[1]))))
@@ -0,0 +1,221 @@
+"""
+Benchmark the generators and hooks against synthetic vaults.
+
+    python -m benchmarks.run                          # default scales
+    python -m benchmarks.run --scales 100,1000,10000 --repeat 5
+    python -m benchmarks.run --compare benchmarks/results/<old>.json
+
+Each tool runs as a fresh interpreter, the way publish/Claude Code invoke
+them. Timings are wall-clock around the subprocess; peak RSS and work
+counters come from the tool's own metrics record (CLAUDE_ORG_METRICS).
+The first run of each tool is reported as `cold` (it writes all outputs);
+the median of the following runs is the steady-state number. The
+index-memory probe (memprobe.py) reports bytes retained per parsed note.
+
+Results are written as JSON with the commit they were taken at, so runs
+from different commits can be compared with --compare.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from .synth import generate_vault
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+DEFAULT_SCALES = [100, 1000, 5000]
+
+# name -> (script relative to the repo, extra args, stdin)
+TOOLS = {
+    "tag-pages": ("scripts/generate-tag-pages.py", ["--quiet"], None),
+    "dashboard": ("scripts/generate-publish-dashboard.py", [], None),
+    "session-start": ("setup/hooks/session-start.py", [], '{"source": "startup"}'),
+    "maintenance-check": ("setup/hooks/maintenance-check.py", [], None),
+}
+
+
+def git_revision() -> dict:
+    """Commit and dirty flag of the code under test, if this is a git checkout."""
+    def git(*args):
+        return subprocess.run(["git", *args], cwd=REPO_ROOT, capture_output=True, text=True).stdout.strip()
+    try:
+        return {"commit": git("rev-parse", "--short", "HEAD") or None,
+                "dirty": bool(git("status", "--porcelain", "--untracked-files=no"))}
+    except OSError:
+        return {"commit": None, "dirty": None}
+
+
+def write_transcript(path: Path, lines: int = 200) -> None:
+    """A transcript long enough that the Stop hook does its full check."""
+    path.write_text("".join(f'{{"turn": {i}, "text": "synthetic"}}\n' for i in range(lines)), encoding="utf-8")
+
+
+def run_tool(name: str, vault: Path, metrics_file: Path, transcript: Path) -> dict:
+    """Run one tool once; returns wall time plus its metrics record."""
+    script, extra, stdin = TOOLS[name]
+    args = [sys.executable, str(REPO_ROOT / script), *extra]
+    if script.startswith("scripts/"):
+        args += ["--vault", str(vault)]
+    if name == "maintenance-check":
+        stdin = json.dumps({"transcript_path": str(transcript)})
+    env = dict(os.environ, CLAUDE_ORG_DIR=str(vault), CLAUDE_ORG_METRICS=str(metrics_file))
+
+    metrics_file.unlink(missing_ok=True)
+    start = time.perf_counter()
+    proc = subprocess.run(args, input=stdin or "", capture_output=True, text=True, env=env)
+    wall_ms = (time.perf_counter() - start) * 1000
+    if proc.returncode != 0:
+        raise RuntimeError(f"{name} failed ({proc.returncode}): {proc.stderr.strip()[-500:]}")
+
+    record = {}
+    if metrics_file.exists():
+        lines = metrics_file.read_text(encoding="utf-8").splitlines()
+        record = json.loads(lines[-1]) if lines else {}
+    return {"wall_ms": wall_ms, "output_bytes": len(proc.stdout.encode("utf-8")), "record": record}
+
+
+def bench_scale(n_tasks: int, seed: int, repeat: int, tools: list[str], workdir: Path) -> list[dict]:
+    vault = workdir / f"vault-{n_tasks}"
+    gen_start = time.perf_counter()
+    counts = generate_vault(vault, n_tasks, seed)
+    gen_ms = (time.perf_counter() - gen_start) * 1000
+    notes = sum(counts.values())
+    print(f"\n== {n_tasks} tasks: {notes} notes generated in {gen_ms:.0f}ms ==")
+
+    metrics_file = workdir / "metrics.jsonl"
+    transcript = workdir / "transcript.jsonl"
+    write_transcript(transcript)
+
+    results = []
+    for name in (t for t in tools if t in TOOLS):
+        runs = [run_tool(name, vault, metrics_file, transcript) for _ in range(repeat + 1)]
+        cold, warm = runs[0], runs[1:] or runs
+        times = [r["wall_ms"] for r in warm]
+        median = statistics.median(times)
+        record = warm[-1]["record"]
+        result = {
+            "tool": name,
+            "scale": n_tasks,
+            "notes": notes,
+            "cold_ms": round(cold["wall_ms"], 2),
+            "median_ms": round(median, 2),
+            "min_ms": round(min(times), 2),
+            "max_ms": round(max(times), 2),
+            "notes_per_sec": round(notes / (median / 1000), 1) if median else None,
+            "peak_rss_kb": max((r["record"].get("peak_rss_kb") or 0) for r in runs) or None,
+            "output_bytes": warm[-1]["output_bytes"],
+            "phases": record.get("phases", {}),
+            "counters": record.get("counters", {}),
+        }
+        results.append(result)
+        rss = f"{result['peak_rss_kb'] / 1024:.1f}MB" if result["peak_rss_kb"] else "-"
+        print(f"  {name:<18} cold {result['cold_ms']:>8.0f}ms  median {median:>8.0f}ms  "
+              f"{result['notes_per_sec'] or 0:>9.0f} notes/s  rss {rss}")
+    if "index-memory" in tools:
+        probe = subprocess.run([sys.executable, "-m", "benchmarks.memprobe", str(vault)],
+                               cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+        mem = json.loads(probe.stdout)
+        results.append({"tool": "index-memory", "scale": n_tasks, "notes": notes,
+                        "median_ms": 0, "peak_rss_kb": None, **mem})
+        print(f"  {'index-memory':<18} retained {mem['retained_bytes_per_note']:>8.0f} B/note  "
+              f"peak {mem['peak_bytes_per_note']:>8.0f} B/note")
+    return results
+
+
+def memory_per_note(results: list[dict]) -> dict[str, float]:
+    """Marginal peak-RSS KiB per note between the smallest and largest scale."""
+    per_tool = {}
+    for name in {r["tool"] for r in results}:
+        rows = sorted((r for r in results if r["tool"] == name and r["peak_rss_kb"]), key=lambda r: r["notes"])
+        if len(rows) >= 2 and rows[-1]["notes"] > rows[0]["notes"]:
+            per_tool[name] = round((rows[-1]["peak_rss_kb"] - rows[0]["peak_rss_kb"])
+                                   / (rows[-1]["notes"] - rows[0]["notes"]), 3)
+    return per_tool
+
+
+def compare(current: dict, baseline_path: Path) -> None:
+    """Print median time and RSS deltas against a previous results file."""
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    old = {(r["tool"], r["scale"]): r for r in baseline["results"]}
+    print(f"\nCompared with {baseline['meta'].get('commit')} ({baseline_path.name}):")
+    for r in current["results"]:
+        b = old.get((r["tool"], r["scale"]))
+        if not b:
+            continue
+        if r["tool"] == "index-memory":
+            dmem = (r["retained_bytes_per_note"] - b["retained_bytes_per_note"]) / b["retained_bytes_per_note"] * 100
+            print(f"  {r['tool']:<18} {r['scale']:>7}  retained/note {dmem:+6.1f}%")
+            continue
+        dt = (r["median_ms"] - b["median_ms"]) / b["median_ms"] * 100 if b["median_ms"] else 0
+        drss = ""
+        if r["peak_rss_kb"] and b["peak_rss_kb"]:
+            drss = f"  rss {(r['peak_rss_kb'] - b['peak_rss_kb']) / b['peak_rss_kb'] * 100:+.1f}%"
+        print(f"  {r['tool']:<18} {r['scale']:>7}  time {dt:+6.1f}%{drss}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Synthetic-vault benchmarks")
+    parser.add_argument("--scales", default=",".join(map(str, DEFAULT_SCALES)),
+                        help="Comma-separated task counts (other note kinds scale with it)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3, help="Warm runs per tool (after one cold run)")
+    parser.add_argument("--tools", default=",".join([*TOOLS, "index-memory"]),
+                        help="Comma-separated subset of tools (index-memory: tracemalloc probe of the vault index)")
+    parser.add_argument("--output", type=Path, help="Results JSON (default: benchmarks/results/<commit>.json)")
+    parser.add_argument("--compare", type=Path, help="Previous results JSON to diff against")
+    parser.add_argument("--keep", type=Path, help="Generate vaults here and keep them")
+    args = parser.parse_args()
+
+    scales = [int(s) for s in args.scales.split(",") if s]
+    tools = [t for t in args.tools.split(",") if t]
+    unknown = set(tools) - set(TOOLS) - {"index-memory"}
+    if unknown:
+        parser.error(f"unknown tools: {', '.join(sorted(unknown))}")
+
+    meta = {
+        **git_revision(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "scales": scales,
+    }
+    print(f"Benchmarking {meta['commit'] or 'working tree'} on Python {meta['python']}")
+
+    results = []
+    if args.keep:
+        args.keep.mkdir(parents=True, exist_ok=True)
+        for n in scales:
+            results += bench_scale(n, args.seed, args.repeat, tools, args.keep)
+    else:
+        with tempfile.TemporaryDirectory(prefix="org-bench-") as tmp:
+            for n in scales:
+                results += bench_scale(n, args.seed, args.repeat, tools, Path(tmp))
+
+    report = {"meta": meta, "results": results, "memory_kb_per_note": memory_per_note(results)}
+    if report["memory_kb_per_note"]:
+        print("\nMarginal peak RSS per note:")
+        for name, kb in sorted(report["memory_kb_per_note"].items()):
+            print(f"  {name:<18} {kb:.2f} KiB/note")
+
+    output = args.output or RESULTS_DIR / f"{meta['commit'] or 'worktree'}{'-dirty' if meta['dirty'] else ''}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=1), encoding="utf-8")
+    print(f"\nResults: {output}")
+
+    if args.compare:
+        compare(report, args.compare)
+
+
+if __name__ == "__main__":
+    main()
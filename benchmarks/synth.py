@@ -0,0 +1,219 @@
+"""
+Deterministic synthetic org dirs.
+
+`generate_vault(root, n_tasks, seed)` writes a vault whose shape follows the
+real layout: tasks in all seven statuses and their folders (tasks/README.md),
+reminders with repeat rules, every inbox subfolder, nested knowledge folders,
+projects with README frontmatter, and the context files the hooks read.
+
+Everything derives from `seed` and a fixed anchor date - including file
+mtimes - so two runs with the same arguments produce byte-identical trees and
+benchmark numbers stay comparable across commits.
+"""
+
+import os
+import random
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+ANCHOR = datetime(2026, 1, 5, 9, 0)
+
+# (status, folder, weight) - folders per tasks/README.md "Full Model"
+TASK_STATUSES = [
+    ("active", "tasks", 15),
+    ("blocked", "tasks", 5),
+    ("review", "tasks/review", 5),
+    ("backlog", "tasks/backlog", 20),
+    ("incubating", "tasks/incubating", 10),
+    ("paused", "tasks/paused", 5),
+    ("complete", "tasks/completed", 40),
+]
+
+# (status, folder, repeat choices, weight) - per reminders/README.md
+REMINDER_STATUSES = [
+    ("pending", "reminders", [None], 40),
+    ("ongoing", "reminders", ["daily", "weekly", "monthly"], 20),
+    ("snoozed", "reminders", [None, "weekly"], 10),
+    ("completed", "reminders/completed", [None, "daily", "weekly"], 25),
+    ("dismissed", "reminders/completed", [None], 5),
+]
+
+INBOX_FOLDERS = ["emails", "tickets", "ideas", "decisions", "investigations", "captures"]
+
+WORDS = (
+    "cache index parser queue deploy schema review latency budget graph "
+    "vault publish hook session token metric shard archive reminder project "
+    "migration refactor release incident postmortem design api client server "
+    "storage network auth billing search onboarding docs testing build"
+).split()
+
+
+def _weighted(rng: random.Random, table: list) -> tuple:
+    return rng.choices(table, weights=[row[-1] for row in table])[0]
+
+
+class _Writer:
+    """Writes files with deterministic mtimes and keeps per-kind counts."""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.counts: dict[str, int] = {}
+        self.clock = ANCHOR
+
+    def write(self, rel: str, text: str, kind: str) -> None:
+        path = self.root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+        self.clock += timedelta(minutes=7)
+        ts = self.clock.timestamp()
+        os.utime(path, (ts, ts))
+        self.counts[kind] = self.counts.get(kind, 0) + 1
+
+
+class _Tags:
+    """Zipf-like tag vocabulary: a few tags are everywhere, most are rare."""
+
+    def __init__(self, rng: random.Random, size: int):
+        self.rng = rng
+        self.vocab = [f"{rng.choice(WORDS)}-{i}" if i >= len(WORDS) else WORDS[i]
+                      for i in range(size)]
+        self.weights = [1.0 / (rank + 1) for rank in range(size)]
+
+    def pick(self, max_tags: int = 5) -> list[str]:
+        k = self.rng.randint(0, max_tags)
+        return sorted(set(self.rng.choices(self.vocab, weights=self.weights, k=k)))
+
+
+def _title(rng: random.Random) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 5))).capitalize()
+
+
+def _slug(title: str, i: int) -> str:
+    return f"{title.lower().replace(' ', '-')}-{i}"
+
+
+def _body(rng: random.Random, title: str, paragraphs: int) -> str:
+    parts = [f"# {title}", ""]
+    for _ in range(paragraphs):
+        parts.append(" ".join(rng.choice(WORDS) for _ in range(rng.randint(20, 80))) + ".")
+        parts.append("")
+    return "\n".join(parts)
+
+
+def _frontmatter(fields: dict) -> str:
+    lines = ["---"]
+    for key, value in fields.items():
+        if isinstance(value, list):
+            value = f"[{', '.join(value)}]"
+        elif value is None:
+            value = "null"
+        lines.append(f"{key}: {value}")
+    lines.append("---")
+    return "\n".join(lines) + "\n"
+
+
+def _day(rng: random.Random, back: int = 365) -> date:
+    return (ANCHOR - timedelta(days=rng.randint(0, back))).date()
+
+
+def generate_vault(root: Path, n_tasks: int, seed: int = 0) -> dict[str, int]:
+    """Write a synthetic org dir under `root`; returns file counts per kind.
+
+    Other note kinds scale with `n_tasks`: reminders 1/5, inbox 1/2,
+    knowledge 1/2, projects 1/50 (at least one of each).
+    """
+    rng = random.Random(seed)
+    root = Path(root)
+    w = _Writer(root)
+    tags = _Tags(rng, max(20, n_tasks // 10))
+    projects = [_slug(_title(rng), i) for i in range(max(1, n_tasks // 50))]
+
+    w.write("CLAUDE.md", "# Org System\n\nSynthetic benchmark vault.\n", "context")
+    w.write("context/current-state.md",
+            "# Current State\n\n## Active Projects\n"
+            + "".join(f"- **{p}** - see `projects/{p}/`\n" for p in projects[:20])
+            + "\n## Notes\n\nNothing else.\n", "context")
+    w.write("context/voice.md",
+            "# Voice\n\n## How to Collaborate\n"
+            + "".join(f"- Rule {i}: {_title(rng)}\n" for i in range(30))
+            + "\n## Other\n\nMore.\n", "context")
+    w.write("tasks/README.md", "---\ntype: index\n---\n# Tasks\n", "index")
+    w.write("reminders/README.md", "---\ntype: index\n---\n# Reminders\n", "index")
+
+    for name in projects:
+        created = _day(rng)
+        fm = {"type": "project", "status": rng.choice(["active", "active", "paused", "complete"]),
+              "created": created.isoformat(), "tags": tags.pick(3)}
+        w.write(f"projects/{name}/README.md",
+                _frontmatter(fm) + "\n" + _body(rng, name.replace("-", " ").title(), 2), "project")
+
+    for i in range(n_tasks):
+        status, folder, _ = _weighted(rng, TASK_STATUSES)
+        title = _title(rng)
+        created = _day(rng)
+        fm = {
+            "type": "task",
+            "status": status,
+            "created": created.isoformat(),
+            "completed": (created + timedelta(days=rng.randint(1, 60))).isoformat()
+            if status == "complete" else None,
+            "tags": tags.pick(),
+            "blocked-by": [rng.choice(projects)] if status == "blocked" else [],
+        }
+        if status == "review":
+            fm["review-needed"] = f'"{_title(rng)}?"'
+        if rng.random() < 0.5:
+            fm["project"] = rng.choice(projects)
+        w.write(f"{folder}/{_slug(title, i)}.md",
+                _frontmatter(fm) + "\n" + _body(rng, title, rng.randint(1, 4)), "task")
+
+    for i in range(max(1, n_tasks // 5)):
+        status, folder, repeats, _ = _weighted(rng, REMINDER_STATUSES)
+        title = _title(rng)
+        remind_at = ANCHOR + timedelta(hours=rng.randint(-24 * 30, 24 * 30))
+        repeat = rng.choice(repeats)
+        fm = {
+            "type": "reminder",
+            "status": status,
+            "created": _day(rng, 60).isoformat(),
+            "remind-at": remind_at.strftime("%Y-%m-%dT%H:%M"),
+            "repeat": repeat,
+            "repeat-until": (remind_at + timedelta(days=90)).date().isoformat() if repeat else None,
+            "snoozed-until": (remind_at + timedelta(hours=4)).strftime("%Y-%m-%dT%H:%M")
+            if status == "snoozed" else None,
+            "completed": remind_at.date().isoformat() if status in ("completed", "dismissed") else None,
+            "tags": tags.pick(2),
+        }
+        w.write(f"{folder}/{_slug(title, i)}.md", _frontmatter(fm) + "\n" + _body(rng, title, 1), "reminder")
+
+    for i in range(max(1, n_tasks // 2)):
+        sub = rng.choice(INBOX_FOLDERS + [""])  # "" = stray file in inbox root
+        title = _title(rng)
+        fm = {"type": "inbox", "created": _day(rng, 90).isoformat(),
+              "source": sub.rstrip("s") or "capture", "tags": tags.pick(2)}
+        folder = f"inbox/{sub}" if sub else "inbox"
+        w.write(f"{folder}/{_slug(title, i)}.md", _frontmatter(fm) + "\n" + _body(rng, title, rng.randint(1, 6)), "inbox")
+
+    domains = [rng.choice(WORDS) + f"-{i}" for i in range(max(2, n_tasks // 200))]
+    root_files = []
+    for i in range(max(1, n_tasks // 2)):
+        depth = rng.choice([0, 1, 1, 2, 2, 3])
+        parts = [rng.choice(domains)] + [rng.choice(WORDS) for _ in range(depth - 1)] if depth else []
+        title = _title(rng)
+        created = _day(rng, 720)
+        fm = {"type": "knowledge", "created": created.isoformat(),
+              "updated": (created + timedelta(days=rng.randint(0, 300))).isoformat(),
+              "tags": tags.pick()}
+        name = _slug(title, i)
+        if not parts:
+            root_files.append(name)
+        w.write("/".join(["knowledge", *parts, f"{name}.md"]),
+                _frontmatter(fm) + "\n" + _body(rng, title, rng.randint(2, 8)), "knowledge")
+
+    documented = root_files[: len(root_files) // 2]
+    w.write("knowledge/README.md",
+            "# Knowledge\n\n## Root Level\n"
+            + "".join(f"- `{n}.md` - cross-cutting\n" for n in documented)
+            + "\n## Folders\n\nSee subfolders.\n", "index")
+
+    return w.counts
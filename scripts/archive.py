@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Move old finished work out of the live folders into archive/.
+
+Archived:
+  tasks       tasks/completed/*.md, by `completed` date
+  reminders   reminders/completed/*.md, by `completed` date
+  inbox       inbox/**/*.md with status processed, done or archived,
+              by `updated`, else `created`
+
+Notes whose date (file mtime if the frontmatter has none) is older than
+--older-than days are moved. With --mode folders (default) each note keeps
+its file and goes to archive/<kind>/<YYYY-MM>/; with --mode bundles the
+notes of a month are packed into archive/<kind>/<YYYY-MM>.md, one section
+per note headed by its name (`name-2`, `name-3`... when the bundle already
+has that heading), so the archive stays a handful of files.
+Either way archive/index.json records where every note went (see
+setup/hooks/orglib/archive.py); the dashboard's Recently Completed section
+links through it.
+
+The hooks and the dashboard only scan the live folders, so their cost
+follows live work instead of total history.
+
+Usage:
+  python archive.py --dry-run              # list what would move
+  python archive.py                        # archive items older than 90 days
+  python archive.py --older-than 30 --mode bundles
+  python archive.py --kinds tasks,inbox
+"""
+
+import argparse
+import os
+import re
+import sys
+import yaml
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+# Shared helpers ship with the hooks (stdlib only)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'setup' / 'hooks'))
+from orglib import (ArchiveIndex, Doc, FrontmatterReader, Stats, VaultWalker, metrics,  # noqa: E402
+                    write_atomic, yaml_loader)
+from orglib.archive import ARCHIVE_DIR  # noqa: E402
+from orglib.dates import day_ordinal  # noqa: E402
+
+# Ensure UTF-8 output on Windows
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+ORG_DIR = Path(__file__).parent.parent
+
+OLDER_THAN_DAYS = 90
+PROCESSED = {'processed', 'done', 'archived'}
+
+# kind -> (folder, recursive, date fields in order of preference)
+KINDS = {
+    'tasks': ('tasks/completed', False, ('completed', 'updated')),
+    'reminders': ('reminders/completed', False, ('completed', 'updated')),
+    'inbox': ('inbox', True, ('updated', 'created')),
+}
+
+FRONTMATTER = re.compile(r'^---\r?\n(.*?)\r?\n---[ \t]*(?:\r?\n|$)', re.S)
+FENCE = re.compile(r'^\s*(```|~~~)')
+
+
+def archive_day(doc: Doc, fields: tuple[str, ...]) -> date:
+    """The date a note is archived by: first frontmatter field set, else mtime."""
+    for name in fields:
+        ordinal = day_ordinal(getattr(doc, name))
+        if ordinal is not None:
+            return date.fromordinal(ordinal)
+    return datetime.fromtimestamp(doc.mtime).date()
+
+
+def candidates(vault_dir: Path, kinds: list[str], cutoff: date, stats: Stats):
+    """Yield (kind, Doc, day) for every note due for archiving."""
+    walker = VaultWalker(vault_dir)
+    reader = FrontmatterReader()
+    parse = yaml_loader(yaml)
+    for kind in kinds:
+        folder, recursive, fields = KINDS[kind]
+        for rel, path in walker.markdown(folder, recursive=recursive):
+            if rel.endswith('/README.md'):
+                continue
+            stats.files_scanned += 1
+            try:
+                header = reader.read(path)
+                fm = parse(header.text) if header.text else {}
+            except (OSError, UnicodeDecodeError, yaml.YAMLError) as e:
+                print(f'Warning: skipping {rel}: {e}', file=sys.stderr)
+                continue
+            stats.files_parsed += 1
+            doc = Doc.from_frontmatter(-1, rel, fm if isinstance(fm, dict) else {}, header.mtime)
+            if kind == 'inbox' and (doc.status or '').lower() not in PROCESSED:
+                continue
+            day = archive_day(doc, fields)
+            if day < cutoff:
+                yield kind, doc, day
+
+
+def index_entry(doc: Doc, kind: str, path: str, anchor: str | None) -> dict:
+    return {
+        'path': path,
+        'anchor': anchor,
+        'kind': kind,
+        'type': doc.type,
+        'status': doc.status,
+        'title': doc.title or doc.name.replace('-', ' ').title(),
+        'created': doc.created,
+        'completed': doc.completed,
+        'archived': date.today().isoformat(),
+    }
+
+
+def free_path(path: Path) -> Path:
+    """`path`, or `name-2.md`, `name-3.md`... if it is taken."""
+    candidate, n = path, 1
+    while candidate.exists():
+        n += 1
+        candidate = path.with_name(f'{path.stem}-{n}{path.suffix}')
+    return candidate
+
+
+def demote_headings(body: str) -> str:
+    """Push body headings two levels down so each note stays under its `##` heading."""
+    lines, fenced = [], False
+    for line in body.split('\n'):
+        if FENCE.match(line):
+            fenced = not fenced
+        elif not fenced and line.startswith('#'):
+            level = len(line) - len(line.lstrip('#'))
+            if line[level:level + 1] in (' ', ''):
+                line = '#' * min(6, level + 2) + line[level:]
+        lines.append(line)
+    return '\n'.join(lines)
+
+
+def bundle_anchors(index: ArchiveIndex, rel: str, docs: list[Doc]) -> dict[str, str]:
+    """Unique heading in bundle `rel` for each doc: its name, or `name-2`, `name-3`... if taken."""
+    taken = {entry.get('anchor') for entry in index.items.values() if entry.get('path') == rel}
+    anchors = {}
+    for doc in docs:
+        entry = index.items.get(doc.rel, {})
+        if entry.get('path') == rel and entry.get('anchor'):
+            # Packed by an interrupted run: keep the heading it was given
+            anchors[doc.rel] = entry['anchor']
+            continue
+        anchor, n = doc.name, 1
+        while anchor in taken:
+            n += 1
+            anchor = f'{doc.name}-{n}'
+        taken.add(anchor)
+        anchors[doc.rel] = anchor
+    return anchors
+
+
+def bundle_section(doc: Doc, text: str, anchor: str) -> str:
+    match = FRONTMATTER.match(text)
+    frontmatter, body = (match.group(1), text[match.end():]) if match else ('', text)
+    lines = ['', f'## {anchor}', '', f'> Archived from `{doc.rel}` on {date.today().isoformat()}', '']
+    if frontmatter:
+        lines.extend(['```yaml', frontmatter.strip('\n'), '```', ''])
+    body = demote_headings(body.strip('\n'))
+    if body:
+        lines.extend([body, ''])
+    return '\n'.join(lines)
+
+
+def bundle_header(kind: str, month: str) -> str:
+    return '\n'.join([
+        '---',
+        'type: archive',
+        f'kind: {kind}',
+        f'month: {month}',
+        '---',
+        '',
+        f'# Archived {kind} - {month}',
+        '',
+    ])
+
+
+def archive(vault_dir: Path, kinds: list[str], older_than: int = OLDER_THAN_DAYS,
+            mode: str = 'folders', dry_run: bool = False) -> tuple[Stats, list[tuple[str, str]]]:
+    """Archive due notes; returns Stats and (original, archived) path pairs."""
+    vault_dir = Path(vault_dir)
+    stats = Stats('archive')
+    cutoff = date.today() - timedelta(days=older_than)
+    index = ArchiveIndex(vault_dir)
+    moved = []
+
+    with stats.phase('scan'):
+        due = list(candidates(vault_dir, kinds, cutoff, stats))
+
+    with stats.phase('move'):
+        bundles: dict[str, list[Doc]] = {}
+        for kind, doc, day in due:
+            month = day.strftime('%Y-%m')
+            if mode == 'bundles':
+                rel = f'{ARCHIVE_DIR}/{kind}/{month}.md'
+                bundles.setdefault(rel, []).append(doc)
+                continue
+            target = vault_dir / ARCHIVE_DIR / kind / month / f'{doc.name}.md'
+            if not dry_run:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                target = free_path(target)
+                os.replace(vault_dir / doc.rel, target)
+                stats.files_written += 1
+            rel = target.relative_to(vault_dir).as_posix()
+            index.add(doc.rel, index_entry(doc, kind, rel, None))
+            moved.append((doc.rel, rel))
+
+        for rel, docs in bundles.items():
+            kind, month = rel.split('/')[1], Path(rel).stem
+            anchors = bundle_anchors(index, rel, docs)
+            for doc in docs:
+                moved.append((doc.rel, f'{rel}#{anchors[doc.rel]}'))
+            if dry_run:
+                continue
+            path = vault_dir / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            existing = path.read_text(encoding='utf-8') if path.exists() else bundle_header(kind, month)
+            sections = []
+            for doc in docs:
+                # Already packed by an interrupted run: only the original is left to delete
+                if index.items.get(doc.rel, {}).get('path') != rel:
+                    sections.append(bundle_section(doc, (vault_dir / doc.rel).read_text(encoding='utf-8'),
+                                                   anchors[doc.rel]))
+            written = write_atomic(path, [existing.rstrip('\n') + '\n', *sections])
+            stats.count('bytes_written', written)
+            stats.files_written += 1
+            for doc in docs:
+                index.add(doc.rel, index_entry(doc, kind, rel, anchors[doc.rel]))
+            # The index must name the bundle before the originals go away
+            index.save()
+            for doc in docs:
+                os.unlink(vault_dir / doc.rel)
+
+        if moved and not dry_run:
+            index.save()
+    stats.count('items_archived', len(moved))
+    return stats, moved
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Archive old completed tasks, reminders and processed inbox items')
+    parser.add_argument('--vault', type=Path, default=ORG_DIR, help='Vault root (default: this repo)')
+    parser.add_argument('--older-than', type=int, default=OLDER_THAN_DAYS, metavar='DAYS',
+                        help=f'Archive items older than this many days (default: {OLDER_THAN_DAYS})')
+    parser.add_argument('--mode', choices=['folders', 'bundles'], default='folders',
+                        help='One file per note in archive/<kind>/<YYYY-MM>/, or one bundle file per month')
+    parser.add_argument('--kinds', default=','.join(KINDS),
+                        help=f'Comma-separated kinds to archive (default: {",".join(KINDS)})')
+    parser.add_argument('--dry-run', action='store_true', help='List what would be archived')
+    metrics.add_argument(parser)
+    args = parser.parse_args()
+
+    kinds = [k.strip() for k in args.kinds.split(',') if k.strip()]
+    unknown = [k for k in kinds if k not in KINDS]
+    if unknown:
+        parser.error(f"unknown kind(s): {', '.join(unknown)} (choose from {', '.join(KINDS)})")
+
+    stats, moved = archive(args.vault, kinds, args.older_than, args.mode, args.dry_run)
+    for original, target in moved:
+        print(f"  {original} -> {target}")
+    verb = 'Would archive' if args.dry_run else 'Archived'
+    print(f"{verb} {len(moved)} item(s) older than {args.older_than} days")
+    print(f"Stats: {stats.summary()}")
+    metrics.emit(metrics.metrics_path(args.metrics_file), stats, args.vault)
+
+
+if __name__ == '__main__':
+    main()
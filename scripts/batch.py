@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Regenerate many org dirs in one run.
+
+Each vault is processed by a worker from a bounded process pool: the vault
+is parsed once into a VaultIndex shared by the generators, then the
+selected steps run against it. Every vault keeps its own caches on disk
+(.org-manifests/ for the generators, .org-cache/ for the hooks' date
+index), so an unchanged vault costs a scan and no writes.
+
+Steps:
+  tag-pages   generate-tag-pages.py
+  dashboard   generate-publish-dashboard.py
+  dates       refresh the hooks' date index (.org-cache/dates.json), so the
+              next SessionStart in that vault starts warm
+
+Usage:
+  python batch.py ~/orgs/team-a ~/orgs/team-b
+  python batch.py --vaults-file vaults.txt --workers 8
+  python batch.py ~/orgs/* --steps dashboard --report report.json
+  python batch.py ~/orgs/* --metrics-file m.jsonl  # one record per vault and step
+
+A failing vault doesn't stop the others; the combined report lists the
+timings of every vault and the error of each failure, and the exit code
+is 1 if any vault failed. Each vault's index step also counts the
+frontmatter schema violations found while scanning
+(scripts/check-frontmatter.py lists them).
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import traceback
+import yaml
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from publish import load_generator
+
+# Shared helpers ship with the hooks (stdlib only)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "setup" / "hooks"))
+from orglib import DateIndex, Stats, VaultIndex, metrics, yaml_loader  # noqa: E402
+
+# step -> generator script (None: built in)
+STEPS = {
+    "tag-pages": "generate-tag-pages.py",
+    "dashboard": "generate-publish-dashboard.py",
+    "dates": None,
+}
+
+# Generator modules, imported once per worker process
+_generators: dict[str, object] = {}
+
+
+def generator(script_name: str):
+    if script_name not in _generators:
+        _generators[script_name] = load_generator(script_name)
+    return _generators[script_name]
+
+
+def refresh_dates(vault: Path) -> Stats:
+    """Bring the hooks' date index cache up to date."""
+    stats = Stats("dates")
+    with stats.phase("refresh"):
+        index = DateIndex.cached(vault, stats=stats)
+    stats.files_scanned = len(index.entries)
+    return stats
+
+
+def process_vault(vault: str, steps: list[str], metrics_file: str | None, run_id: str) -> dict:
+    """Run `steps` against one vault; returns its report entry (never raises)."""
+    started = time.perf_counter()
+    entry = {"vault": vault, "ok": True, "steps": {}, "error": None}
+    root = Path(vault)
+    try:
+        if not root.is_dir():
+            raise FileNotFoundError(f"not a directory: {vault}")
+        index = None
+        for step in steps:
+            script = STEPS[step]
+            if script is not None and index is None:
+                index = VaultIndex(root, yaml_loader(yaml))
+                entry["steps"]["index"] = {"ms": round(index.stats.total_ms, 1),
+                                           "summary": index.stats.summary(),
+                                           "violations": len(index.violations)}
+                metrics.emit(metrics_file, index.stats, root, run_id)
+            step_started = time.perf_counter()
+            if script is None:
+                stats = refresh_dates(root)
+            else:
+                stats = generator(script).run(root, index)
+            entry["steps"][step] = {"ms": round((time.perf_counter() - step_started) * 1000, 1),
+                                    "summary": stats.summary()}
+            metrics.emit(metrics_file, stats, root, run_id)
+    except Exception as e:
+        entry["ok"] = False
+        entry["error"] = f"{type(e).__name__}: {e}"
+        entry["traceback"] = traceback.format_exc()
+    entry["ms"] = round((time.perf_counter() - started) * 1000, 1)
+    return entry
+
+
+def read_vaults(paths: list[str], vaults_file: Path | None) -> list[str]:
+    """Vault roots from the command line and a file (one per line, # comments)."""
+    vaults = list(paths)
+    if vaults_file is not None:
+        for line in vaults_file.read_text(encoding="utf-8").splitlines():
+            line = line.strip()
+            if line and not line.startswith("#"):
+                vaults.append(line)
+    # Same vault twice would race on its own caches
+    seen = {}
+    for v in vaults:
+        seen.setdefault(os.path.realpath(os.path.expanduser(v)), None)
+    return list(seen)
+
+
+def print_report(results: list[dict], steps: list[str], wall_ms: float, workers: int) -> None:
+    failed = [r for r in results if not r["ok"]]
+    print(f"{len(results)} vault(s), {len(failed)} failed, {wall_ms / 1000:.1f}s with {workers} worker(s)")
+    print("")
+    columns = ["index", *steps]
+    print(f"{'vault':<40} {'total':>8} " + " ".join(f"{c:>10}" for c in columns))
+    for r in sorted(results, key=lambda r: -r["ms"]):
+        cells = []
+        for c in columns:
+            step = r["steps"].get(c)
+            cells.append(f"{step['ms']:>8.0f}ms" if step else f"{'-':>10}")
+        status = "" if r["ok"] else "  FAILED"
+        print(f"{r['vault'][-40:]:<40} {r['ms']:>6.0f}ms " + " ".join(cells) + status)
+    if failed:
+        print("")
+        print("Failures:")
+        for r in failed:
+            print(f"  {r['vault']}: {r['error']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the generators across many org dirs")
+    parser.add_argument("vaults", nargs="*", help="Vault roots")
+    parser.add_argument("--vaults-file", type=Path, help="File with one vault root per line")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Vaults processed at once (default: CPU count)")
+    parser.add_argument("--steps", default=",".join(STEPS),
+                        help=f"Comma-separated steps to run (default: {','.join(STEPS)})")
+    parser.add_argument("--report", type=Path, help="Write the combined report as JSON")
+    metrics.add_argument(parser)
+    args = parser.parse_args()
+
+    steps = [s.strip() for s in args.steps.split(",") if s.strip()]
+    unknown = [s for s in steps if s not in STEPS]
+    if unknown:
+        parser.error(f"unknown step(s): {', '.join(unknown)} (choose from {', '.join(STEPS)})")
+    vaults = read_vaults(args.vaults, args.vaults_file)
+    if not vaults:
+        parser.error("no vaults given")
+
+    workers = max(1, min(args.workers, len(vaults)))
+    metrics_file = metrics.metrics_path(args.metrics_file)
+    run_id = metrics.new_run_id()
+    started = time.perf_counter()
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(process_vault, v, steps, metrics_file, run_id) for v in vaults]
+        for future in as_completed(futures):
+            results.append(future.result())
+    wall_ms = (time.perf_counter() - started) * 1000
+
+    print_report(results, steps, wall_ms, workers)
+    if args.report:
+        args.report.write_text(json.dumps({
+            "run_id": run_id, "wall_ms": round(wall_ms, 1), "workers": workers, "steps": steps,
+            "vaults": sorted(results, key=lambda r: r["vault"]),
+        }, indent=1), encoding="utf-8")
+    sys.exit(1 if any(not r["ok"] for r in results) else 0)
+
+
+if __name__ == "__main__":
+    main()
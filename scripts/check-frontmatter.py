@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Check every note's frontmatter against the per-type schemas.
+
+Tasks, reminders, inbox items, knowledge notes and projects have a schema
+each (setup/hooks/orglib/schema.py): which keys are required, which hold
+dates, date-times, lists or one of a fixed set of values. The generators
+and hooks already normalize frontmatter through these schemas as they
+scan, and skip what doesn't fit; this script lists it all at once so it
+can be fixed at the source.
+
+Usage:
+  python scripts/check-frontmatter.py                  # this vault
+  python scripts/check-frontmatter.py --vault ~/org
+  python scripts/check-frontmatter.py --limit 0        # counts only
+
+Exits with status 1 if any note has a problem or can't be parsed.
+"""
+
+import argparse
+import sys
+import yaml
+from pathlib import Path
+
+# Shared helpers ship with the hooks (stdlib only)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "setup" / "hooks"))
+from orglib import VaultIndex, metrics, yaml_loader  # noqa: E402
+from orglib.vault import DEFAULT_EXCLUDED_DIRS  # noqa: E402
+from orglib.schema import report  # noqa: E402
+
+VAULT_ROOT = Path(__file__).parent.parent
+
+# Templates hold {{date}} placeholders, not frontmatter to check
+EXCLUDED_DIRS = DEFAULT_EXCLUDED_DIRS | {"templates"}
+
+# Problems listed one per line after the counts
+LIMIT = 50
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check frontmatter against the note type schemas")
+    parser.add_argument("--vault", type=Path, default=VAULT_ROOT, help="Vault root (default: this repo)")
+    parser.add_argument("--limit", type=int, default=LIMIT,
+                        help=f"List at most N problems after the counts (default: {LIMIT}, 0 = counts only)")
+    metrics.add_argument(parser)
+    args = parser.parse_args()
+
+    index = VaultIndex(args.vault, yaml_loader(yaml), EXCLUDED_DIRS)
+    print(f"Checked {len(index)} notes in {args.vault}")
+
+    if index.errors:
+        print(f"\n{len(index.errors)} note(s) could not be parsed:")
+        for rel, message in sorted(index.errors.items())[:args.limit]:
+            print(f"  {rel}: {message.splitlines()[0]}")
+    lines = report(index.violations, args.limit)
+    if lines:
+        print()
+        print("\n".join(lines))
+    if not index.errors and not index.violations:
+        print("No problems found.")
+
+    metrics.emit(metrics.metrics_path(args.metrics_file), index.stats, args.vault)
+    sys.exit(1 if index.errors or index.violations else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,12 +4,45 @@ Generate static dashboard for Obsidian Publish.
 Replicates Dataview queries as plain markdown.
 
 Run before publishing to update dashboard.
+Pass --vault PATH to target another vault and --metrics-file PATH to append
+a JSON-lines metrics record.
+
+The dashboard is streamed section by section into a temp file that replaces
+publish-dashboard.md when complete. The inbox lists the newest
+--inbox-page-size items; older ones go to publish-dashboard/inbox-N.md.
+
+Date-based sections (Recent Knowledge, Completed This Week, Stale
+Knowledge, Activity) are range queries on an orglib DateIndex built once
+from the vault index, not sorts of the notes.
+
+The Velocity section (tasks completed per week, task-days active and
+blocked, inbox captured, cycle time and inbox age) comes from task
+timelines derived from frontmatter dates. Pass --event-log once to start
+.org-cache/events.jsonl; while it exists every run appends the task
+status changes it sees, which makes the active/blocked figures exact.
+
+Active Projects comes from an orglib ProjectIndex over the project
+READMEs, with open tasks by status and last activity rolled up from the
+tasks that name the project (the same index SessionStart reads).
+
+Recently Completed also lists tasks moved out by scripts/archive.py,
+linked through archive/index.json rather than by scanning archive/.
+
+Importable API (used by publish.py to run in-process):
+    stats = run(vault_dir, index=None, inbox_page_size=50, stale_days=90, event_log=None)
 """
 
+import argparse
 import sys
 import yaml
 from pathlib import Path
-from datetime import datetime
+from datetime import date, datetime, timedelta
+from typing import Iterator
+
+# Shared helpers ship with the hooks (stdlib only)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'setup' / 'hooks'))
+from orglib import (ArchiveIndex, DateIndex, Doc, EventLog, OutputManifest, ProjectIndex, Stats, VaultIndex,  # noqa: E402
+                    Velocity, metrics, sparkline, yaml_loader)
 
 # Ensure UTF-8 output on Windows
 if sys.platform == 'win32':
@@ -17,31 +50,40 @@ if sys.platform == 'win32':
 
 ORG_DIR = Path(__file__).parent.parent
 
+# Inbox items listed on the dashboard; the rest go to linked overflow pages
+INBOX_PAGE_SIZE = 50
+OVERFLOW_DIR = 'publish-dashboard'
+
+# Knowledge not updated for this many days is listed as stale
+STALE_DAYS = 90
+STALE_LIMIT = 10
+# Weeks shown in the activity table and the velocity sparklines
+ACTIVITY_WEEKS = 8
+VELOCITY_WEEKS = 12
+
+
+def get_docs(index: VaultIndex, folder: str) -> list[Doc]:
+    """Docs directly inside a vault folder, warning about unparseable ones."""
+    docs = index.folder(folder)
+    for doc in docs:
+        if doc.rel in index.errors:
+            print(f"Warning: Could not parse {index.path(doc)}: {index.errors[doc.rel]}", file=sys.stderr)
+    return docs
+
+
+def display_title(doc: Doc) -> str:
+    """Frontmatter title, or one derived from the filename."""
+    return doc.title or doc.name.replace('-', ' ').title()
+
 
-def parse_frontmatter(filepath: Path) -> dict:
-    """Extract YAML frontmatter from markdown file."""
-    try:
-        content = filepath.read_text(encoding='utf-8')
-        if content.startswith('---'):
-            parts = content.split('---', 2)
-            if len(parts) >= 3:
-                return yaml.safe_load(parts[1]) or {}
-    except Exception as e:
-        print(f"Warning: Could not parse {filepath}: {e}", file=sys.stderr)
-    return {}
-
-
-def get_files_with_frontmatter(folder: Path) -> list:
-    """Get all markdown files with their frontmatter."""
-    files = []
-    if folder.exists():
-        for f in folder.glob('*.md'):
-            fm = parse_frontmatter(f)
-            fm['_file'] = f
-            fm['_name'] = f.stem
-            fm['_mtime'] = datetime.fromtimestamp(f.stat().st_mtime)
-            files.append(fm)
-    return files
+def parse_day(value: str | None, fallback: datetime) -> datetime:
+    """Date from the first 10 chars of a frontmatter date, or `fallback`."""
+    if value:
+        try:
+            return datetime.strptime(value[:10], '%Y-%m-%d')
+        except ValueError:
+            pass
+    return fallback
 
 
 def format_date(d) -> str:
@@ -66,187 +108,409 @@ def format_link(name: str, folder: str, title: str = None, in_table: bool = Fals
     return f'[[{folder}/{name}]]'
 
 
-def generate_dashboard() -> str:
-    """Generate the full dashboard content."""
-    lines = [
+def inbox_items(index: VaultIndex) -> list[Doc]:
+    """Unprocessed inbox items, newest first."""
+    inbox = get_docs(index, 'inbox')
+    inbox.sort(key=lambda i: (i.created or '')[:10], reverse=True)
+    return inbox
+
+
+def page_count(total: int, page_size: int) -> int:
+    """Pages needed for `total` items (at least one; page_size 0 = no limit)."""
+    if page_size <= 0 or total <= page_size:
+        return 1
+    return -(-total // page_size)
+
+
+def overflow_link(page: int, label: str) -> str:
+    return f'[[{OVERFLOW_DIR}/inbox-{page}|{label}]]'
+
+
+def week_start(day: date) -> date:
+    """Monday of the week containing `day`."""
+    return day - timedelta(days=day.weekday())
+
+
+def task_docs(index: VaultIndex) -> list[Doc]:
+    """Tasks in tasks/ and tasks/completed/."""
+    return get_docs(index, 'tasks') + get_docs(index, 'tasks/completed')
+
+
+def build_velocity(index: VaultIndex, inbox: list[Doc], events: dict | None = None) -> Velocity:
+    """Weekly velocity buckets for the last VELOCITY_WEEKS weeks."""
+    today = date.today()
+    start = week_start(today) - timedelta(weeks=VELOCITY_WEEKS - 1)
+    return Velocity.build(task_docs(index), inbox, start, VELOCITY_WEEKS, events, today)
+
+
+def render_dashboard(index: VaultIndex, inbox: list[Doc], page_size: int = INBOX_PAGE_SIZE,
+                     dates: DateIndex | None = None, stale_days: int = STALE_DAYS,
+                     velocity: Velocity | None = None, archive: ArchiveIndex | None = None,
+                     projects: ProjectIndex | None = None) -> Iterator[str]:
+    """Yield the dashboard one section at a time.
+
+    Only the first `page_size` inbox items are listed here; the rest go to
+    overflow pages (see render_inbox_page) linked from the Inbox section.
+    """
+    if dates is None:
+        dates = DateIndex.from_docs(index.docs)
+    if projects is None:
+        projects = ProjectIndex.from_docs(index.docs)
+    if velocity is None:
+        velocity = build_velocity(index, inbox)
+    today = date.today()
+    this_week = week_start(today)
+
+    yield '\n'.join([
         '---',
         'type: dashboard',
         f'generated: {datetime.now().strftime("%Y-%m-%d %H:%M")}',
+        'publish: true',
         '---',
         '',
         '# Dashboard',
         '',
         '> *Auto-generated for Obsidian Publish. Updates when `generate-publish-dashboard.py` runs.*',
         '',
-    ]
+    ]) + '\n'
 
     # === Active Tasks ===
-    tasks = get_files_with_frontmatter(ORG_DIR / 'tasks')
-    completed_folder_tasks = get_files_with_frontmatter(ORG_DIR / 'tasks' / 'completed')
-    all_tasks = tasks + completed_folder_tasks
-    active_tasks = [t for t in tasks if t.get('status') == 'active']
-    active_tasks.sort(key=lambda t: t['_mtime'], reverse=True)
+    tasks = get_docs(index, 'tasks')
+    completed_folder_tasks = get_docs(index, 'tasks/completed')
+    active_tasks = [t for t in tasks if t.status == 'active']
+    active_tasks.sort(key=lambda t: t.mtime, reverse=True)
 
-    lines.extend([
+    lines = [
         '## Active Tasks',
         '',
         '| Task | Status | Updated |',
         '|------|--------|---------|',
-    ])
+    ]
     for t in active_tasks:
-        title = t.get('title') or t['_name'].replace('-', ' ').title()
-        link = format_link(t['_name'], 'tasks', title, in_table=True)
-        status = t.get('status', '-')
-        updated = format_date(t['_mtime'])
+        link = format_link(t.name, 'tasks', display_title(t), in_table=True)
+        status = t.status or '-'
+        updated = format_date(datetime.fromtimestamp(t.mtime))
         lines.append(f'| {link} | {status} | {updated} |')
     if not active_tasks:
         lines.append('| *No active tasks* | - | - |')
     lines.append('')
+    yield '\n'.join(lines) + '\n'
 
     # === Blocked Tasks ===
-    blocked_tasks = [t for t in tasks if t.get('status') == 'blocked']
+    blocked_tasks = [t for t in tasks if t.status == 'blocked']
 
-    lines.extend([
+    lines = [
         '## Blocked Tasks',
         '',
         '| Task | Blocked By |',
         '|------|------------|',
-    ])
+    ]
     for t in blocked_tasks:
-        title = t.get('title') or t['_name'].replace('-', ' ').title()
-        link = format_link(t['_name'], 'tasks', title, in_table=True)
-        blocked_by = ', '.join(t.get('blocked-by', [])) or '-'
+        link = format_link(t.name, 'tasks', display_title(t), in_table=True)
+        blocked_by = ', '.join(t.blocked_by) or '-'
         lines.append(f'| {link} | {blocked_by} |')
     if not blocked_tasks:
         lines.append('| *No blocked tasks* | - |')
     lines.append('')
+    yield '\n'.join(lines) + '\n'
+
+    # === Active Projects (project index, with task rollups) ===
+    rollups = projects.rollups()
+    active_projects = projects.with_status('active')
+    active_projects.sort(key=lambda p: (-(rollups[p.name].last or 0), p.name))
 
-    # === Active Projects ===
-    projects = []
-    projects_dir = ORG_DIR / 'projects'
-    if projects_dir.exists():
-        for pdir in projects_dir.iterdir():
-            if pdir.is_dir():
-                readme = pdir / 'README.md'
-                if readme.exists():
-                    fm = parse_frontmatter(readme)
-                    fm['_name'] = pdir.name
-                    fm['_file'] = readme
-                    projects.append(fm)
-
-    active_projects = [p for p in projects if p.get('status') == 'active']
-
-    lines.extend([
+    lines = [
         '## Active Projects',
         '',
-        '| Project | Status | Tags |',
-        '|---------|--------|------|',
-    ])
+        '| Project | Status | Open Tasks | Last Activity | Tags |',
+        '|---------|--------|------------|---------------|------|',
+    ]
     for p in active_projects:
-        title = p.get('title') or p['_name'].replace('-', ' ').title()
-        link = f'[[projects/{p["_name"]}/README\\|{title}]]'
-        status = p.get('status', '-')
-        tags = ', '.join(p.get('tags', [])) or '-'
-        lines.append(f'| {link} | {status} | {tags} |')
+        rollup = rollups[p.name]
+        link = f'[[projects/{p.name}/README\\|{p.title}]]'
+        status = p.status or '-'
+        open_tasks = f'{rollup.open_total} ({rollup.summary()})' if rollup.open else '-'
+        last = format_date(date.fromordinal(rollup.last)) if rollup.last else '-'
+        tags = ', '.join(p.tags) or '-'
+        lines.append(f'| {link} | {status} | {open_tasks} | {last} | {tags} |')
     if not active_projects:
-        lines.append('| *No active projects* | - | - |')
+        lines.append('| *No active projects* | - | - | - | - |')
     lines.append('')
+    yield '\n'.join(lines) + '\n'
 
     # === Recent Knowledge ===
-    knowledge = get_files_with_frontmatter(ORG_DIR / 'knowledge')
-    for k in knowledge:
-        updated = k.get('updated')
-        if updated:
-            try:
-                k['_sort_date'] = datetime.strptime(str(updated)[:10], '%Y-%m-%d')
-            except:
-                k['_sort_date'] = k['_mtime']
-        else:
-            k['_sort_date'] = k['_mtime']
-    knowledge.sort(key=lambda k: k['_sort_date'], reverse=True)
+    in_knowledge = {k.rel for k in get_docs(index, 'knowledge')}
+    recent = dates.newest('touched', 10, where=lambda rel, _: rel in in_knowledge)
 
-    lines.extend([
+    lines = [
         '## Recent Knowledge',
         '',
         '| Topic | Updated | Tags |',
         '|-------|---------|------|',
-    ])
-    for k in knowledge[:10]:
-        title = k.get('title') or k['_name'].replace('-', ' ').title()
-        link = format_link(k['_name'], 'knowledge', title, in_table=True)
-        updated = format_date(k.get('updated') or k['_mtime'])
-        tags = ', '.join(k.get('tags', [])) or '-'
+    ]
+    for _, rel in recent:
+        k = index.get(rel)
+        link = format_link(k.name, 'knowledge', display_title(k), in_table=True)
+        updated = format_date(k.updated or datetime.fromtimestamp(k.mtime))
+        tags = ', '.join(k.tags) or '-'
         lines.append(f'| {link} | {updated} | {tags} |')
     lines.append('')
+    yield '\n'.join(lines) + '\n'
 
     # === Inbox ===
-    inbox = get_files_with_frontmatter(ORG_DIR / 'inbox')
-    for i in inbox:
-        created = i.get('created')
-        if created:
-            i['_sort_created'] = str(created)[:10]
-        else:
-            i['_sort_created'] = ''
-    inbox.sort(key=lambda i: i['_sort_created'], reverse=True)
-
-    lines.extend([
+    lines = [
         '## Inbox (Unprocessed)',
         '',
-    ])
+    ]
+    pages = page_count(len(inbox), page_size)
+    first_page = inbox[:page_size] if pages > 1 else inbox
     if inbox:
-        for i in inbox:
-            title = i.get('title') or i['_name'].replace('-', ' ').title()
-            link = format_link(i['_name'], 'inbox', title)
+        for i in first_page:
+            link = format_link(i.name, 'inbox', display_title(i))
             lines.append(f'- {link}')
+        if pages > 1:
+            lines.append('')
+            lines.append(f'*Showing {len(first_page)} of {len(inbox)} items - '
+                         f'{overflow_link(2, "next page")} ({pages} pages)*')
     else:
         lines.append('*Inbox empty*')
     lines.append('')
+    yield '\n'.join(lines) + '\n'
 
     # === Recently Completed ===
-    completed_tasks = [t for t in all_tasks if t.get('status') == 'complete']
-    for t in completed_tasks:
-        comp = t.get('completed')
-        if comp:
-            try:
-                t['_comp_date'] = datetime.strptime(str(comp)[:10], '%Y-%m-%d')
-            except:
-                t['_comp_date'] = datetime.min
-        else:
-            t['_comp_date'] = datetime.min
-    completed_tasks.sort(key=lambda t: t['_comp_date'], reverse=True)
+    # (completed date, link) for live tasks and archived ones
+    completed_tasks = [(t.completed, format_link(t.name, t.folder, display_title(t), in_table=True))
+                       for t in tasks + completed_folder_tasks if t.status == 'complete']
+    if archive is not None:
+        completed_tasks.extend(
+            (entry.get('completed'), f"[[{ArchiveIndex.link_target(entry)}\\|{entry['title']}]]")
+            for _, entry in archive.entries('tasks') if entry.get('status') == 'complete')
+    completed_tasks.sort(key=lambda c: parse_day(c[0], datetime.min), reverse=True)
 
-    lines.extend([
+    lines = [
         '## Recently Completed',
         '',
         '| Task | Completed |',
         '|------|-----------|',
-    ])
-    for t in completed_tasks[:5]:
-        title = t.get('title') or t['_name'].replace('-', ' ').title()
-        if 'completed' in str(t['_file'].parent):
-            link = format_link(t['_name'], 'tasks/completed', title, in_table=True)
-        else:
-            link = format_link(t['_name'], 'tasks', title, in_table=True)
-        completed = format_date(t.get('completed'))
-        lines.append(f'| {link} | {completed} |')
+    ]
+    for completed, link in completed_tasks[:5]:
+        lines.append(f'| {link} | {format_date(completed)} |')
     if not completed_tasks:
         lines.append('| *No completed tasks* | - |')
     lines.append('')
+    yield '\n'.join(lines) + '\n'
+
+    # === Completed This Week ===
+    done = list(dates.between('completed', this_week, today + timedelta(days=1),
+                              where=lambda _, entry: entry[0] == 'task'))
+
+    lines = [
+        '## Completed This Week',
+        '',
+        '| Task | Completed |',
+        '|------|-----------|',
+    ]
+    for _, rel in reversed(done):
+        t = index.get(rel)
+        link = format_link(t.name, t.folder, display_title(t), in_table=True)
+        lines.append(f'| {link} | {format_date(t.completed)} |')
+    if not done:
+        lines.append('| *Nothing completed since Monday* | - |')
+    lines.append('')
+    yield '\n'.join(lines) + '\n'
+
+    # === Velocity ===
+    lines = [
+        f'## Velocity (last {velocity.weeks} weeks)',
+        '',
+        '| Metric | Trend | This week | Avg / week |',
+        '|--------|-------|-----------|------------|',
+    ]
+    for label, values in velocity.rows():
+        lines.append(f'| {label} | {sparkline(values)} | {values[-1]} | {sum(values) / len(values):.1f} |')
+    lines.append('')
+    cycle = velocity.median_cycle()
+    if cycle is not None:
+        lines.append(f'**Cycle time:** median {cycle:g} days from created to completed '
+                     f'({len(velocity.cycle_days)} tasks)')
+        lines.append('')
+    age = velocity.median_inbox_age()
+    if age is not None:
+        lines.append(f'**Inbox age:** {len(velocity.inbox_ages)} items, median {age:g} days, '
+                     f'oldest {max(velocity.inbox_ages)} days')
+        lines.append('')
+    yield '\n'.join(lines) + '\n'
+
+    # === Stale Knowledge ===
+    cutoff = today - timedelta(days=stale_days)
+    stale = list(dates.between('touched', end=cutoff, where=lambda rel, entry: (
+        rel.startswith('knowledge/') and entry[0] == 'knowledge')))
+
+    lines = [
+        f'## Stale Knowledge (not updated in {stale_days} days)',
+        '',
+        '| Topic | Updated |',
+        '|-------|---------|',
+    ]
+    for ordinal, rel in stale[:STALE_LIMIT]:
+        k = index.get(rel)
+        link = format_link(k.name, k.folder, display_title(k), in_table=True)
+        lines.append(f'| {link} | {date.fromordinal(ordinal).isoformat()} |')
+    if len(stale) > STALE_LIMIT:
+        lines.append(f'| *+{len(stale) - STALE_LIMIT} more* | - |')
+    if not stale:
+        lines.append('| *No stale knowledge* | - |')
+    lines.append('')
+    yield '\n'.join(lines) + '\n'
+
+    # === Activity ===
+    first_week = this_week - timedelta(weeks=ACTIVITY_WEEKS - 1)
+    created = dates.histogram('created', first_week, ACTIVITY_WEEKS)
+    updated = dates.histogram('updated', first_week, ACTIVITY_WEEKS)
+    completed = dates.histogram('completed', first_week, ACTIVITY_WEEKS)
+
+    lines = [
+        '## Activity',
+        '',
+        '| Week of | Created | Updated | Completed |',
+        '|---------|---------|---------|-----------|',
+    ]
+    for week in range(ACTIVITY_WEEKS - 1, -1, -1):
+        start = first_week + timedelta(weeks=week)
+        lines.append(f'| {start.isoformat()} | {created[week]} | {updated[week]} | {completed[week]} |')
+    lines.append('')
+    yield '\n'.join(lines) + '\n'
 
     # === Footer ===
-    lines.extend([
+    yield '\n'.join([
         '---',
         f'*Last generated: {datetime.now().strftime("%Y-%m-%d %H:%M")}*',
     ])
 
+
+def render_inbox_page(inbox: list[Doc], page: int, pages: int, page_size: int) -> str:
+    """One inbox overflow page (page 1 is the dashboard itself).
+
+    No timestamp, so a page is only rewritten when its items change.
+    """
+    nav = ['[[publish-dashboard|Dashboard]]']
+    nav.append(overflow_link(page - 1, 'previous') if page > 2 else '[[publish-dashboard|previous]]')
+    if page < pages:
+        nav.append(overflow_link(page + 1, 'next'))
+    lines = [
+        '---',
+        'type: dashboard',
+        'publish: true',
+        '---',
+        '',
+        f'# Inbox (page {page} of {pages})',
+        '',
+        ' - '.join(nav),
+        '',
+    ]
+    for i in inbox[(page - 1) * page_size:page * page_size]:
+        lines.append(f"- {format_link(i.name, 'inbox', display_title(i))}")
+    lines.append('')
     return '\n'.join(lines)
 
 
+def write_inbox_pages(manifest: OutputManifest, inbox: list[Doc], page_size: int, stats: Stats) -> list[str]:
+    """Write changed overflow pages and remove ones the inbox no longer fills.
+
+    Returns the vault-relative paths of the current overflow pages.
+    """
+    pages = page_count(len(inbox), page_size)
+    overflow_dir = manifest.root / OVERFLOW_DIR
+    if pages > 1:
+        overflow_dir.mkdir(exist_ok=True)
+    current = []
+    for page in range(2, pages + 1):
+        rel = f'{OVERFLOW_DIR}/inbox-{page}.md'
+        current.append(rel)
+        written = manifest.write_text(rel, render_inbox_page(inbox, page, pages, page_size))
+        if written is None:
+            stats.count('files_unchanged')
+            continue
+        stats.count('bytes_written', written)
+        stats.files_written += 1
+    if overflow_dir.is_dir():
+        for path in overflow_dir.glob('inbox-*.md'):
+            number = path.stem.rpartition('-')[2]
+            if not number.isdigit() or not 2 <= int(number) <= pages:
+                manifest.remove(f'{OVERFLOW_DIR}/{path.name}')
+                stats.count('files_removed')
+        if pages == 1 and not any(overflow_dir.iterdir()):
+            overflow_dir.rmdir()
+    return current
+
+
+def run(vault_dir: Path, index: VaultIndex | None = None, inbox_page_size: int = INBOX_PAGE_SIZE,
+        stale_days: int = STALE_DAYS, event_log: bool | None = None) -> Stats:
+    """Regenerate publish-dashboard.md (and inbox overflow pages) for a vault.
+
+    Pass a shared `index` to reuse an already-parsed vault. Files whose
+    content (ignoring timestamps) matches .org-manifests/dashboard.json are
+    left untouched. Task status changes are appended to the event log when
+    `event_log` is true, or when it is None and the log already exists.
+    """
+    vault_dir = Path(vault_dir)
+    stats = Stats('dashboard')
+
+    if index is None:
+        index = VaultIndex(vault_dir, yaml_loader(yaml))
+        stats.absorb(index.stats)
+    else:
+        # Shared index: the read/parse cost is reported by its owner
+        stats.files_scanned = index.stats.files_scanned
+        stats.files_parsed = index.stats.files_parsed
+
+    manifest = OutputManifest(vault_dir, 'dashboard')
+    with stats.phase('dates'):
+        dates = DateIndex.from_docs(index.docs)
+    with stats.phase('projects'):
+        projects = ProjectIndex.from_docs(index.docs)
+    inbox = inbox_items(index)
+    with stats.phase('timeline'):
+        log = EventLog(vault_dir)
+        events = None
+        if event_log or (event_log is None and log.exists()):
+            events = log.read()
+            stats.count('events_logged', log.record(task_docs(index), known=events))
+        velocity = build_velocity(index, inbox, events)
+    with stats.phase('render'):
+        # Sections are written as they are rendered
+        written = manifest.write_chunks('publish-dashboard.md',
+                                        render_dashboard(index, inbox, inbox_page_size, dates, stale_days,
+                                                         velocity, ArchiveIndex(vault_dir), projects))
+        if written is None:
+            stats.count('files_unchanged')
+        else:
+            stats.files_written += 1
+            stats.count('bytes_written', written)
+    with stats.phase('overflow'):
+        pages = write_inbox_pages(manifest, inbox, inbox_page_size, stats)
+    manifest.prune(['publish-dashboard.md', *pages])
+    manifest.save()
+    return stats
+
+
 def main():
-    dashboard_content = generate_dashboard()
-    output_path = ORG_DIR / 'publish-dashboard.md'
-    output_path.write_text(dashboard_content, encoding='utf-8')
-    print(f"Generated: {output_path}")
+    parser = argparse.ArgumentParser(description='Generate static publish dashboard')
+    parser.add_argument('--vault', type=Path, default=ORG_DIR, help='Vault root (default: this repo)')
+    parser.add_argument('--inbox-page-size', type=int, default=INBOX_PAGE_SIZE,
+                        help=f'Inbox items on the dashboard before overflow pages (default: {INBOX_PAGE_SIZE}, 0 = all)')
+    parser.add_argument('--stale-days', type=int, default=STALE_DAYS,
+                        help=f'List knowledge not updated in this many days as stale (default: {STALE_DAYS})')
+    parser.add_argument('--event-log', action='store_true',
+                        help='Record task status changes in .org-cache/events.jsonl (kept on once it exists)')
+    metrics.add_argument(parser)
+    args = parser.parse_args()
+
+    stats = run(args.vault, inbox_page_size=args.inbox_page_size, stale_days=args.stale_days,
+                event_log=args.event_log or None)
+    print(f"Generated: {args.vault / 'publish-dashboard.md'}")
+    print(f"Stats: {stats.summary()}")
+    metrics.emit(metrics.metrics_path(args.metrics_file), stats, args.vault)
 
 
 if __name__ == '__main__':
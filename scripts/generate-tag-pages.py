@@ -6,110 +6,137 @@ Follows the Single-Source pattern: frontmatter tags are the source of truth,
 tag pages are derived/computed state for graph connectivity on Publish.
 
 Run before publishing: python scripts/generate-tag-pages.py
+    --vault PATH          Vault root (default: the vault this script lives in)
+    --quiet               Only print the summary
+    --shard-threshold N   Shard tags with more than N docs (default 500, 0 = never)
+    --metrics-file PATH   Append a JSON-lines metrics record
+
+Big tags are sharded: tags/<tag>.md becomes an index with per-shard counts
+and the notes move to tags/<tag>/<type>.md, or tags/<tag>/<type>-<letter>.md
+when one type alone is over the threshold. Only shards whose notes changed
+are rewritten: content hashes of every page (minus the date fields) are kept
+in .org-manifests/tag-pages.json, so unchanged pages cost one stat.
+
+Importable API (used by publish.py to run in-process):
+    stats = run(vault_dir, index=None, shard_threshold=500)
 """
 
-import os
-import re
+import argparse
+import sys
 import yaml
 from pathlib import Path
 from collections import defaultdict
 from datetime import date
+from typing import Callable
+
+# Shared helpers ship with the hooks (stdlib only)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "setup" / "hooks"))
+from orglib import Doc, OutputManifest, Stats, VaultIndex, metrics, yaml_loader  # noqa: E402
 
 # Configuration
 VAULT_ROOT = Path(__file__).parent.parent
-TAGS_DIR = VAULT_ROOT / "tags"
-EXCLUDED_DIRS = {".obsidian", "node_modules", ".git", "tags", "setup"}
-
+# Skipped on top of .orgignore (which already covers hidden folders and node_modules)
+EXCLUDED_DIRS = frozenset({"tags", "setup"})
+SKIPPED_FILES = ("CLAUDE.md", "README.md", "ONBOARDING.md", "QUICKSTART.md", "CONTRIBUTING.md")
 
-def extract_frontmatter(filepath: Path) -> dict:
-    """Extract YAML frontmatter from a markdown file."""
-    try:
-        content = filepath.read_text(encoding="utf-8")
-        if not content.startswith("---"):
-            return {}
+# Section order and headings on tag pages
+TYPE_ORDER = ["knowledge", "project", "task", "inbox", "unknown"]
+TYPE_LABELS = {
+    "knowledge": "Knowledge",
+    "project": "Projects",
+    "task": "Tasks",
+    "inbox": "Inbox",
+    "unknown": "Other",
+}
 
-        end_match = re.search(r"\n---\s*\n", content[3:])
-        if not end_match:
-            return {}
+# Tags with more docs than this get an index page plus shard pages
+SHARD_THRESHOLD = 500
 
-        yaml_content = content[3:end_match.start() + 3]
-        return yaml.safe_load(yaml_content) or {}
-    except Exception:
-        return {}
 
+def normalize_tags(doc: Doc) -> list[str]:
+    """Tag page names for a doc: remove # prefix if present, lowercase.
 
-def get_tags_from_frontmatter(frontmatter: dict) -> list[str]:
-    """Extract tags from frontmatter, handling various formats."""
-    tags = frontmatter.get("tags", [])
+    Doc.tags already handles list, comma- and space-separated formats.
+    """
+    tags = (sys.intern(t.lstrip("#").lower()) for t in doc.tags)
+    return list(dict.fromkeys(t for t in tags if t))
 
-    if isinstance(tags, str):
-        # Handle comma-separated or space-separated
-        tags = [t.strip() for t in re.split(r"[,\s]+", tags) if t.strip()]
-    elif isinstance(tags, list):
-        tags = [str(t).strip() for t in tags if t]
-    else:
-        tags = []
 
-    # Normalize: remove # prefix if present, lowercase
-    return [t.lstrip("#").lower() for t in tags if t]
+def build_index(vault_root: Path) -> VaultIndex:
+    """Parse every note in the vault once."""
+    return VaultIndex(vault_root, yaml_loader(yaml), EXCLUDED_DIRS)
 
 
-def scan_vault() -> dict[str, list[dict]]:
-    """Scan vault and build tag -> documents mapping."""
+def scan_vault(index: VaultIndex) -> dict[str, list[int]]:
+    """Build tag -> doc ids mapping from a parsed vault."""
     tag_docs = defaultdict(list)
 
-    for root, dirs, files in os.walk(VAULT_ROOT):
-        # Skip excluded directories
-        dirs[:] = [d for d in dirs if d not in EXCLUDED_DIRS]
-
-        for filename in files:
-            if not filename.endswith(".md"):
-                continue
+    for doc in index.docs:
+        # Skip certain files, and anything the index was built to include
+        # beyond what tag pages cover
+        if doc.rel.rpartition("/")[2] in SKIPPED_FILES:
+            continue
+        if any(part in EXCLUDED_DIRS for part in doc.rel.split("/")[:-1]):
+            continue
 
-            filepath = Path(root) / filename
-            rel_path = filepath.relative_to(VAULT_ROOT)
+        for tag in normalize_tags(doc):
+            tag_docs[tag].append(doc.id)
 
-            # Skip certain files
-            if rel_path.name in ("CLAUDE.md", "README.md", "ONBOARDING.md", "QUICKSTART.md", "CONTRIBUTING.md"):
-                continue
-
-            frontmatter = extract_frontmatter(filepath)
-            tags = get_tags_from_frontmatter(frontmatter)
+    return tag_docs
 
-            if tags:
-                doc_info = {
-                    "path": rel_path,
-                    "name": filepath.stem,
-                    "type": frontmatter.get("type", "unknown"),
-                    "title": extract_title(filepath) or filepath.stem,
-                }
 
-                for tag in tags:
-                    tag_docs[tag].append(doc_info)
+def group_by_type(docs: list[Doc]) -> dict[str, list[Doc]]:
+    """Docs grouped by type in page order, each group sorted by name.
 
-    return tag_docs
+    Types without their own section (reminders, context files) are listed
+    under Other, so every doc counted on the page is also linked from it.
+    """
+    by_type = defaultdict(list)
+    for doc in sorted(docs, key=lambda d: d.name):
+        by_type[doc.type if doc.type in TYPE_LABELS else "unknown"].append(doc)
+    return by_type
+
+
+def letter_bucket(name: str) -> str:
+    """Alphabetical shard key for a note name: a-z, 0-9 or other."""
+    first = name[:1].lower()
+    if "a" <= first <= "z":
+        return first
+    if first.isdigit():
+        return "0-9"
+    return "other"
+
+
+def plan_shards(docs: list[Doc], threshold: int) -> dict[str, list[Doc]]:
+    """Shard name -> docs for a tag too big for one page.
+
+    One shard per type; a type that alone passes the threshold is split by
+    the first letter of the note name. Keys depend only on the notes
+    themselves, so adding a note touches exactly one shard.
+    """
+    by_type = group_by_type(docs)
+    shards = {}
+    for doc_type in TYPE_ORDER:
+        type_docs = by_type.get(doc_type, [])
+        if len(type_docs) <= threshold:
+            if type_docs:
+                shards[doc_type] = type_docs
+            continue
+        for doc in type_docs:
+            shards.setdefault(f"{doc_type}-{letter_bucket(doc.name)}", []).append(doc)
+    return shards
 
 
-def extract_title(filepath: Path) -> str | None:
-    """Extract first H1 heading as title."""
-    try:
-        content = filepath.read_text(encoding="utf-8")
-        match = re.search(r"^#\s+(.+)$", content, re.MULTILINE)
-        return match.group(1).strip() if match else None
-    except Exception:
-        return None
+def shard_label(shard: str) -> str:
+    """'task-m' -> 'Tasks: M', 'knowledge' -> 'Knowledge'."""
+    doc_type, _, bucket = shard.partition("-")
+    label = TYPE_LABELS.get(doc_type, doc_type.title())
+    return f"{label}: {bucket.upper()}" if bucket else label
 
 
-def generate_tag_page(tag: str, docs: list[dict]) -> str:
+def generate_tag_page(tag: str, docs: list[Doc]) -> str:
     """Generate markdown content for a tag index page."""
-    # Sort docs by type, then name
-    type_order = {"knowledge": 0, "project": 1, "task": 2, "inbox": 3, "unknown": 9}
-    docs_sorted = sorted(docs, key=lambda d: (type_order.get(d["type"], 5), d["name"]))
-
-    # Group by type
-    by_type = defaultdict(list)
-    for doc in docs_sorted:
-        by_type[doc["type"]].append(doc)
+    by_type = group_by_type(docs)
 
     lines = [
         "---",
@@ -126,23 +153,14 @@ def generate_tag_page(tag: str, docs: list[dict]) -> str:
     ]
 
     # Add sections by type
-    type_labels = {
-        "knowledge": "Knowledge",
-        "project": "Projects",
-        "task": "Tasks",
-        "inbox": "Inbox",
-        "unknown": "Other",
-    }
-
-    for doc_type in ["knowledge", "project", "task", "inbox", "unknown"]:
+    for doc_type in TYPE_ORDER:
         type_docs = by_type.get(doc_type, [])
         if type_docs:
-            lines.append(f"## {type_labels.get(doc_type, doc_type.title())}")
+            lines.append(f"## {TYPE_LABELS.get(doc_type, doc_type.title())}")
             lines.append("")
             for doc in type_docs:
                 # Use the filename without extension for the wikilink
-                link_name = doc["path"].stem
-                lines.append(f"- [[{link_name}]]")
+                lines.append(f"- [[{doc.name}]]")
             lines.append("")
 
     lines.append("---")
@@ -151,48 +169,167 @@ def generate_tag_page(tag: str, docs: list[dict]) -> str:
     return "\n".join(lines)
 
 
-def main():
-    """Main entry point."""
-    print(f"Scanning vault: {VAULT_ROOT}")
+def generate_sharded_index(tag: str, total: int, shards: dict[str, list[Doc]]) -> str:
+    """Tag page for a sharded tag: counts and links to every shard."""
+    lines = [
+        "---",
+        "type: tag-index",
+        f"tag: {tag}",
+        f"generated: {date.today().isoformat()}",
+        "publish: true",
+        "---",
+        "",
+        f"# {tag.replace('-', ' ').title()}",
+        "",
+        f"**{total} documents** with this tag, split into {len(shards)} pages.",
+        "",
+    ]
+    current_type = None
+    for shard, shard_docs in shards.items():
+        doc_type = shard.partition("-")[0]
+        if doc_type != current_type:
+            if current_type is not None:
+                lines.append("")
+            lines.append(f"## {TYPE_LABELS.get(doc_type, doc_type.title())}")
+            lines.append("")
+            current_type = doc_type
+        lines.append(f"- [[tags/{tag}/{shard}|{shard_label(shard)}]] ({len(shard_docs)})")
+    lines.append("")
+    lines.append("---")
+    lines.append(f"*Auto-generated from frontmatter tags. Last updated: {date.today().isoformat()}*")
+    return "\n".join(lines)
 
-    # Ensure tags directory exists
-    TAGS_DIR.mkdir(exist_ok=True)
 
-    # Scan vault for tags
-    tag_docs = scan_vault()
+def generate_shard_page(tag: str, shard: str, docs: list[Doc]) -> str:
+    """One shard of a sharded tag."""
+    title = tag.replace('-', ' ').title()
+    lines = [
+        "---",
+        "type: tag-shard",
+        f"tag: {tag}",
+        f"generated: {date.today().isoformat()}",
+        "publish: true",
+        f"shard: {shard}",
+        "---",
+        "",
+        f"# {title} - {shard_label(shard)}",
+        "",
+        f"**{len(docs)} documents** on this page. Back to [[tags/{tag}|{title}]].",
+        "",
+    ]
+    for doc in docs:
+        lines.append(f"- [[{doc.name}]]")
+    lines.append("")
+    lines.append("---")
+    lines.append(f"*Auto-generated from frontmatter tags. Last updated: {date.today().isoformat()}*")
+    return "\n".join(lines)
+
+
+def tag_outputs(tag: str, docs: list[Doc], shard_threshold: int) -> dict[str, str]:
+    """Path under tags/ -> content for every page a tag produces."""
+    if shard_threshold <= 0 or len(docs) <= shard_threshold:
+        return {f"{tag}.md": generate_tag_page(tag, docs)}
+    shards = plan_shards(docs, shard_threshold)
+    outputs = {f"{tag}.md": generate_sharded_index(tag, len(docs), shards)}
+    for shard, shard_docs in shards.items():
+        outputs[f"{tag}/{shard}.md"] = generate_shard_page(tag, shard, shard_docs)
+    return outputs
+
+
+def run(vault_dir: Path, index: VaultIndex | None = None,
+        echo: Callable[[str], None] | None = None,
+        shard_threshold: int = SHARD_THRESHOLD) -> Stats:
+    """Regenerate tags/*.md (and tags/<tag>/*.md shards) for a vault.
+
+    Pass a shared `index` to reuse an already-parsed vault; `echo` receives
+    per-file progress lines. Tags with more than `shard_threshold` docs get
+    an index page plus shard pages (0 disables sharding).
+    """
+    vault_dir = Path(vault_dir)
+    tags_dir = vault_dir / "tags"
+    stats = Stats("tag-pages")
+    say = echo or (lambda msg: None)
+
+    if index is None:
+        index = build_index(vault_dir)
+        stats.absorb(index.stats)
+    else:
+        # Shared index: the read/parse cost is reported by its owner
+        stats.files_scanned = index.stats.files_scanned
+        stats.files_parsed = index.stats.files_parsed
+
+    with stats.phase("collect"):
+        tag_docs = scan_vault(index)
 
     if not tag_docs:
-        print("No tags found in vault.")
-        return
-
-    print(f"Found {len(tag_docs)} unique tags across {sum(len(docs) for docs in tag_docs.values())} tag usages")
-
-    # Generate tag pages
-    generated = 0
-    for tag, docs in sorted(tag_docs.items()):
-        tag_file = TAGS_DIR / f"{tag}.md"
-        content = generate_tag_page(tag, docs)
-
-        # Only write if content changed
-        if tag_file.exists():
-            existing = tag_file.read_text(encoding="utf-8")
-            # Compare without the generated date line
-            if existing.split("\n")[5:] == content.split("\n")[5:]:
-                continue
-
-        tag_file.write_text(content, encoding="utf-8")
-        generated += 1
-        print(f"  Generated: tags/{tag}.md ({len(docs)} docs)")
-
-    # Clean up orphaned tag pages (tags no longer used)
-    for tag_file in TAGS_DIR.glob("*.md"):
-        tag_name = tag_file.stem
-        if tag_name not in tag_docs:
-            tag_file.unlink()
-            print(f"  Removed orphan: tags/{tag_name}.md")
-
-    print(f"\nDone. Generated/updated {generated} tag pages.")
-    print(f"Tag pages are in: {TAGS_DIR}")
+        say("No tags found in vault.")
+        return stats
+
+    say(f"Found {len(tag_docs)} unique tags across {sum(len(docs) for docs in tag_docs.values())} tag usages")
+
+    # Ensure tags directory exists
+    tags_dir.mkdir(exist_ok=True)
+
+    manifest = OutputManifest(vault_dir, "tag-pages")
+    expected = set()
+    with stats.phase("write"):
+        for tag, doc_ids in sorted(tag_docs.items()):
+            outputs = tag_outputs(tag, [index.docs[i] for i in doc_ids], shard_threshold)
+            for rel, content in outputs.items():
+                expected.add(rel)
+
+                # Only write if content changed (manifest hash + one stat)
+                stats.count("files_stat")
+                if len(outputs) > 1:
+                    (tags_dir / tag).mkdir(exist_ok=True)
+                written = manifest.write_text(f"tags/{rel}", content)
+                if written is None:
+                    stats.count("files_unchanged")
+                    continue
+
+                stats.files_written += 1
+                stats.count("bytes_written", written)
+                if rel == f"{tag}.md":
+                    shards = f", {len(outputs) - 1} shards" if len(outputs) > 1 else ""
+                    say(f"  Generated: tags/{rel} ({len(doc_ids)} docs{shards})")
+                else:
+                    say(f"  Generated: tags/{rel}")
+
+        # Clean up orphaned tag pages and shards (tags no longer used or
+        # no longer big enough to shard)
+        for tag_file in [*tags_dir.glob("*.md"), *tags_dir.glob("*/*.md")]:
+            rel = tag_file.relative_to(tags_dir).as_posix()
+            if rel not in expected:
+                manifest.remove(f"tags/{rel}")
+                stats.count("files_removed")
+                say(f"  Removed orphan: tags/{rel}")
+        for shard_dir in tags_dir.iterdir():
+            if shard_dir.is_dir() and not any(shard_dir.iterdir()):
+                shard_dir.rmdir()
+        manifest.prune(f"tags/{rel}" for rel in expected)
+        manifest.save()
+
+    return stats
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Generate tag index pages")
+    parser.add_argument("--vault", type=Path, default=VAULT_ROOT, help="Vault root (default: this repo)")
+    parser.add_argument("-q", "--quiet", action="store_true", help="Don't list each generated page")
+    parser.add_argument("--shard-threshold", type=int, default=SHARD_THRESHOLD,
+                        help=f"Shard tags with more than N docs (default: {SHARD_THRESHOLD}, 0 = never)")
+    metrics.add_argument(parser)
+    args = parser.parse_args()
+
+    print(f"Scanning vault: {args.vault}")
+
+    stats = run(args.vault, echo=None if args.quiet else print, shard_threshold=args.shard_threshold)
+
+    print(f"\nDone. Generated/updated {stats.files_written} tag pages.")
+    print(f"Tag pages are in: {args.vault / 'tags'}")
+    print(f"Stats: {stats.summary()}")
+    metrics.emit(metrics.metrics_path(args.metrics_file), stats, args.vault)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""
+Bulk-import emails and tickets into the inbox.
+
+Reads mbox files, Maildir folders and JSONL ticket exports and writes one
+note per item with the frontmatter of templates/inbox.md:
+
+    inbox/emails/2026-03-02-quarterly-report-3f9a1c2e.md
+    ---
+    type: inbox
+    created: 2026-03-02
+    source: email
+    message-id: "<abc@example.com>"
+    from: "Ana <ana@example.com>"
+    subject: "Quarterly report"
+    ---
+
+Items are deduplicated by Message-ID (emails) or ticket ID: every imported
+key is remembered as a 64-bit hash in .org-cache/inbox-seen.u64, an
+append-only file loaded once into a sorted array, so re-running an export
+only writes what is new. Input is streamed and handled in batches of
+--batch-size items; notes of a batch are written by a pool of --writers
+threads before the next batch is read, so memory stays bounded however
+large the export is.
+
+Usage:
+  python ingest-inbox.py mail.mbox
+  python ingest-inbox.py ~/Maildir/INBOX
+  python ingest-inbox.py tickets.jsonl --vault ~/orgs/team-a
+  python ingest-inbox.py export.json --format tickets --dry-run
+
+Ticket records are JSON objects, one per line. Recognised keys (first
+match wins): id/key/number, title/subject/summary, body/description/text,
+created/created_at/opened, plus optional url, status, reporter/author.
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import os
+import re
+import sys
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from email import policy
+from email.errors import HeaderParseError
+from email.header import decode_header, make_header
+from email.parser import BytesParser
+from email.utils import parsedate_to_datetime
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator
+
+# Shared helpers ship with the hooks (stdlib only)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'setup' / 'hooks'))
+from orglib import Stats, metrics  # noqa: E402
+
+# Ensure UTF-8 output on Windows
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+ORG_DIR = Path(__file__).parent.parent
+
+SEEN_FILE = Path('.org-cache') / 'inbox-seen.u64'
+BATCH_SIZE = 500
+WRITERS = 8
+FOLDERS = {'email': 'inbox/emails', 'ticket': 'inbox/tickets'}
+
+SLUG_DROP = re.compile(r'[^a-z0-9]+')
+TAGS = re.compile(r'<[^>]+>')
+BLANK_LINES = re.compile(r'\n{3,}')
+
+
+@dataclass(slots=True)
+class Item:
+    """One email or ticket, ready to be written as an inbox note."""
+    source: str  # email | ticket
+    key: str  # dedupe key, e.g. 'email:<id@host>'
+    created: date
+    title: str
+    fields: dict[str, str] = field(default_factory=dict)
+    body: str = ''
+
+
+def key_hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+class SeenSet:
+    """Persistent set of imported keys, stored as 64-bit hashes.
+
+    The file is only appended to. On load it is sorted once into an array
+    (8 bytes per item, bisect lookups); keys added during this run live in
+    a set and are appended to the file by `flush()`.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        loaded = array('Q')
+        try:
+            data = path.read_bytes()
+            loaded.frombytes(data[:len(data) // 8 * 8])
+        except OSError:
+            pass
+        self.hashes = array('Q', sorted(loaded))
+        self.added: set[int] = set()
+        self.unsaved: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self.hashes) + len(self.added)
+
+    def __contains__(self, h: int) -> bool:
+        if h in self.added:
+            return True
+        i = bisect_left(self.hashes, h)
+        return i < len(self.hashes) and self.hashes[i] == h
+
+    def add(self, h: int) -> None:
+        self.added.add(h)
+        self.unsaved.append(h)
+
+    def discard(self, h: int) -> None:
+        """Forget a hash added this run (its note could not be written)."""
+        self.added.discard(h)
+        if h in self.unsaved:
+            self.unsaved.remove(h)
+
+    def flush(self) -> None:
+        """Append the hashes added since the last flush."""
+        if not self.unsaved:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'ab') as f:
+            f.write(array('Q', self.unsaved).tobytes())
+        self.unsaved.clear()
+
+
+# === Readers ===
+
+def iter_mbox(path: Path) -> Iterator[bytes]:
+    """Raw messages of an mbox file, one at a time."""
+    with open(path, 'rb') as f:
+        lines: list[bytes] = []
+        for line in f:
+            if line.startswith(b'From '):
+                if lines:
+                    yield b''.join(lines)
+                lines = []
+                continue
+            # mboxrd quoting: '>From ' at line start
+            if line.startswith(b'>') and line.lstrip(b'>').startswith(b'From '):
+                line = line[1:]
+            lines.append(line)
+        if lines:
+            yield b''.join(lines)
+
+
+def iter_maildir(path: Path) -> Iterator[bytes]:
+    """Raw messages of a Maildir (new/ and cur/)."""
+    for sub in ('new', 'cur'):
+        try:
+            entries = os.scandir(path / sub)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_file() and not entry.name.startswith('.'):
+                    with open(entry.path, 'rb') as f:
+                        yield f.read()
+
+
+def iter_jsonl(path: Path, stats: Stats) -> Iterator[dict]:
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                stats.count('items_malformed')
+                continue
+            if isinstance(record, dict):
+                yield record
+            else:
+                stats.count('items_malformed')
+
+
+# === Items ===
+
+# compat32 parses an order of magnitude faster than policy.default; headers
+# are decoded by hand below
+PARSER = BytesParser(policy=policy.compat32)
+
+
+def header_text(msg, name: str) -> str:
+    """Unfolded header value with RFC 2047 encoded words decoded."""
+    value = msg.get(name)
+    if value is None:
+        return ''
+    try:
+        text = str(make_header(decode_header(value)))
+    except (HeaderParseError, LookupError, UnicodeError):
+        text = str(value)
+    return ' '.join(text.split())
+
+
+def message_text(msg) -> str:
+    """Plain-text body of a message (HTML stripped if that's all there is)."""
+    plain = rich = None
+    for part in msg.walk():
+        if part.is_multipart() or part.get_filename():
+            continue
+        ctype = part.get_content_type()
+        if ctype == 'text/plain' and plain is None:
+            plain = part
+        elif ctype == 'text/html' and rich is None:
+            rich = part
+    part = plain or rich
+    if part is None:
+        return ''
+    payload = part.get_payload(decode=True) or b''
+    try:
+        text = payload.decode(part.get_content_charset() or 'utf-8', 'replace')
+    except LookupError:
+        text = payload.decode('utf-8', 'replace')
+    if part is rich:
+        text = html.unescape(TAGS.sub('', text))
+    return BLANK_LINES.sub('\n\n', text.replace('\r\n', '\n')).strip()
+
+
+def email_item(raw: bytes) -> Item | None:
+    msg = PARSER.parsebytes(raw)
+    subject = header_text(msg, 'subject') or '(no subject)'
+    sender = header_text(msg, 'from')
+    message_id = header_text(msg, 'message-id')
+    sent = None
+    if msg.get('date'):
+        try:
+            sent = parsedate_to_datetime(str(msg['date']))
+        except (TypeError, ValueError):
+            pass
+    key = f"email:{message_id}" if message_id else f"email:{sender}|{msg.get('date')}|{subject}"
+    fields = {'message-id': message_id, 'from': sender, 'subject': subject}
+    return Item('email', key, (sent or datetime.now()).date(), subject,
+                {k: v for k, v in fields.items() if v}, message_text(msg))
+
+
+def first(record: dict, *keys):
+    for key in keys:
+        value = record.get(key)
+        if value not in (None, ''):
+            return value
+    return None
+
+
+def ticket_item(record: dict) -> Item | None:
+    ticket_id = first(record, 'id', 'key', 'number', 'ticket_id')
+    if ticket_id is None:
+        return None
+    title = str(first(record, 'title', 'subject', 'summary') or f'Ticket {ticket_id}').strip()
+    created = date.today()
+    opened = first(record, 'created', 'created_at', 'opened')
+    if opened is not None:
+        try:
+            created = datetime.fromisoformat(str(opened).replace('Z', '+00:00')).date()
+        except ValueError:
+            pass
+    fields = {'ticket-id': str(ticket_id)}
+    for name, keys in (('url', ('url', 'link')), ('status', ('status', 'state')),
+                       ('reporter', ('reporter', 'author', 'requester'))):
+        value = first(record, *keys)
+        if value is not None:
+            fields[name] = str(value)
+    body = str(first(record, 'body', 'description', 'text') or '').strip()
+    return Item('ticket', f'ticket:{ticket_id}', created, title, fields, body)
+
+
+# === Notes ===
+
+def yaml_str(value: str) -> str:
+    """A YAML double-quoted scalar (JSON strings are valid ones)."""
+    return json.dumps(value, ensure_ascii=False)
+
+
+def note_name(item: Item) -> str:
+    slug = SLUG_DROP.sub('-', item.title.lower()).strip('-')[:60].rstrip('-') or item.source
+    return f'{item.created.isoformat()}-{slug}-{key_hash(item.key) >> 32:08x}.md'
+
+
+def render_note(item: Item) -> str:
+    lines = [
+        '---',
+        'type: inbox',
+        f'created: {item.created.isoformat()}',
+        f'source: {item.source}',
+    ]
+    lines.extend(f'{name}: {yaml_str(value)}' for name, value in item.fields.items())
+    lines.extend(['---', '', f'# {item.title}', ''])
+    if item.body:
+        lines.extend([item.body, ''])
+    return '\n'.join(lines)
+
+
+def write_note(path: Path, content: str) -> int:
+    """Create a new note; never overwrites. Returns bytes written."""
+    data = content.encode('utf-8')
+    try:
+        with open(path, 'xb') as f:
+            f.write(data)
+    except FileExistsError:
+        raise
+    except OSError:
+        path.unlink(missing_ok=True)
+        raise
+    return len(data)
+
+
+def ingest(vault_dir: Path, items: Iterable[Item | None], batch_size: int = BATCH_SIZE,
+           writers: int = WRITERS, dry_run: bool = False, stats: Stats | None = None) -> Stats:
+    """Write new items as inbox notes; returns the run's Stats."""
+    vault_dir = Path(vault_dir)
+    stats = stats or Stats('ingest-inbox')
+    seen = SeenSet(vault_dir / SEEN_FILE)
+    stats.count('seen_before', len(seen))
+    if not dry_run:
+        for folder in FOLDERS.values():
+            (vault_dir / folder).mkdir(parents=True, exist_ok=True)
+
+    items = iter(items)
+    with ThreadPoolExecutor(max_workers=max(1, writers)) as pool:
+        while True:
+            with stats.phase('parse'):
+                batch = list(islice(items, batch_size))
+            if not batch:
+                break
+            jobs = []
+            with stats.phase('render'):
+                for item in batch:
+                    stats.files_scanned += 1
+                    if item is None:
+                        stats.count('items_malformed')
+                        continue
+                    stats.files_parsed += 1
+                    h = key_hash(item.key)
+                    if h in seen:
+                        stats.count('items_duplicate')
+                        continue
+                    seen.add(h)
+                    path = vault_dir / FOLDERS[item.source] / note_name(item)
+                    jobs.append((h, path, render_note(item)))
+            if dry_run:
+                stats.files_written += len(jobs)
+                seen.unsaved.clear()
+                continue
+            with stats.phase('write'):
+                futures = [(h, pool.submit(write_note, path, content)) for h, path, content in jobs]
+                for h, future in futures:
+                    try:
+                        stats.count('bytes_written', future.result())
+                        stats.files_written += 1
+                    except FileExistsError:
+                        stats.count('items_existing')
+                    except OSError as e:
+                        seen.discard(h)
+                        stats.count('items_failed')
+                        print(f'Warning: could not write note: {e}', file=sys.stderr)
+                seen.flush()
+    return stats
+
+
+def detect_format(path: Path) -> str:
+    if path.is_dir():
+        return 'maildir'
+    if path.suffix in ('.jsonl', '.ndjson'):
+        return 'tickets'
+    return 'mbox'
+
+
+def read_items(path: Path, fmt: str, stats: Stats) -> Iterator[Item | None]:
+    if fmt == 'tickets':
+        return (ticket_item(r) for r in iter_jsonl(path, stats))
+    raw = iter_maildir(path) if fmt == 'maildir' else iter_mbox(path)
+    return (email_item(m) for m in raw)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Import emails and tickets into the inbox')
+    parser.add_argument('sources', nargs='+', type=Path, help='mbox files, Maildir folders or JSONL exports')
+    parser.add_argument('--vault', type=Path, default=ORG_DIR, help='Vault root (default: this repo)')
+    parser.add_argument('--format', choices=['auto', 'mbox', 'maildir', 'tickets'], default='auto',
+                        help='Input format (default: from the path)')
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE,
+                        help=f'Items read and written per batch (default: {BATCH_SIZE})')
+    parser.add_argument('--writers', type=int, default=WRITERS,
+                        help=f'Threads writing notes (default: {WRITERS})')
+    parser.add_argument('--dry-run', action='store_true', help='Count what would be imported; write nothing')
+    metrics.add_argument(parser)
+    args = parser.parse_args()
+
+    stats = Stats('ingest-inbox')
+    for source in args.sources:
+        fmt = detect_format(source) if args.format == 'auto' else args.format
+        ingest(args.vault, read_items(source, fmt, stats), max(1, args.batch_size),
+               args.writers, args.dry_run, stats)
+    verb = 'Would import' if args.dry_run else 'Imported'
+    duplicates = stats.counters.get('items_duplicate', 0) + stats.counters.get('items_existing', 0)
+    print(f'{verb} {stats.files_written} item(s), skipped {duplicates} already imported')
+    print(f'Stats: {stats.summary()}')
+    metrics.emit(metrics.metrics_path(args.metrics_file), stats, args.vault)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,171 @@
+"""
+Pooled client for the Obsidian Local REST API.
+
+One SSL context and one keep-alive HTTPS connection are shared by every
+request. Requests are serialized on that connection (the plugin speaks
+HTTP/1.1 without pipelining) and retried with exponential backoff when the
+socket drops, which Obsidian does to idle connections. Only requests that
+can't have reached Obsidian are retried: a failed connect, or a send that
+failed on a stale socket. Once a request is sent, only GETs are retried,
+so a command such as `lint-all-files` never runs twice.
+
+A socket the server closed while idle can still accept a send and only
+fail on the response, too late to retry a POST. So a POST on a connection
+idle for longer than `keepalive` seconds (default KEEPALIVE) opens a
+fresh one first.
+
+Usage:
+    async with ObsidianClient(api_key) as client:
+        if await client.check_available():
+            await client.execute_command("dataview:dataview-force-refresh-views")
+
+For tests, point `base_url` at a local stub HTTPS server and pass an
+`ssl_context` that trusts (or ignores) its certificate.
+"""
+
+import asyncio
+import http.client
+import json
+import ssl
+import time
+from urllib.parse import urlsplit
+
+DEFAULT_URL = "https://127.0.0.1:27124"
+DEFAULT_TIMEOUT = 10
+DEFAULT_RETRIES = 2
+DEFAULT_BACKOFF = 0.25
+
+# Seconds a connection may sit idle before a POST reconnects instead of
+# reusing it (the plugin's server closes idle sockets after about 5s)
+KEEPALIVE = 4.0
+
+# Errors that mean "the connection is gone", not "the server said no".
+# OSError covers refused, reset and timed-out sockets.
+RETRYABLE_ERRORS = (http.client.HTTPException, OSError)
+
+# Methods safe to resend after the server may already have acted on them
+IDEMPOTENT = frozenset({"GET", "HEAD"})
+
+
+def create_ssl_context() -> ssl.SSLContext:
+    """SSL context for the plugin's self-signed localhost certificate."""
+    ctx = ssl.create_default_context()
+    ctx.check_hostname = False
+    ctx.verify_mode = ssl.CERT_NONE
+    return ctx
+
+
+class ObsidianClient:
+    """Keep-alive client for the Local REST API plugin."""
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = DEFAULT_URL,
+        timeout: float = DEFAULT_TIMEOUT,
+        retries: int = DEFAULT_RETRIES,
+        backoff: float = DEFAULT_BACKOFF,
+        ssl_context: ssl.SSLContext | None = None,
+        keepalive: float = KEEPALIVE,
+    ):
+        url = urlsplit(base_url)
+        self.api_key = api_key
+        self.host = url.hostname or "127.0.0.1"
+        self.port = url.port or 443
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.ssl_context = ssl_context or create_ssl_context()
+        self.keepalive = keepalive
+        self.requests_sent = 0
+        self.connections_opened = 0
+        self._conn: http.client.HTTPSConnection | None = None
+        self._last_response = 0.0  # time.monotonic() of the last response read
+        self._lock = asyncio.Lock()
+
+    def _connection(self) -> http.client.HTTPSConnection:
+        if self._conn is None:
+            self._conn = http.client.HTTPSConnection(
+                self.host, self.port, timeout=self.timeout, context=self.ssl_context
+            )
+            self.connections_opened += 1
+        return self._conn
+
+    def _drop_connection(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _request_sync(self, method: str, path: str, retries: int) -> tuple[int, bytes]:
+        """Send one request on the shared connection, reconnecting on failure.
+
+        Failures before the request is fully sent are retried; failures
+        while waiting for the response only for idempotent methods, which
+        is why those others never go out on a connection idle too long.
+        """
+        headers = {"Authorization": f"Bearer {self.api_key}"}
+        body = b"" if method == "POST" else None  # POST requires a body
+        attempt = 0
+        while True:
+            sent = False
+            try:
+                if (method not in IDEMPOTENT and self._conn is not None
+                        and time.monotonic() - self._last_response > self.keepalive):
+                    self._drop_connection()
+                conn = self._connection()
+                if conn.sock is None:
+                    conn.connect()
+                conn.request(method, path, body=body, headers=headers)
+                sent = True
+                response = conn.getresponse()
+                data = response.read()
+                self._last_response = time.monotonic()
+                self.requests_sent += 1
+                if response.will_close:
+                    self._drop_connection()
+                return response.status, data
+            except RETRYABLE_ERRORS:
+                self._drop_connection()
+                if attempt >= retries or (sent and method not in IDEMPOTENT):
+                    raise
+                time.sleep(self.backoff * (2 ** attempt))
+                attempt += 1
+
+    async def request(self, method: str, path: str, retries: int | None = None) -> tuple[int, bytes]:
+        """Send a request without blocking the event loop."""
+        if retries is None:
+            retries = self.retries
+        async with self._lock:
+            return await asyncio.to_thread(self._request_sync, method, path, retries)
+
+    async def check_available(self) -> bool:
+        """True if the API answers and accepts our key.
+
+        Uses a single retry so a closed Obsidian fails fast.
+        """
+        try:
+            status, data = await self.request("GET", "/", retries=min(self.retries, 1))
+            if status != 200:
+                return False
+            info = json.loads(data.decode())
+            return info.get("status") == "OK" and info.get("authenticated", False)
+        except (*RETRYABLE_ERRORS, json.JSONDecodeError, UnicodeDecodeError):
+            return False
+
+    async def execute_command(self, command_id: str) -> bool:
+        """Execute an Obsidian command by id."""
+        try:
+            status, _ = await self.request("POST", f"/commands/{command_id}/")
+            return status in (200, 204)
+        except RETRYABLE_ERRORS as e:
+            print(f"  [WARN] Command execution failed: {e}")
+            return False
+
+    def close(self) -> None:
+        self._drop_connection()
+
+    async def __aenter__(self) -> "ObsidianClient":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,257 @@
+"""
+Minimal make-style DAG executor for the publish workflow.
+
+Each step declares its dependencies, the files it reads and the files it
+writes. A step is skipped when the content hashes of its inputs and outputs
+(and its `key`, for steps that depend on more than files, such as today's
+date) match the ones recorded after its last successful run. Steps whose
+dependencies are satisfied run concurrently.
+
+File hashes are cached by (size, mtime) so an unchanged vault costs one stat
+per file, not one read per file. Snapshots are taken in a worker thread so
+hashing doesn't stall the other steps. State lives in a JSON file between
+runs, replaced atomically.
+
+A step that rewrites its own inputs may still be writing when `run` returns
+(Obsidian applies a lint-all command after answering the REST call), so its
+baseline is taken once the inputs have stopped changing for SETTLE_QUIET
+seconds. If they don't settle within SETTLE_TIMEOUT, no baseline is
+recorded and the step runs again next time.
+"""
+
+import asyncio
+import hashlib
+import json
+import sys
+import time
+from dataclasses import dataclass, field
+from graphlib import TopologicalSorter
+from pathlib import Path
+from typing import Awaitable, Callable, Iterable
+
+# Shared helpers ship with the hooks (stdlib only)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "setup" / "hooks"))
+from orglib import write_atomic  # noqa: E402
+
+STATE_VERSION = 1
+
+# Seconds: how long a mutating step's inputs must stay unchanged, how often
+# they are re-checked, and how long to wait at most
+SETTLE_QUIET = 1.0
+SETTLE_POLL = 0.25
+SETTLE_TIMEOUT = 30.0
+
+
+def hash_bytes(data: bytes) -> str:
+    return hashlib.sha1(data).hexdigest()
+
+
+class FileHasher:
+    """Content hashes keyed by vault-relative path, reusing stat-matched cache entries."""
+
+    def __init__(self, root: Path, cache: dict | None = None):
+        self.root = root
+        self.cache = cache if cache is not None else {}
+        self.hashed = 0
+        self.reused = 0
+
+    def hash(self, path: Path) -> str | None:
+        """Hash of the file's content, or None if it doesn't exist."""
+        rel = path.relative_to(self.root).as_posix()
+        try:
+            st = path.stat()
+        except OSError:
+            self.cache.pop(rel, None)
+            return None
+        cached = self.cache.get(rel)
+        if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+            self.reused += 1
+            return cached[2]
+        digest = hash_bytes(path.read_bytes())
+        self.cache[rel] = [st.st_size, st.st_mtime_ns, digest]
+        self.hashed += 1
+        return digest
+
+    def snapshot(self, paths: Iterable[Path]) -> dict[str, str]:
+        """Map relative path -> hash for every existing file."""
+        result = {}
+        for path in paths:
+            digest = self.hash(path)
+            if digest is not None:
+                result[path.relative_to(self.root).as_posix()] = digest
+        return result
+
+
+def diff_snapshots(old: dict[str, str], new: dict[str, str]) -> list[str]:
+    """Relative paths added, removed or modified between two snapshots."""
+    changed = [p for p, h in new.items() if old.get(p) != h]
+    changed += [p for p in old if p not in new]
+    return sorted(changed)
+
+
+def describe_changes(what: str, changed: list[str]) -> str:
+    shown = ", ".join(changed[:3])
+    more = f", +{len(changed) - 3} more" if len(changed) > 3 else ""
+    return f"{what} changed: {len(changed)} file(s) ({shown}{more})"
+
+
+@dataclass
+class Step:
+    """One node of the pipeline.
+
+    `run` returns (success, report lines). A step without `inputs` is phony:
+    it has no cacheable state and always runs. Set `mutates_inputs` for steps
+    that rewrite their own inputs (the linter) so the post-run state, once
+    settled, is recorded as the baseline; a file listed in both `inputs` and
+    `outputs` is recorded as the step left it. `key` returns whatever else the
+    step's result depends on (e.g. today's date); a new value reruns it.
+    """
+    name: str
+    label: str
+    run: Callable[[], Awaitable[tuple[bool, list[str]]]]
+    deps: tuple[str, ...] = ()
+    inputs: Callable[[], Iterable[Path]] | None = None
+    outputs: Callable[[], Iterable[Path]] | None = None
+    mutates_inputs: bool = False
+    key: Callable[[], str] | None = None
+    disabled: str | None = None  # reason the step is switched off
+
+
+@dataclass
+class StepResult:
+    name: str
+    status: str  # ran | skipped | failed | disabled
+    reason: str
+    seconds: float = 0.0
+    lines: list[str] = field(default_factory=list)
+
+
+class Pipeline:
+    """Runs steps in dependency order, skipping the ones that are up to date."""
+
+    def __init__(self, steps: list[Step], root: Path, state_file: Path,
+                 force: bool = False, dry_run: bool = False):
+        self.steps = {s.name: s for s in steps}
+        self.order = list(TopologicalSorter({s.name: s.deps for s in steps}).static_order())
+        self.root = root
+        self.state_file = state_file
+        self.force = force
+        self.dry_run = dry_run
+        self.state = self._load_state()
+        self.hasher = FileHasher(root, self.state["files"])
+        self.results: dict[str, StepResult] = {}
+        self.started = time.perf_counter()
+
+    def _load_state(self) -> dict:
+        try:
+            state = json.loads(self.state_file.read_text(encoding="utf-8"))
+            if state.get("version") == STATE_VERSION:
+                return state
+        except (OSError, ValueError):
+            pass
+        return {"version": STATE_VERSION, "files": {}, "steps": {}}
+
+    def _save_state(self) -> None:
+        write_atomic(self.state_file, [json.dumps(self.state, indent=1, sort_keys=True)])
+
+    def _snapshot(self, paths: Callable[[], Iterable[Path]] | None) -> dict[str, str]:
+        return self.hasher.snapshot(paths()) if paths else {}
+
+    async def _settled(self, paths: Callable[[], Iterable[Path]]) -> dict[str, str] | None:
+        """Snapshot once nothing changed for SETTLE_QUIET seconds, or None on timeout."""
+        deadline = time.monotonic() + SETTLE_TIMEOUT
+        last = await asyncio.to_thread(self._snapshot, paths)
+        quiet_since = time.monotonic()
+        while time.monotonic() - quiet_since < SETTLE_QUIET:
+            if time.monotonic() >= deadline:
+                return None
+            await asyncio.sleep(SETTLE_POLL)
+            current = await asyncio.to_thread(self._snapshot, paths)
+            if current != last:
+                last, quiet_since = current, time.monotonic()
+        return last
+
+    def _why_run(self, step: Step, inputs: dict, outputs: dict, key: str | None) -> str | None:
+        """Reason the step must run, or None if it is up to date."""
+        if step.inputs is None:
+            return "always runs (no declared inputs)"
+        if self.force:
+            return "forced (--force)"
+        record = self.state["steps"].get(step.name)
+        if record is None:
+            return "no previous run recorded"
+        if record.get("key") != key:
+            return f"key changed: {record.get('key')} -> {key}"
+        changed = diff_snapshots(record["inputs"], inputs)
+        if changed:
+            return describe_changes("inputs", changed)
+        changed = diff_snapshots(record["outputs"], outputs)
+        if changed:
+            return describe_changes("outputs", changed)
+        return None
+
+    async def _run_step(self, step: Step, dep_tasks: list[asyncio.Task]) -> StepResult:
+        deps = await asyncio.gather(*dep_tasks)
+        if step.disabled:
+            return StepResult(step.name, "disabled", step.disabled)
+        failed = [d.name for d in deps if d.status == "failed"]
+        if failed:
+            return StepResult(step.name, "disabled", f"dependency failed: {', '.join(failed)}")
+
+        start = time.perf_counter()
+        inputs = await asyncio.to_thread(self._snapshot, step.inputs)
+        outputs = await asyncio.to_thread(self._snapshot, step.outputs)
+        key = step.key() if step.key else None
+        reason = self._why_run(step, inputs, outputs, key)
+        if reason is None:
+            return StepResult(step.name, "skipped", "up to date",
+                              time.perf_counter() - start)
+
+        ok, lines = await step.run()
+        if not self.dry_run:
+            if ok and step.inputs is not None:
+                if step.mutates_inputs:
+                    inputs = await self._settled(step.inputs)
+                if inputs is not None:
+                    outputs = await asyncio.to_thread(self._snapshot, step.outputs)
+                    # A file the step reads and also writes (the event log) is baselined as written
+                    inputs.update((rel, h) for rel, h in outputs.items() if rel in inputs)
+                    self.state["steps"][step.name] = {"inputs": inputs, "outputs": outputs, "key": key}
+                else:
+                    self.state["steps"].pop(step.name, None)
+                    lines = [*lines, f"Inputs still changing after {SETTLE_TIMEOUT:.0f}s; not cached"]
+            elif not ok:
+                self.state["steps"].pop(step.name, None)
+        return StepResult(step.name, "ran" if ok else "failed", reason,
+                          time.perf_counter() - start, lines)
+
+    async def run(self, on_result: Callable[[Step, StepResult], None] | None = None) -> dict[str, StepResult]:
+        """Run every step, calling `on_result` as each one finishes."""
+        tasks: dict[str, asyncio.Task] = {}
+
+        async def run_and_report(step: Step, dep_tasks: list[asyncio.Task]) -> StepResult:
+            result = await self._run_step(step, dep_tasks)
+            self.results[step.name] = result
+            if on_result:
+                on_result(step, result)
+            return result
+
+        for name in self.order:
+            step = self.steps[name]
+            tasks[name] = asyncio.create_task(
+                run_and_report(step, [tasks[d] for d in step.deps]))
+        await asyncio.gather(*tasks.values())
+
+        if not self.dry_run:
+            self._save_state()
+        return self.results
+
+    def explain(self) -> list[str]:
+        """Table of what ran or was skipped, why, and how long it took."""
+        lines = [f"{'Step':<16} {'Result':<9} {'Time':>8}  Reason"]
+        for name in self.order:
+            r = self.results.get(name)
+            if r:
+                lines.append(f"{name:<16} {r.status:<9} {r.seconds * 1000:>6.0f}ms  {r.reason}")
+        lines.append(f"(file hashes: {self.hasher.hashed} computed, {self.hasher.reused} reused from cache)")
+        return lines
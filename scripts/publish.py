@@ -3,6 +3,11 @@
 Automated Publish Workflow
 
 Runs all pre-publish steps and opens the Publish dialog in Obsidian.
+The workflow is a DAG of steps (see pipeline.py): a step is skipped when
+none of its input notes changed since its last successful run, and steps
+that don't depend on each other run concurrently. The generators run
+in-process and share one parsed vault index. Obsidian commands share
+one keep-alive REST API connection (see obsidian_api.py).
 
 Steps:
 1. Generate tag index pages (for graph connectivity)
@@ -15,28 +20,52 @@ Usage:
   python publish.py           # Run full workflow
   python publish.py --no-lint # Skip linting
   python publish.py --dry-run # Show what would be done
+  python publish.py --force   # Re-run steps even if up to date
+  python publish.py --explain # Report why each step ran or was skipped
+  python publish.py --diff    # List publishable files changed since the last publish
+  python publish.py --mark-published  # Record the current state as published
+  python publish.py --metrics-file m.jsonl  # Append JSON-lines timings/counters
 
 Requirements:
   - Obsidian must be running with the vault open
   - Obsidian Local REST API plugin must be installed and configured
   - Set OBSIDIAN_REST_API_KEY environment variable or configure in .publish-config.json
+    (OBSIDIAN_REST_API_URL / "rest_api_url" override the default https://127.0.0.1:27124)
 """
 
 import argparse
+import asyncio
+import importlib.util
 import json
-import subprocess
+import os
 import sys
-import urllib.request
-import urllib.error
-import ssl
+import threading
+import yaml
+from datetime import date
 from pathlib import Path
 
+from obsidian_api import ObsidianClient
+from pipeline import Pipeline, Step, StepResult
+from publish_snapshot import PublishSnapshot
+
+# Shared helpers ship with the hooks (stdlib only)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "setup" / "hooks"))
+from orglib import (  # noqa: E402
+    EventLog, IgnoreRules, OutputManifest, Stats, VaultIndex, VaultWalker, diff_manifests, metrics, yaml_loader,
+)
+from orglib.archive import ARCHIVE_DIR  # noqa: E402
+from orglib.vault import DEFAULT_EXCLUDED_DIRS  # noqa: E402
+
 # Configuration
 SCRIPTS_DIR = Path(__file__).parent
 VAULT_DIR = SCRIPTS_DIR.parent
 CONFIG_FILE = SCRIPTS_DIR / ".publish-config.json"
 REST_API_URL = "https://127.0.0.1:27124"
 REST_API_TIMEOUT = 10
+STATE_FILE = SCRIPTS_DIR / ".publish-state.json"
+SNAPSHOT_FILE = SCRIPTS_DIR / ".publish-snapshot.json"
+GENERATED_FILES = {"publish-dashboard.md"}
+DASHBOARD_PAGES_DIR = "publish-dashboard"
 
 
 def load_config() -> dict:
@@ -49,7 +78,6 @@ def load_config() -> dict:
 
 def get_api_key() -> str | None:
     """Get REST API key from config or environment."""
-    import os
     api_key = os.environ.get("OBSIDIAN_REST_API_KEY")
     if api_key:
         return api_key
@@ -57,101 +85,216 @@ def get_api_key() -> str | None:
     return config.get("rest_api_key")
 
 
-def check_api_available() -> bool:
-    """Check if Obsidian REST API is available."""
-    api_key = get_api_key()
-    if not api_key:
-        return False
+def get_api_url() -> str:
+    """Get REST API base URL (override to point at a stub server)."""
+    return (os.environ.get("OBSIDIAN_REST_API_URL")
+            or load_config().get("rest_api_url")
+            or REST_API_URL)
 
-    try:
-        ctx = ssl.create_default_context()
-        ctx.check_hostname = False
-        ctx.verify_mode = ssl.CERT_NONE
 
-        req = urllib.request.Request(
-            f"{REST_API_URL}/",
-            headers={"Authorization": f"Bearer {api_key}"}
-        )
+def load_generator(script_name: str):
+    """Import a generator script (hyphenated filename) as a module."""
+    spec = importlib.util.spec_from_file_location(
+        script_name[:-3].replace("-", "_"), SCRIPTS_DIR / script_name)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
 
-        with urllib.request.urlopen(req, timeout=REST_API_TIMEOUT, context=ctx) as response:
-            data = json.loads(response.read().decode())
-            return data.get("status") == "OK" and data.get("authenticated", False)
-    except (urllib.error.URLError, TimeoutError, json.JSONDecodeError):
-        return False
 
+class SharedIndex:
+    """Vault parsed at most once, on first use, and shared by the generators."""
 
-def execute_command(command_id: str) -> bool:
-    """Execute an Obsidian command via REST API."""
-    api_key = get_api_key()
-    if not api_key:
-        return False
+    def __init__(self):
+        self.index: VaultIndex | None = None
+        self.runs: list[Stats] = []
+        self._lock = threading.Lock()
 
-    try:
-        ctx = ssl.create_default_context()
-        ctx.check_hostname = False
-        ctx.verify_mode = ssl.CERT_NONE
-
-        url = f"{REST_API_URL}/commands/{command_id}/"
-        req = urllib.request.Request(
-            url,
-            data=b"",  # POST requires data
-            headers={"Authorization": f"Bearer {api_key}"},
-            method="POST"
-        )
-
-        with urllib.request.urlopen(req, timeout=REST_API_TIMEOUT, context=ctx) as response:
-            return response.status in (200, 204)
-    except (urllib.error.URLError, TimeoutError) as e:
-        print(f"  [WARN] Command execution failed: {e}")
-        return False
-
-
-def run_script(script_name: str, dry_run: bool = False) -> bool:
-    """Run a Python script in the scripts directory."""
-    script_path = SCRIPTS_DIR / script_name
-    if not script_path.exists():
-        print(f"  [SKIP] Script not found: {script_name}")
-        return False
+    def get(self) -> VaultIndex:
+        with self._lock:
+            if self.index is None:
+                self.index = VaultIndex(VAULT_DIR, yaml_loader(yaml))
+            return self.index
+
+
+def describe_outputs(before: dict[str, str], after: dict[str, str]) -> list[str]:
+    """Report lines for generated files that changed, from two manifests."""
+    added, modified, removed = diff_manifests(before, after)
+    lines = []
+    for label, paths in (("added", added), ("modified", modified), ("removed", removed)):
+        if paths:
+            shown = ", ".join(paths[:5]) + (f", +{len(paths) - 5} more" if len(paths) > 5 else "")
+            lines.append(f"    {len(paths)} {label}: {shown}")
+    return lines or ["    No generated files changed"]
+
+
+async def run_generator(script_name: str, manifest_name: str, shared: SharedIndex,
+                        dry_run: bool = False) -> tuple[bool, list[str]]:
+    """Run a generator in-process against the shared vault index.
+
+    Its Stats are kept on `shared.runs` for the metrics report; the report
+    lines list the outputs that changed according to its manifest.
+    """
+    if not (SCRIPTS_DIR / script_name).exists():
+        return False, [f"  [SKIP] Script not found: {script_name}"]
 
     if dry_run:
-        print(f"  [DRY] Would run: {script_name}")
-        return True
+        return True, [f"  [DRY] Would run: {script_name}"]
 
     try:
-        result = subprocess.run(
-            [sys.executable, str(script_path)],
-            cwd=str(VAULT_DIR),
-            capture_output=True,
-            text=True
-        )
-        if result.returncode == 0:
-            # Print condensed output
-            lines = result.stdout.strip().split('\n')
-            for line in lines[-3:]:  # Last 3 lines
-                print(f"    {line}")
-            return True
-        else:
-            print(f"  [FAIL] {script_name}")
-            print(f"    {result.stderr}")
-            return False
+        generator = load_generator(script_name)
+        before = OutputManifest(VAULT_DIR, manifest_name).hashes()
+        index = await asyncio.to_thread(shared.get)
+        stats = await asyncio.to_thread(generator.run, VAULT_DIR, index)
+        shared.runs.append(stats)
+        after = OutputManifest(VAULT_DIR, manifest_name).hashes()
+        return True, [f"    {stats.summary()}", *describe_outputs(before, after)]
     except Exception as e:
-        print(f"  [FAIL] {script_name}: {e}")
-        return False
+        return False, [f"  [FAIL] {script_name}: {e}"]
 
 
-def main():
-    parser = argparse.ArgumentParser(description="Automated Publish Workflow")
-    parser.add_argument("--no-lint", action="store_true", help="Skip linting step")
-    parser.add_argument("--dry-run", action="store_true", help="Show what would be done")
-    parser.add_argument("--no-dialog", action="store_true", help="Don't open Publish dialog")
-    args = parser.parse_args()
+async def run_command(client: ObsidianClient, command_id: str, dry_run: bool,
+                      ok_msg: str, fail_msg: str) -> tuple[bool, list[str]]:
+    """Execute an Obsidian command and report the outcome."""
+    if dry_run:
+        return True, [f"  [DRY] Would execute: {command_id}"]
+    if await client.execute_command(command_id):
+        return True, [f"  [OK] {ok_msg}"]
+    return False, [f"  {fail_msg}"]
+
+
+def vault_walker(exclude: set[str] = frozenset()) -> VaultWalker:
+    """Walker over the vault honoring .orgignore plus `exclude` folder names."""
+    return VaultWalker(VAULT_DIR, IgnoreRules.load(VAULT_DIR, (f"{d}/" for d in exclude)))
+
+
+def vault_markdown(*folders: str, subfolders: bool = False) -> list[Path]:
+    """Markdown files directly inside the given vault folders.
+
+    With `subfolders`, the files one level down instead (e.g. tags/*/).
+    """
+    walker = vault_walker()
+    if subfolders:
+        folders = [f"{folder}/{d}" for folder in folders for d in walker.listdir(folder)[0]]
+    return [Path(path) for folder in folders
+            for _, path in walker.markdown(folder, recursive=False)]
+
+
+def archive_index() -> list[Path]:
+    """archive/index.json, if scripts/archive.py has written one."""
+    path = VAULT_DIR / "archive" / "index.json"
+    return [path] if path.exists() else []
 
-    print("=" * 50)
-    print("Publish Workflow")
-    print("=" * 50)
 
+def event_log() -> Path:
+    """.org-cache/events.jsonl (may not exist; missing files aren't hashed)."""
+    return Path(EventLog(VAULT_DIR).path)
+
+
+def walk_markdown(exclude: set[str] = frozenset()) -> list[Path]:
+    """Every markdown file in the vault that .orgignore doesn't exclude."""
+    return [Path(path) for _, path in vault_walker(exclude).markdown()]
+
+
+def all_vault_markdown(exclude: set[str] = frozenset()) -> list[Path]:
+    """Every markdown file the workflow's steps read (generated ones excluded)."""
+    return [f for f in walk_markdown(exclude) if f.relative_to(VAULT_DIR).as_posix() not in GENERATED_FILES]
+
+
+def indexed_markdown() -> list[Path]:
+    """Every markdown file the shared VaultIndex parses, minus the dashboard's own pages."""
+    skip = (f"{ARCHIVE_DIR}/", f"{DASHBOARD_PAGES_DIR}/")
+    return [f for f in all_vault_markdown(exclude=DEFAULT_EXCLUDED_DIRS)
+            if not f.relative_to(VAULT_DIR).as_posix().startswith(skip)]
+
+
+def show_publish_diff() -> None:
+    """Print publishable files added/modified/deleted since the last publish."""
+    snapshot = PublishSnapshot(VAULT_DIR, SNAPSHOT_FILE)
+    current = snapshot.scan(walk_markdown())
+    snapshot.save()
+    added, modified, deleted = diff_manifests(snapshot.published, current)
+
+    if snapshot.published_at:
+        print(f"Changes since last publish ({snapshot.published_at}):")
+    else:
+        print("No publish recorded yet (run with --mark-published after publishing); all files count as added:")
+    for mark, paths in (("A", added), ("M", modified), ("D", deleted)):
+        for rel in paths:
+            print(f"  {mark} {rel}")
+    print(f"{len(added) + len(modified) + len(deleted)} change(s): {len(added)} added, "
+          f"{len(modified)} modified, {len(deleted)} deleted "
+          f"({len(current)} publishable; {snapshot.stat_count} files checked, {snapshot.read_count} read)")
+
+
+def mark_published() -> None:
+    """Record the current publishable files as the published state."""
+    snapshot = PublishSnapshot(VAULT_DIR, SNAPSHOT_FILE)
+    current = snapshot.scan(walk_markdown())
+    snapshot.mark_published(current)
+    snapshot.save()
+    print(f"Recorded publish snapshot: {len(current)} publishable files.")
+
+
+def build_steps(args, client: ObsidianClient | None, api_available: bool,
+                shared: SharedIndex) -> list[Step]:
+    """The publish workflow as a DAG.
+
+    The generators write disjoint files, so they run together. The Obsidian
+    commands are chained: lint rewrites files, Dataview must see the linted
+    files, and the Publish dialog must come last.
+    """
+    no_api = None if api_available else "API not available"
+
+    def command(command_id, ok_msg, fail_msg):
+        return lambda: run_command(client, command_id, args.dry_run, ok_msg, fail_msg)
+
+    return [
+        Step(
+            "tag-pages", "Generating tag index pages",
+            lambda: run_generator("generate-tag-pages.py", "tag-pages", shared, args.dry_run),
+            inputs=lambda: [SCRIPTS_DIR / "generate-tag-pages.py",
+                            *all_vault_markdown(exclude={"tags", "setup"})],
+            outputs=lambda: [*vault_markdown("tags"), *vault_markdown("tags", subfolders=True)],
+        ),
+        Step(
+            "dashboard", "Generating publish dashboard",
+            lambda: run_generator("generate-publish-dashboard.py", "dashboard", shared, args.dry_run),
+            # Project rollups read tasks anywhere in the vault, so every indexed note counts.
+            # The event log feeds Velocity and gets new status changes appended, so it is both.
+            inputs=lambda: [SCRIPTS_DIR / "generate-publish-dashboard.py", *indexed_markdown(), *archive_index(),
+                            event_log()],
+            outputs=lambda: [VAULT_DIR / "publish-dashboard.md", *vault_markdown(DASHBOARD_PAGES_DIR), event_log()],
+            # This week (Completed, Velocity), the stale cutoff and the generated: stamp move with the day
+            key=lambda: date.today().isoformat(),
+        ),
+        Step(
+            "lint", "Linting all files",
+            command("obsidian-linter:lint-all-files", "Linter executed", "[SKIP] Linter not available"),
+            deps=("tag-pages", "dashboard"),
+            inputs=lambda: all_vault_markdown(),
+            mutates_inputs=True,
+            disabled="--no-lint" if args.no_lint else no_api,
+        ),
+        Step(
+            "dataview", "Refreshing Dataview",
+            command("dataview:dataview-force-refresh-views", "Dataview refreshed", "[SKIP] Dataview not available"),
+            deps=("lint",),
+            inputs=lambda: all_vault_markdown(),
+            disabled=no_api,
+        ),
+        Step(
+            "publish-dialog", "Opening Publish dialog",
+            command("publish:view-changes", "Publish dialog opened", "[FAIL] Could not open Publish dialog"),
+            deps=("dataview",),
+            disabled="--no-dialog" if args.no_dialog else no_api,
+        ),
+    ]
+
+
+async def run_workflow(args, client: ObsidianClient | None) -> None:
+    """Run the publish steps, skipping the ones whose inputs haven't changed."""
     # Check API availability
-    api_available = check_api_available()
+    api_available = bool(client) and await client.check_available()
     if not api_available:
         print("\n[WARN] Obsidian REST API not available.")
         print("       Obsidian must be open for command execution.")
@@ -161,55 +304,99 @@ def main():
             if response.lower() != 'y':
                 sys.exit(1)
 
-    # Step 1: Generate tag pages
-    print("\n[1/5] Generating tag index pages...")
-    run_script("generate-tag-pages.py", args.dry_run)
+    shared = SharedIndex()
+    steps = build_steps(args, client, api_available, shared)
+    pipeline = Pipeline(steps, VAULT_DIR, STATE_FILE, force=args.force, dry_run=args.dry_run)
+    finished = 0
+
+    def report(step: Step, result: StepResult) -> None:
+        nonlocal finished
+        finished += 1
+        prefix = f"\n[{finished}/{len(steps)}] {step.label}..."
+        if result.status == "ran" or result.status == "failed":
+            print(prefix)
+            for line in result.lines:
+                print(line)
+        else:
+            print(f"{prefix} SKIPPED ({result.reason})")
+
+    results = await pipeline.run(report)
+
+    if shared.index is not None:
+        print(f"\nVault index: {shared.index.stats.summary()}")
+
+    if results["publish-dialog"].status == "ran" and not args.dry_run:
+        print("\n" + "=" * 50)
+        print("Ready to publish! Review changes in Obsidian and click Publish.")
+        print("=" * 50)
+        if sys.stdin.isatty():
+            response = input("\nRecord the snapshot for --diff once you have published? [y/N] ")
+            if response.lower() == 'y':
+                mark_published()
+
+    if args.explain:
+        print()
+        for line in pipeline.explain():
+            print(line)
+
+    emit_metrics(args, pipeline, shared)
+
+
+def emit_metrics(args, pipeline: Pipeline, shared: SharedIndex) -> None:
+    """One JSON line each for the index, every generator and the workflow."""
+    path = metrics.metrics_path(args.metrics_file)
+    if not path or args.dry_run:
+        return
+    run_id = metrics.new_run_id()
+    total = Stats("publish")
+    total.started = pipeline.started
+    for result in pipeline.results.values():
+        total.phases[result.name] = result.seconds * 1000
+    total.count("files_hashed", pipeline.hasher.hashed)
+    total.count("cache_hits", pipeline.hasher.reused)
+    total.count("files_stat", pipeline.hasher.hashed + pipeline.hasher.reused)
+    if shared.index is not None:
+        metrics.emit(path, shared.index.stats, VAULT_DIR, run_id)
+    for stats in shared.runs:
+        metrics.emit(path, stats, VAULT_DIR, run_id)
+        total.files_written += stats.files_written
+        total.count("bytes_written", stats.counters.get("bytes_written", 0))
+    steps = {r.name: r.status for r in pipeline.results.values()}
+    metrics.emit(path, total, VAULT_DIR, run_id, steps=steps)
 
-    # Step 2: Generate publish dashboard
-    print("\n[2/5] Generating publish dashboard...")
-    run_script("generate-publish-dashboard.py", args.dry_run)
 
-    # Step 3: Lint (optional)
-    if not args.no_lint and api_available:
-        print("\n[3/5] Linting all files...")
-        if args.dry_run:
-            print("  [DRY] Would execute: obsidian-linter:lint-all-files")
-        else:
-            if execute_command("obsidian-linter:lint-all-files"):
-                print("  [OK] Linter executed")
-            else:
-                print("  [SKIP] Linter not available")
-    else:
-        print("\n[3/5] Linting... SKIPPED")
+def main():
+    parser = argparse.ArgumentParser(description="Automated Publish Workflow")
+    parser.add_argument("--no-lint", action="store_true", help="Skip linting step")
+    parser.add_argument("--dry-run", action="store_true", help="Show what would be done")
+    parser.add_argument("--no-dialog", action="store_true", help="Don't open Publish dialog")
+    parser.add_argument("--force", action="store_true", help="Run every step even if up to date")
+    parser.add_argument("--explain", action="store_true", help="Show why each step ran or was skipped")
+    parser.add_argument("--diff", action="store_true",
+                        help="List publishable files changed since the last publish, then exit")
+    parser.add_argument("--mark-published", action="store_true",
+                        help="Record the current publishable files as published, then exit")
+    metrics.add_argument(parser)
+    args = parser.parse_args()
 
-    # Step 4: Refresh Dataview
-    if api_available:
-        print("\n[4/5] Refreshing Dataview...")
-        if args.dry_run:
-            print("  [DRY] Would execute: dataview:dataview-force-refresh-views")
-        else:
-            if execute_command("dataview:dataview-force-refresh-views"):
-                print("  [OK] Dataview refreshed")
-            else:
-                print("  [SKIP] Dataview not available")
-    else:
-        print("\n[4/5] Refreshing Dataview... SKIPPED (API not available)")
+    if args.diff:
+        show_publish_diff()
+        return
+    if args.mark_published:
+        mark_published()
+        return
 
-    # Step 5: Open Publish dialog
-    if not args.no_dialog and api_available:
-        print("\n[5/5] Opening Publish dialog...")
-        if args.dry_run:
-            print("  [DRY] Would execute: publish:view-changes")
-        else:
-            if execute_command("publish:view-changes"):
-                print("  [OK] Publish dialog opened")
-                print("\n" + "=" * 50)
-                print("Ready to publish! Review changes in Obsidian and click Publish.")
-                print("=" * 50)
-            else:
-                print("  [FAIL] Could not open Publish dialog")
-    else:
-        print("\n[5/5] Opening Publish dialog... SKIPPED")
+    print("=" * 50)
+    print("Publish Workflow")
+    print("=" * 50)
+
+    api_key = get_api_key()
+    client = ObsidianClient(api_key, get_api_url(), timeout=REST_API_TIMEOUT) if api_key else None
+    try:
+        asyncio.run(run_workflow(args, client))
+    finally:
+        if client:
+            client.close()
 
     print("\nDone!")
 
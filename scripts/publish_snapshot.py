@@ -0,0 +1,92 @@
+"""
+Local record of what was last published, for a fast "what changed" answer.
+
+After a publish, `mark_published()` stores a path -> content hash map of
+every publishable note (frontmatter `publish: true`). Diffing a fresh
+`scan()` against `published` gives the added, modified and deleted paths,
+i.e. what Obsidian Publish will show in its change dialog.
+
+The scan is stat-first: each file's size, mtime, hash and publish flag are
+cached, so only files that changed since the last scan are read. The flag
+is found with a byte search of the frontmatter block; no YAML parsing.
+"""
+
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import Iterable
+
+from pipeline import hash_bytes
+
+SNAPSHOT_VERSION = 1
+
+# `publish: true` (or yes) as a top-level frontmatter key
+PUBLISH_FLAG = re.compile(rb"^publish:[ \t]*[\"']?(?:true|yes)[\"']?[ \t]*\r?$", re.M | re.I)
+
+
+def is_publishable(data: bytes) -> bool:
+    """True if the note's frontmatter sets `publish: true`."""
+    if not data.startswith(b"---"):
+        return False
+    end = data.find(b"\n---", 3)
+    if end == -1:
+        return False
+    return PUBLISH_FLAG.search(data, 3, end) is not None
+
+
+class PublishSnapshot:
+    """Last-published hashes plus a stat cache of the vault's notes."""
+
+    def __init__(self, root: Path, state_file: Path):
+        self.root = root
+        self.state_file = state_file
+        state = self._load()
+        self.published: dict[str, str] = state["published"]
+        self.published_at: str | None = state["published_at"]
+        self.cache: dict[str, list] = state["cache"]  # rel -> [size, mtime_ns, hash, publishable]
+        self.stat_count = 0
+        self.read_count = 0
+
+    def _load(self) -> dict:
+        try:
+            state = json.loads(self.state_file.read_text(encoding="utf-8"))
+            if state.get("version") == SNAPSHOT_VERSION:
+                return state
+        except (OSError, ValueError):
+            pass
+        return {"version": SNAPSHOT_VERSION, "published": {}, "published_at": None, "cache": {}}
+
+    def save(self) -> None:
+        state = {"version": SNAPSHOT_VERSION, "published_at": self.published_at,
+                 "published": self.published, "cache": self.cache}
+        self.state_file.write_text(json.dumps(state, indent=1, sort_keys=True), encoding="utf-8")
+
+    def scan(self, paths: Iterable[Path]) -> dict[str, str]:
+        """rel -> hash for every publishable file among `paths`."""
+        current = {}
+        seen = set()
+        for path in paths:
+            rel = path.relative_to(self.root).as_posix()
+            seen.add(rel)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            self.stat_count += 1
+            entry = self.cache.get(rel)
+            if not entry or entry[0] != st.st_size or entry[1] != st.st_mtime_ns:
+                data = path.read_bytes()
+                self.read_count += 1
+                entry = [st.st_size, st.st_mtime_ns, hash_bytes(data), is_publishable(data)]
+                self.cache[rel] = entry
+            if entry[3]:
+                current[rel] = entry[2]
+        for rel in [r for r in self.cache if r not in seen]:
+            del self.cache[rel]
+        return current
+
+    def mark_published(self, current: dict[str, str]) -> None:
+        self.published = dict(current)
+        self.published_at = time.strftime("%Y-%m-%d %H:%M")
@@ -16,22 +16,37 @@ FEATURES:
 - Skips if org system doesn't exist (graceful degradation)
 - Skips if "No maintenance needed" already stated
 - Handles stop_hook_active flag to prevent infinite loops
-- Detects KB files at root that may need organization
+- Detects KB files at root that may need organization (cached in
+  .org-cache/maintenance-check.json until knowledge/ or its README changes)
+- Keeps reminders/ tidy on every stop: advances repeating reminders and
+  moves completed/dismissed ones to reminders/completed/ (see
+  orglib/reminders.py; set CLAUDE_ORG_REMINDER_UPKEEP=0 to turn it off)
+- Asks the org daemon (org-daemon.py) for both when one is running for the
+  org dir, and falls back to doing the work itself when it isn't
 - Uses proper JSON protocol for Claude Code hooks
+- Optional JSON-lines metrics (set CLAUDE_ORG_METRICS=/path/to/metrics.jsonl)
 
 INSTALLATION:
-1. Copy this file to your hooks folder:
+1. Copy this file, and the orglib/ folder beside it, to your hooks folder:
    - macOS/Linux: ~/.claude/hooks/maintenance-check.py
    - Windows: %USERPROFILE%\\.claude\\hooks\\maintenance-check.py
+   (python setup/install.py does both)
 
 2. Add to Claude Code settings.json:
 
    {
      "hooks": {
-       "Stop": {
-         "command": "python ~/.claude/hooks/maintenance-check.py",
-         "timeout": 5000
-       }
+       "Stop": [
+         {
+           "hooks": [
+             {
+               "type": "command",
+               "command": "python ~/.claude/hooks/maintenance-check.py",
+               "timeout": 5
+             }
+           ]
+         }
+       ]
      }
    }
 
@@ -53,35 +68,40 @@ import sys
 import os
 import re
 
+from orglib import Stats, VaultWalker, daemon, metrics
+from orglib import reminders
+from orglib.hookcache import ResultCache, fingerprint
+from orglib.sections import HeadingIndex
+
 # Customize this path to your org system location
-ORG_DIR = os.path.expanduser("~/Documents/claude-org")
+# (the CLAUDE_ORG_DIR environment variable overrides it)
+ORG_DIR = os.path.expanduser(os.environ.get("CLAUDE_ORG_DIR", "~/Documents/claude-org"))
 
 # Minimum transcript lines before triggering maintenance check
 # Avoids nagging on quick "hello" or single-command sessions
 TRIVIAL_SESSION_THRESHOLD = 15
 
+# Share of the hook's 5000 ms timeout the reminder pass may use;
+# reminders it doesn't reach are handled on the next stop
+REMINDER_BUDGET_MS = 1000
 
-def get_documented_cross_cutting(org_dir: str) -> set:
-    """Parse knowledge/README.md to find files documented as cross-cutting."""
-    readme_path = os.path.join(org_dir, "knowledge", "README.md")
-    if not os.path.exists(readme_path):
-        return set()
+# Work counters for this invocation (emitted only if CLAUDE_ORG_METRICS is set)
+STATS = Stats("maintenance-check")
 
-    try:
-        with open(readme_path, 'r', encoding='utf-8') as f:
-            content = f.read()
 
-        # Find "## Root Level" section and extract backtick-quoted filenames
-        root_match = re.search(r'## Root Level\n(.*?)(?=\n## |\Z)', content, re.DOTALL)
-        if not root_match:
-            return set()
+def get_documented_cross_cutting(org_dir: str) -> set:
+    """Parse knowledge/README.md to find files documented as cross-cutting."""
+    index = HeadingIndex.load(os.path.join(org_dir, "knowledge", "README.md"), stats=STATS)
 
-        # Extract filenames from backticks: `filename.md`
-        filenames = re.findall(r'`([^`]+\.md)`', root_match.group(1))
-        return set(filenames)
-    except Exception:
+    # Find "## Root Level" section and extract backtick-quoted filenames
+    root_level = index.section('Root Level') if index else None
+    if root_level is None:
         return set()
 
+    # Extract filenames from backticks: `filename.md`
+    filenames = re.findall(r'`([^`]+\.md)`', root_level)
+    return set(filenames)
+
 
 def check_kb_organization(org_dir: str) -> list:
     """Check for KB files at root that might need organization.
@@ -96,14 +116,28 @@ def check_kb_organization(org_dir: str) -> list:
     documented_cross_cutting = get_documented_cross_cutting(org_dir)
 
     root_files = []
-    for entry in os.scandir(knowledge_dir):
-        if entry.is_file() and entry.name.endswith('.md'):
-            if entry.name not in documented_cross_cutting and entry.name != 'README.md':
-                root_files.append(entry.name.replace('.md', ''))
+    for name in VaultWalker(org_dir).listdir("knowledge")[1]:
+        STATS.files_scanned += 1
+        if name not in documented_cross_cutting and name != 'README.md':
+            root_files.append(name.replace('.md', ''))
 
     return root_files
 
 
+def cached_kb_organization(org_dir: str) -> list:
+    """check_kb_organization, reused until knowledge/ or its README changes."""
+    with STATS.phase('knowledge'):
+        fp = fingerprint(org_dir, files=("knowledge", "knowledge/README.md", ".orgignore"))
+        cache = ResultCache(org_dir, 'maintenance-check')
+        root_kb_files = cache.get(fp)
+        if root_kb_files is None:
+            root_kb_files = check_kb_organization(org_dir)
+            cache.put(fp, root_kb_files)
+        else:
+            STATS.count('cache_hits')
+    return root_kb_files
+
+
 def main():
     # Read hook input from stdin
     try:
@@ -112,6 +146,23 @@ def main():
         # No valid input, allow stop
         sys.exit(0)
 
+    # Reminder upkeep runs on every stop, trivial sessions included; it is
+    # idempotent, so repeated stops cost one header read per reminder
+    upkeep = None
+    upkeep_enabled = os.environ.get("CLAUDE_ORG_REMINDER_UPKEEP", "1") != "0"
+    # A running org daemon does the upkeep and knows the KB signals already
+    with STATS.phase('daemon'):
+        signals = daemon.request(ORG_DIR, 'maintenance', upkeep=upkeep_enabled)
+    if signals is not None:
+        STATS.count('daemon_hits')
+        upkeep = reminders.Changes(signals['advanced'], signals['archived'])
+    elif upkeep_enabled and os.path.isdir(ORG_DIR):
+        try:
+            with STATS.phase('reminders'):
+                upkeep = reminders.maintain(ORG_DIR, stats=STATS, budget_ms=REMINDER_BUDGET_MS)
+        except Exception:
+            pass
+
     # If already continuing from stop hook, don't block again
     # This prevents infinite loops
     if data.get("stop_hook_active"):
@@ -123,9 +174,12 @@ def main():
         sys.exit(0)
 
     try:
-        with open(transcript_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            line_count = content.count('\n')
+        with STATS.phase('transcript'):
+            with open(transcript_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+                line_count = content.count('\n')
+        STATS.count('files_read')
+        STATS.count('bytes_read', len(content))
     except Exception:
         sys.exit(0)
 
@@ -143,7 +197,10 @@ def main():
         sys.exit(0)
 
     # Check KB organization status
-    root_kb_files = check_kb_organization(ORG_DIR)
+    if signals is not None:
+        root_kb_files = signals['root_kb_files']
+    else:
+        root_kb_files = cached_kb_organization(ORG_DIR)
     kb_warning = ""
     if root_kb_files:
         kb_warning = f"""
@@ -153,6 +210,11 @@ def main():
 \u2192 Move to appropriate subfolder, OR
 \u2192 If truly cross-cutting, document in knowledge/README.md under "## Root Level\""""
 
+    if upkeep:
+        kb_warning += f"""
+
+**Reminders tidied:** {len(upkeep.advanced)} repeating reminder(s) advanced, {len(upkeep.archived)} moved to reminders/completed/"""
+
     # Block and prompt for maintenance evaluation
     output = {
         "decision": "block",
@@ -184,4 +246,8 @@ Be aggressive about capture - lost insights are unrecoverable.{kb_warning}"""
 
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    finally:
+        # Also on early sys.exit(0), so skipped runs are measured too
+        metrics.emit(metrics.metrics_path(), STATS, ORG_DIR)
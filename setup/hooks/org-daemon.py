@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Org Daemon - keeps one org dir warm for the hooks (optional)
+
+Every hook run is a fresh interpreter that lists folders and reads
+frontmatter from scratch. This long-lived process keeps the parsed notes
+in memory instead, follows changes with inotify and answers the hooks
+over a Unix socket at <org dir>/.org-cache/daemon.sock (protocol and
+queries: orglib/daemon.py). session-start.py and maintenance-check.py ask
+it first and fall back to their own scan when it isn't running, so the
+daemon can be started and stopped at any time.
+
+FEATURES:
+- Same output as the hooks: it runs their own code (session-start.py and
+  maintenance-check.py beside this file), with parsed notes kept between
+  queries
+- Only folders the hooks' walker would enter are watched (no hidden
+  folders, node_modules or .orgignore'd trees), keeping inotify watches
+  for the notes that matter
+- Notes are dropped from memory as inotify reports them changed; pending
+  events are drained before every answer, so a file saved just before a
+  query is always seen
+- Without inotify (macOS, Windows) the vault is fingerprinted by mtime on
+  each query instead (orglib/hookcache.py)
+- Refuses to start when another daemon already serves the org dir
+
+USAGE:
+   python ~/.claude/hooks/org-daemon.py                 # serve ~/Documents/claude-org
+   python ~/.claude/hooks/org-daemon.py --vault ~/org
+   python ~/.claude/hooks/org-daemon.py --query tasks   # ask a running daemon
+
+   Run it from your login session, e.g. a systemd user service:
+
+   [Service]
+   ExecStart=/usr/bin/python3 %h/.claude/hooks/org-daemon.py
+   Restart=on-failure
+"""
+
+import argparse
+import importlib.util
+import io
+import json
+import os
+import selectors
+import signal
+import socket
+import sys
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from orglib import daemon, reminders
+from orglib.hookcache import fingerprint
+from orglib.inotify import OVERFLOW, Watcher
+from orglib.walk import IGNORE_FILE, VaultWalker
+
+# Customize this path to your org system location
+# (the CLAUDE_ORG_DIR environment variable overrides it)
+ORG_DIR = os.path.expanduser(os.environ.get("CLAUDE_ORG_DIR", "~/Documents/claude-org"))
+
+HOOKS_DIR = Path(__file__).resolve().parent
+
+# Largest request accepted from a client
+MAX_REQUEST = 64 * 1024
+
+
+def load_hook(file_name: str):
+    """Import a hook script (hyphenated file name) as a module."""
+    path = HOOKS_DIR / file_name
+    spec = importlib.util.spec_from_file_location(path.stem.replace("-", "_"), path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class OrgService:
+    """Query answers for one org dir, kept fresh by file change events."""
+
+    def __init__(self, org_dir: str):
+        self.org_dir = org_dir
+        self.start = load_hook("session-start.py")
+        self.stop = load_hook("maintenance-check.py")
+        self.start.DOC_CACHE = {}
+        self.orientation: tuple[str, float] | None = None
+        self.root_kb_files: list | None = None
+        self.watcher = Watcher(org_dir) if Watcher.available() else None
+        self.fp = None
+
+    def invalidate(self, paths: set[str] | None = None) -> None:
+        """Forget what `paths` affect (everything if None or events were lost)."""
+        self.orientation = None
+        self.root_kb_files = None
+        self.start.walker.cache_clear()
+        if paths is None or OVERFLOW in paths:
+            self.start.DOC_CACHE.clear()
+            return
+        for path in paths:
+            self.start.DOC_CACHE.pop(path, None)
+            if not path.endswith(".md"):
+                # A folder was moved or removed: drop the notes below it
+                prefix = path + os.sep
+                for cached in [p for p in self.start.DOC_CACHE if p.startswith(prefix)]:
+                    del self.start.DOC_CACHE[cached]
+
+    def refresh(self) -> None:
+        """Apply changes made since the last query."""
+        if self.watcher is not None:
+            changed = self.watcher.read()
+            if changed:
+                if IGNORE_FILE in {os.path.relpath(p, self.org_dir) for p in changed if p}:
+                    # Watch folders the new .orgignore no longer hides
+                    self.watcher.retarget(VaultWalker(self.org_dir))
+                self.invalidate(changed)
+            return
+        fp = fingerprint(self.org_dir, self.start.WATCHED_FOLDERS, self.start.WATCHED_FILES)
+        if fp.key != self.fp:
+            self.fp = fp.key
+            self.invalidate()
+
+    def answer(self, request: dict):
+        query = request.get("query")
+        if query == "ping":
+            return "pong"
+        self.refresh()
+        if query == "orientation":
+            if self.orientation is None or time.time() >= self.orientation[1]:
+                buffer = io.StringIO()
+                with redirect_stdout(buffer):
+                    valid_until = self.start.orient(self.org_dir)
+                self.orientation = (buffer.getvalue(), valid_until)
+            return self.orientation[0]
+        if query == "maintenance":
+            changes = reminders.Changes()
+            if request.get("upkeep", True):
+                changes = reminders.maintain(self.org_dir, budget_ms=self.stop.REMINDER_BUDGET_MS)
+                if changes:
+                    self.refresh()
+            if self.root_kb_files is None:
+                self.root_kb_files = self.stop.check_kb_organization(self.org_dir)
+            return {"advanced": changes.advanced, "archived": changes.archived,
+                    "root_kb_files": self.root_kb_files}
+        if query == "tasks":
+            return {status: [doc.name for doc in docs]
+                    for status, docs in self.start.scan_tasks(self.org_dir).items()}
+        if query == "reminders":
+            due = self.start.scan_reminders(self.org_dir)
+            return {bucket: [{"name": doc.name, "remind-at": doc.get("remind-at")} for doc in due[bucket]]
+                    for bucket in ("overdue", "due_today", "due_soon")}
+        raise ValueError(f"unknown query: {query!r}")
+
+    def handle(self, conn: socket.socket) -> None:
+        conn.settimeout(daemon.TIMEOUT)
+        with conn:
+            try:
+                data = b""
+                while not data.endswith(b"\n") and len(data) < MAX_REQUEST:
+                    chunk = conn.recv(4096)
+                    if not chunk:
+                        break
+                    data += chunk
+                try:
+                    reply = {"ok": True, "value": self.answer(json.loads(data))}
+                except Exception as e:
+                    reply = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+                conn.sendall(json.dumps(reply, ensure_ascii=False).encode("utf-8") + b"\n")
+            except OSError:
+                pass
+
+
+def serve(org_dir: str) -> int:
+    path = daemon.socket_path(org_dir)
+    if daemon.request(org_dir, "ping", timeout=0.5) == "pong":
+        print(f"A daemon is already serving {org_dir}", file=sys.stderr)
+        return 1
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if os.path.exists(path):
+        os.unlink(path)  # left behind by a daemon that didn't exit cleanly
+
+    service = OrgService(org_dir)
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)
+    try:
+        listener.bind(path)
+    finally:
+        os.umask(old_umask)
+    listener.listen(16)
+
+    selector = selectors.DefaultSelector()
+    selector.register(listener, selectors.EVENT_READ, "client")
+    if service.watcher is not None:
+        selector.register(service.watcher, selectors.EVENT_READ, "changes")
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+    watching = "inotify" if service.watcher is not None else "mtime fingerprints"
+    print(f"Serving {org_dir} on {path} ({watching})", file=sys.stderr)
+    try:
+        while True:
+            for key, _ in selector.select():
+                if key.data == "changes":
+                    service.refresh()
+                else:
+                    conn, _ = listener.accept()
+                    service.handle(conn)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        listener.close()
+        if os.path.exists(path):
+            os.unlink(path)
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve hook queries for one org dir from memory")
+    parser.add_argument("--vault", default=ORG_DIR, help=f"Org dir (default: {ORG_DIR})")
+    parser.add_argument("--query", choices=["ping", "orientation", "maintenance", "tasks", "reminders"],
+                        help="Ask the running daemon instead of starting one")
+    args = parser.parse_args()
+    org_dir = os.path.abspath(os.path.expanduser(args.vault))
+
+    if args.query:
+        # Don't let a debugging query move reminders around
+        value = daemon.request(org_dir, args.query, upkeep=False)
+        if value is None:
+            print(f"No daemon is serving {org_dir}", file=sys.stderr)
+            sys.exit(1)
+        print(value if isinstance(value, str) else json.dumps(value, indent=1, ensure_ascii=False))
+        return
+
+    if not hasattr(socket, "AF_UNIX"):
+        print("Unix sockets are not available on this platform; the hooks will scan directly.", file=sys.stderr)
+        sys.exit(1)
+    sys.exit(serve(org_dir))
+
+
+if __name__ == "__main__":
+    main()
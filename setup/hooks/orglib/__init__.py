@@ -0,0 +1,40 @@
+"""
+Shared helpers for the claude-org scripts and hooks.
+
+Standard library only: the hooks must run with a bare interpreter, so
+anything that needs PyYAML (the generators) passes its own parser in.
+
+This package lives next to the hooks because it is installed with them
+(`setup/install.py` copies it to ~/.claude/hooks/orglib). The scripts in
+`scripts/` import it from `setup/hooks/` inside the org dir.
+"""
+
+from importlib import import_module
+
+from .archive import ArchiveIndex
+from .dates import DateIndex
+from .doc import Doc
+from .frontmatter import FrontmatterReader, yaml_loader
+from .projects import ProjectIndex
+from .stats import Stats
+from .vault import VaultIndex
+from .walk import IgnoreRules, VaultWalker
+
+__all__ = ["ArchiveIndex", "DateIndex", "Doc", "EventLog", "FrontmatterReader", "IgnoreRules", "OutputManifest",
+           "ProjectIndex", "Stats", "VaultIndex", "VaultWalker", "Velocity", "diff_manifests", "sparkline",
+           "write_atomic", "yaml_loader"]
+
+# Output and timeline helpers are only used by the generators. They pull in
+# hashlib, tempfile and statistics, so they are imported on first use to
+# keep hook startup lean.
+_LAZY = {"OutputManifest": ".manifest", "diff_manifests": ".manifest", "write_atomic": ".output",
+         "EventLog": ".timeline", "Velocity": ".timeline", "sparkline": ".timeline"}
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,74 @@
+"""
+Index of archived notes.
+
+`scripts/archive.py` moves old completed tasks and reminders and processed
+inbox items out of the live folders into `archive/`, either one file per
+note in monthly folders or packed into one bundle file per month. Either
+way it records every moved note in `archive/index.json`, keyed by the
+note's original path:
+
+    {"version": 1, "items": {"tasks/completed/fix-login.md": {
+        "path": "archive/tasks/2026-01.md", "anchor": "fix-login",
+        "kind": "tasks", "type": "task", "status": "complete",
+        "title": "Fix login", "created": "2026-01-02",
+        "completed": "2026-01-09", "archived": "2026-04-10"}}}
+
+`anchor` is the note's heading inside a bundle (None for a moved file).
+Readers such as the dashboard resolve links through the index instead of
+scanning the archive.
+"""
+
+import json
+import os
+from typing import Iterator
+
+ARCHIVE_DIR = "archive"
+INDEX_FILE = "index.json"
+INDEX_VERSION = 1
+
+
+class ArchiveIndex:
+    """Original path -> archived location and summary fields."""
+
+    def __init__(self, root: str | os.PathLike):
+        self.root = os.fspath(root)
+        self.path = os.path.join(self.root, ARCHIVE_DIR, INDEX_FILE)
+        self.items: dict[str, dict] = self._load()
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == INDEX_VERSION:
+                return data["items"]
+        except (OSError, ValueError, KeyError):
+            pass
+        return {}
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __contains__(self, rel: str) -> bool:
+        return rel in self.items
+
+    def entries(self, kind: str | None = None) -> Iterator[tuple[str, dict]]:
+        """(original path, entry) pairs, optionally of one kind."""
+        for rel, entry in self.items.items():
+            if kind is None or entry.get("kind") == kind:
+                yield rel, entry
+
+    @staticmethod
+    def link_target(entry: dict) -> str:
+        """Wikilink target of an archived note, e.g. `archive/tasks/2026-01#fix-login`."""
+        target = entry["path"][:-3] if entry["path"].endswith(".md") else entry["path"]
+        return f"{target}#{entry['anchor']}" if entry.get("anchor") else target
+
+    def add(self, rel: str, entry: dict) -> None:
+        self.items[rel] = entry
+
+    def save(self) -> None:
+        from .output import write_atomic
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        data = {"version": INDEX_VERSION, "items": dict(sorted(self.items.items()))}
+        write_atomic(self.path, [json.dumps(data, indent=1, ensure_ascii=False)])
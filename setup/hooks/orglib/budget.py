@@ -0,0 +1,160 @@
+"""
+Size-budgeted rendering of the SessionStart orientation.
+
+The orientation is injected into the context of every session, so its
+size is paid on every start, and a vault with hundreds of active tasks
+or reminders would otherwise print all of them. An Orientation collects
+sections in display order, each with a priority (lower numbers matter
+more), and renders as much as fits a budget:
+
+    out = Orientation(parse_budget(os.environ.get("CLAUDE_ORG_BUDGET"), 16000))
+    out.add(Section(2, ["### Active Tasks"], top(lines, out.limit, key=rank),
+                    total=len(lines), tail=[""]))
+    print(out.render(), end="")
+
+Budgets are characters (`16000`) or estimated tokens (`4000t`, at four
+characters per token); `0` or `none` turns the limit off. Rendering is
+two passes over the sections in priority order: first each section's
+heading, footer and "+N more" line are reserved (a section whose frame
+doesn't fit is left out), then item lines are filled in while they fit.
+A section that can't show all its items ends with "+N more"; one that
+can shows no such line and the space it reserved goes to the next.
+
+Items arrive ranked best first. `top()` picks the best k of n with a
+bounded heap (O(n log k)), and `Orientation.limit` bounds k by how many
+item lines could fit at all, so ranking thousands of tasks costs little
+more than one pass over them.
+"""
+
+import heapq
+from dataclasses import dataclass, field
+from typing import Callable, Iterable
+
+CHARS_PER_TOKEN = 4
+
+# Shortest item line worth counting on (`- **x**`); bounds what top() keeps
+MIN_LINE = 8
+
+
+def parse_budget(value: str | None, default: int | None) -> int | None:
+    """Budget in characters from `8000`, `2000t` (tokens) or `0`/`none` (None: unlimited)."""
+    if value is None or not value.strip():
+        return default
+    text = value.strip().lower()
+    if text in ("0", "none", "off"):
+        return None
+    tokens = text.endswith("t")
+    try:
+        n = int(text[:-1] if tokens else text)
+    except ValueError:
+        return default
+    if n <= 0:
+        return None
+    return n * CHARS_PER_TOKEN if tokens else n
+
+
+def top(items: Iterable, k: int | None, key: Callable) -> list:
+    """The k smallest items by `key`, in order (all of them, sorted, if k is None)."""
+    if k is None:
+        return sorted(items, key=key)
+    return heapq.nsmallest(k, items, key=key)
+
+
+def cost(lines: list[str]) -> int:
+    return sum(len(line) + 1 for line in lines)
+
+
+@dataclass
+class Section:
+    """Heading lines, ranked item lines and footer lines of one block.
+
+    `total` is how many items there are in all, which may be more than
+    `items` holds when only the best were kept. `more` is the line shown
+    for the items left out ({n}: how many). With `order`, the items are
+    ranked for selection but the ones shown are sorted by that key.
+    """
+    priority: int
+    head: list[str]
+    items: list[str] = field(default_factory=list)
+    total: int | None = None
+    more: str = "- _+{n} more_"
+    tail: list[str] = field(default_factory=list)
+    order: Callable | None = None
+
+    def __post_init__(self):
+        if self.total is None:
+            self.total = len(self.items)
+
+
+class Orientation:
+    """Sections in display order, rendered within a character budget."""
+
+    def __init__(self, budget: int | None):
+        self.budget = budget
+        self.sections: list[Section] = []
+
+    @property
+    def limit(self) -> int | None:
+        """Most items of one section that could be shown (None: no limit)."""
+        return None if self.budget is None else self.budget // MIN_LINE + 1
+
+    def add(self, section: Section) -> None:
+        self.sections.append(section)
+
+    def render(self) -> str:
+        """The sections that fit, in display order."""
+        shown = self.allocate()
+        lines = []
+        for section in self.sections:
+            count = shown.get(id(section))
+            if count is None:
+                continue
+            items = section.items[:count]
+            if section.order is not None:
+                items = sorted(items, key=section.order)
+            lines += section.head + items
+            if count < section.total:
+                lines.append(section.more.format(n=section.total - count))
+            lines += section.tail
+        return "".join(line + "\n" for line in lines)
+
+    def allocate(self) -> dict[int, int]:
+        """{id(section): items shown} for the sections that fit."""
+        if self.budget is None:
+            return {id(s): len(s.items) for s in self.sections}
+        ranked = sorted(self.sections, key=lambda s: s.priority)  # stable: ties keep display order
+        left = self.budget
+        framed = []
+        for section in ranked:
+            need = cost(section.head + section.tail) + self._more_cost(section)
+            if need <= left:
+                left -= need
+                framed.append(section)
+        shown = {}
+        for section in framed:
+            more = self._more_cost(section)
+            count = self._fit(section.items, left + more)
+            if count < section.total:
+                count = self._fit(section.items, left)
+                more = 0
+            left -= cost(section.items[:count]) - more
+            shown[id(section)] = count
+        return shown
+
+    @staticmethod
+    def _more_cost(section: Section) -> int:
+        """Space for the "+N more" line at its widest (nothing if there are no items)."""
+        if not section.total:
+            return 0
+        return len(section.more.format(n=section.total)) + 1
+
+    @staticmethod
+    def _fit(items: list[str], room: int) -> int:
+        """How many leading items fit in `room` characters."""
+        count = 0
+        for item in items:
+            room -= len(item) + 1
+            if room < 0:
+                break
+            count += 1
+        return count
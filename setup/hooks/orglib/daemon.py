@@ -0,0 +1,62 @@
+"""
+Client side of the optional org daemon (`setup/hooks/org-daemon.py`).
+
+The daemon keeps one org dir's notes parsed in memory, follows changes
+with inotify and answers queries on a Unix socket at
+`<org dir>/.org-cache/daemon.sock`. One request per connection, one JSON
+line each way:
+
+    -> {"query": "orientation"}
+    <- {"ok": true, "value": "<session-context ...>"}
+
+Queries:
+  ping          "pong"
+  orientation   the SessionStart orientation text
+  maintenance   {"advanced": [...], "archived": [...], "root_kb_files": [...]};
+                runs the reminder upkeep pass first unless "upkeep": false
+  tasks         {status: [task names]}
+  reminders     {"overdue": [...], "due_today": [...], "due_soon": [...]},
+                each item {"name", "remind-at"}
+
+`request()` returns None whenever the daemon can't answer (not running,
+stale socket, timeout, error reply, no AF_UNIX on this platform), and
+the hooks then do their own scan. It only needs socket and json, so the
+hooks can import it unconditionally.
+"""
+
+import json
+import os
+import socket
+
+from .notecache import CACHE_DIR
+
+SOCKET_NAME = "daemon.sock"
+TIMEOUT = 2.0
+
+
+def socket_path(org_dir: str | os.PathLike) -> str:
+    return os.path.join(os.fspath(org_dir), CACHE_DIR, SOCKET_NAME)
+
+
+def request(org_dir: str | os.PathLike, query: str, timeout: float = TIMEOUT, **args):
+    """The daemon's answer to `query`, or None if there is no usable daemon."""
+    path = socket_path(org_dir)
+    if not hasattr(socket, "AF_UNIX") or not os.path.exists(path):
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(path)
+            sock.sendall(json.dumps({"query": query, **args}).encode("utf-8") + b"\n")
+            chunks = []
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        reply = json.loads(b"".join(chunks))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(reply, dict) or not reply.get("ok"):
+        return None
+    return reply.get("value")
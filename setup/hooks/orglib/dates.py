@@ -0,0 +1,200 @@
+"""
+Date index over note frontmatter: created, updated, completed, touched.
+
+Each field keeps one column of (day ordinal, path) pairs kept sorted, so
+"completed this week", "not updated in 90 days" and "newest ten" are
+bisect range queries rather than a sort of the vault. `touched` is
+`updated` when present, else the file's mtime day: the date the
+dashboard's Recent Knowledge has always used.
+
+Notes are added, replaced and removed one at a time, so the index can be
+kept up to date incrementally. Generators build it from a VaultIndex in
+memory (`from_docs`). The hooks, which never parse the whole vault, use
+`DateIndex.cached(root)`: the index is saved in `.org-cache/dates.json`
+with each note's mtime (see notecache), and on the next run only notes
+whose mtime changed are re-read. Only their header is read, parsed without
+PyYAML by `frontmatter.parse_simple` and normalized through the note
+type's schema, so the dates here are the ones check-frontmatter accepts.
+"""
+
+import os
+import re
+from bisect import bisect_left, insort
+from datetime import date, datetime
+from typing import Callable, Iterable, Iterator
+
+from .frontmatter import FrontmatterReader, parse_simple
+from .notecache import note_records
+from .schema import SCHEMAS
+from .vault import DEFAULT_EXCLUDED_DIRS, EXCLUDED_PATHS
+from .walk import IgnoreRules, VaultWalker
+
+FIELDS = ("created", "updated", "completed", "touched")
+CACHE_VERSION = 2
+
+DAY = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+# rel, entry -> keep?
+Filter = Callable[[str, tuple], bool]
+
+
+def day_ordinal(value) -> int | None:
+    """Day ordinal of a date/datetime or of text starting with YYYY-MM-DD."""
+    if value is None:
+        return None
+    if isinstance(value, date):
+        return value.toordinal()
+    match = DAY.match(str(value))
+    if not match:
+        return None
+    try:
+        return date.fromisoformat(match.group()).toordinal()
+    except ValueError:
+        return None
+
+
+def mtime_ordinal(mtime: float) -> int:
+    return datetime.fromtimestamp(mtime).toordinal()
+
+
+class DateIndex:
+    """Sorted per-field date columns over a set of notes.
+
+    `entries` maps a vault-relative path to (type, created, updated,
+    completed, touched), the dates as day ordinals or None.
+    """
+
+    def __init__(self):
+        self.entries: dict[str, tuple] = {}
+        self._columns: dict[str, list[tuple[int, str]]] = {f: [] for f in FIELDS}
+        self._sorted = True
+
+    def add(self, rel: str, type: str | None, created=None, updated=None,
+            completed=None, mtime: float | None = None) -> None:
+        """Insert or replace a note; dates may be dates, ISO text or None."""
+        if rel in self.entries:
+            self.remove(rel)
+        updated = day_ordinal(updated)
+        touched = updated if updated is not None else (mtime_ordinal(mtime) if mtime else None)
+        entry = (type, day_ordinal(created), updated, day_ordinal(completed), touched)
+        self.entries[rel] = entry
+        for field, value in zip(FIELDS, entry[1:]):
+            if value is not None:
+                if self._sorted:
+                    insort(self._columns[field], (value, rel))
+                else:
+                    self._columns[field].append((value, rel))
+
+    def remove(self, rel: str) -> None:
+        entry = self.entries.pop(rel, None)
+        if entry is None:
+            return
+        for field, value in zip(FIELDS, entry[1:]):
+            if value is None:
+                continue
+            column = self._columns[field]
+            if self._sorted:
+                i = bisect_left(column, (value, rel))
+                if i < len(column) and column[i] == (value, rel):
+                    del column[i]
+            else:
+                column.remove((value, rel))
+
+    def _bulk(self) -> "DateIndex":
+        """Append without sorting until the next query (for initial loads)."""
+        self._sorted = False
+        return self
+
+    def _column(self, field: str) -> list[tuple[int, str]]:
+        if not self._sorted:
+            for column in self._columns.values():
+                column.sort()
+            self._sorted = True
+        return self._columns[field]
+
+    @classmethod
+    def from_docs(cls, docs: Iterable) -> "DateIndex":
+        """Index of orglib Docs (generators, from a VaultIndex)."""
+        index = cls()._bulk()
+        for doc in docs:
+            index.add(doc.rel, doc.type, doc.created, doc.updated, doc.completed, doc.mtime)
+        return index
+
+    def between(self, field: str, start: date | None = None, end: date | None = None,
+                where: Filter | None = None) -> Iterator[tuple[int, str]]:
+        """(ordinal, rel) with start <= field < end, oldest first."""
+        column = self._column(field)
+        lo = 0 if start is None else bisect_left(column, (start.toordinal(), ""))
+        hi = len(column) if end is None else bisect_left(column, (end.toordinal(), ""))
+        for i in range(lo, hi):
+            value, rel = column[i]
+            if where is None or where(rel, self.entries[rel]):
+                yield value, rel
+
+    def newest(self, field: str, n: int, where: Filter | None = None) -> list[tuple[int, str]]:
+        """Up to `n` (ordinal, rel) with the latest `field`, newest first."""
+        column = self._column(field)
+        result = []
+        for i in range(len(column) - 1, -1, -1):
+            if len(result) >= n:
+                break
+            value, rel = column[i]
+            if where is None or where(rel, self.entries[rel]):
+                result.append((value, rel))
+        return result
+
+    def count(self, field: str, start: date | None = None, end: date | None = None,
+              where: Filter | None = None) -> int:
+        if where is None:
+            column = self._column(field)
+            lo = 0 if start is None else bisect_left(column, (start.toordinal(), ""))
+            hi = len(column) if end is None else bisect_left(column, (end.toordinal(), ""))
+            return hi - lo
+        return sum(1 for _ in self.between(field, start, end, where))
+
+    def histogram(self, field: str, start: date, weeks: int,
+                  where: Filter | None = None) -> list[int]:
+        """Counts per 7-day bucket from `start`, one range scan."""
+        counts = [0] * weeks
+        first = start.toordinal()
+        end = date.fromordinal(first + 7 * weeks)
+        for value, _ in self.between(field, start, end, where):
+            counts[(value - first) // 7] += 1
+        return counts
+
+    @classmethod
+    def cached(cls, root: str | os.PathLike, walker: VaultWalker | None = None,
+               reader: FrontmatterReader | None = None, stats=None) -> "DateIndex":
+        """Index of every note under `root`, refreshed from `.org-cache/dates.json`.
+
+        Every note is stat'ed; only new or modified ones are read. The
+        default walker skips the same folders as VaultIndex, archive/
+        included: its notes are past every range the hooks ask about.
+        """
+        root = os.fspath(root)
+        if walker is None:
+            skip = [f"{d}/" for d in DEFAULT_EXCLUDED_DIRS] + list(EXCLUDED_PATHS)
+            walker = VaultWalker(root, IgnoreRules.load(root, skip))
+        records = note_records(root, "dates.json", CACHE_VERSION, walker.markdown(), cls._parse_record,
+                               reader, stats)
+        index = cls()._bulk()
+        for rel, record in records.items():
+            index._add_record(rel, record)
+        return index
+
+    @staticmethod
+    def _parse_record(text: str | None, st: os.stat_result) -> list:
+        """[type, created, updated, completed, touched] for one note."""
+        keys = parse_simple(text) if text else {}
+        SCHEMAS.normalize("", keys)  # problems are check-frontmatter's to report
+        updated = day_ordinal(keys.get("updated"))
+        touched = updated if updated is not None else mtime_ordinal(st.st_mtime)
+        return [keys.get("type") or None, day_ordinal(keys.get("created")),
+                updated, day_ordinal(keys.get("completed")), touched]
+
+    def _add_record(self, rel: str, record: list) -> None:
+        entry = tuple(record[1:])
+        self.entries[rel] = entry
+        for field, value in zip(FIELDS, entry[1:]):
+            if value is not None:
+                self._columns[field].append((value, rel))
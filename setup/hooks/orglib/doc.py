@@ -0,0 +1,123 @@
+"""
+Compact per-note record shared by every scanner.
+
+A Doc keeps only what the generators and hooks read, in `__slots__`
+attributes, instead of the whole parsed frontmatter dict plus bookkeeping
+keys. Repeated short strings (type, status, tags, folder names) are
+interned, so 100k notes tagged `meeting` share one `"meeting"` object. The
+path is stored as a vault-relative string; build a Path only when needed.
+"""
+
+import re
+import sys
+from datetime import date
+
+# Frontmatter keys that get their own slot; everything else goes to `extra`
+CORE_KEYS = frozenset({"type", "status", "title", "tags", "created", "updated", "completed", "blocked-by"})
+
+# Short string values in `extra` (sources, repeat rules, project names) are interned
+INTERN_MAX_LEN = 64
+
+TAG_SPLIT = re.compile(r"[,\s]+")
+
+
+def intern_str(value) -> str | None:
+    """Interned str() of a value, or None for empty values."""
+    if value is None or value == "":
+        return None
+    return sys.intern(str(value))
+
+
+def as_date_text(value) -> str | None:
+    """ISO text for a date field, whether YAML gave a date or a string."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, date):  # also datetime
+        return value.isoformat()
+    return str(value)
+
+
+def as_str_tuple(value, split: bool = False) -> tuple[str, ...]:
+    """Interned tuple from a list, a scalar, or (with `split`) a comma/space list."""
+    if not value:
+        return ()
+    if isinstance(value, str):
+        items = TAG_SPLIT.split(value) if split else [value]
+    elif isinstance(value, (list, tuple)):
+        items = value
+    else:
+        items = [value]
+    return tuple(sys.intern(str(v).strip()) for v in items if v is not None and str(v).strip())
+
+
+class Doc:
+    """One note: identity, the fields every tool reads, and leftovers in `extra`."""
+
+    __slots__ = ("id", "rel", "type", "status", "title", "tags", "created",
+                 "updated", "completed", "blocked_by", "mtime", "extra")
+
+    def __init__(self, doc_id: int, rel: str, mtime: float, type: str | None = None,
+                 status: str | None = None, title: str | None = None, tags: tuple = (),
+                 created: str | None = None, updated: str | None = None,
+                 completed: str | None = None, blocked_by: tuple = (), extra: dict | None = None):
+        self.id = doc_id
+        self.rel = rel
+        self.mtime = mtime
+        self.type = type
+        self.status = status
+        self.title = title
+        self.tags = tags
+        self.created = created
+        self.updated = updated
+        self.completed = completed
+        self.blocked_by = blocked_by
+        self.extra = extra
+
+    @classmethod
+    def from_frontmatter(cls, doc_id: int, rel: str, frontmatter: dict, mtime: float) -> "Doc":
+        """Build a Doc from parsed frontmatter (YAML or the hooks' regex parser)."""
+        fm = frontmatter
+        extra = None
+        for key, value in fm.items():
+            if key in CORE_KEYS:
+                continue
+            if isinstance(value, str) and len(value) <= INTERN_MAX_LEN:
+                value = sys.intern(value)
+            if extra is None:
+                extra = {}
+            extra[sys.intern(str(key))] = value
+        title = fm.get("title")
+        return cls(
+            doc_id, rel, mtime,
+            type=intern_str(fm.get("type")),
+            status=intern_str(fm.get("status")),
+            title=str(title) if title else None,
+            tags=as_str_tuple(fm.get("tags"), split=True),
+            created=as_date_text(fm.get("created")),
+            updated=as_date_text(fm.get("updated")),
+            completed=as_date_text(fm.get("completed")),
+            blocked_by=as_str_tuple(fm.get("blocked-by")),
+            extra=extra,
+        )
+
+    @property
+    def name(self) -> str:
+        """Filename without .md."""
+        return self.rel.rpartition("/")[2][:-3]
+
+    @property
+    def folder(self) -> str:
+        """Vault-relative folder ('' for the vault root)."""
+        return self.rel.rpartition("/")[0]
+
+    def get(self, key: str, default=None):
+        """Frontmatter-style lookup: `doc.get('remind-at')`, `doc.get('status')`."""
+        if key in CORE_KEYS:
+            value = getattr(self, "blocked_by" if key == "blocked-by" else key)
+            return value if value not in (None, ()) else default
+        if self.extra is None:
+            return default
+        return self.extra.get(key, default)
+
+    def __repr__(self) -> str:
+        return f"Doc({self.id}, {self.rel!r}, type={self.type!r}, status={self.status!r})"
@@ -0,0 +1,124 @@
+"""
+Frontmatter extraction without reading note bodies.
+
+`FrontmatterReader.read(path)` reads the start of a file into one reusable
+bytearray, finds the `---` delimiters with bytes.find and decodes only the
+header. Bodies are never read, decoded or sliced, so a vault of long notes
+(or attachments saved as markdown) costs about one small read per file.
+A header that doesn't fit in the buffer is located through an mmap of the
+file instead.
+
+`yaml_loader(yaml)` returns the fastest safe YAML loader PyYAML offers;
+parsing, not I/O, dominates a vault scan once bodies are skipped.
+The hooks, which run without PyYAML, read the block with
+`parse_simple(text)` instead: one `key: value` per line.
+"""
+
+import mmap
+import os
+from dataclasses import dataclass
+from typing import Callable
+
+DEFAULT_BUFFER = 8192
+
+
+@dataclass(slots=True)
+class Header:
+    """What one read found: frontmatter text (None if absent) and file facts."""
+    text: str | None
+    size: int
+    mtime: float
+    bytes_read: int
+
+
+def _closing_delimiter(data, start: int, end: int, at_eof: bool) -> tuple[int, bool]:
+    """Offset of the newline before the closing `---` in data[start:end].
+
+    Returns (offset, complete): offset -1 means not found; complete False
+    means the search hit `end` before it could decide and needs more data.
+    The delimiter is `---` at the start of a line, optionally followed by
+    spaces or tabs, then a line break or end of file.
+    """
+    pos = start
+    while True:
+        pos = data.find(b"\n---", pos, end)
+        if pos == -1:
+            return -1, at_eof
+        i = pos + 4
+        while i < end and data[i] in b" \t":
+            i += 1
+        if i == end:
+            if at_eof:
+                return pos, True
+            return -1, False
+        if data[i] == 0x0A or (data[i] == 0x0D and i + 1 < end and data[i + 1] == 0x0A):
+            return pos, True
+        if data[i] == 0x0D and i + 1 == end and not at_eof:
+            return -1, False
+        pos += 1
+
+
+class FrontmatterReader:
+    """Reads frontmatter blocks through one reusable buffer (not thread-safe)."""
+
+    def __init__(self, buffer_size: int = DEFAULT_BUFFER):
+        self.buffer = bytearray(buffer_size)
+        self.view = memoryview(self.buffer)
+
+    def read(self, path: str | os.PathLike) -> Header:
+        """Frontmatter text of `path` (decoded header only) plus size and mtime.
+
+        Raises OSError if the file can't be read and UnicodeDecodeError if
+        the header isn't UTF-8.
+        """
+        with open(path, "rb", buffering=0) as f:
+            st = os.fstat(f.fileno())
+            n = f.readinto(self.buffer)
+            at_eof = n >= st.st_size
+            if n < 3 or self.buffer[:3] != b"---":
+                return Header(None, st.st_size, st.st_mtime, n)
+
+            end, complete = _closing_delimiter(self.buffer, 3, n, at_eof)
+            if end != -1:
+                return Header(self.view[3:end].tobytes().decode("utf-8"), st.st_size, st.st_mtime, n)
+            if complete:
+                return Header(None, st.st_size, st.st_mtime, n)
+
+            # Header longer than the buffer: search the mapped file instead
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                end, _ = _closing_delimiter(mm, 3, len(mm), True)
+                if end == -1:
+                    return Header(None, st.st_size, st.st_mtime, st.st_size)
+                return Header(mm[3:end].decode("utf-8"), st.st_size, st.st_mtime, end + 4)
+
+
+def yaml_loader(yaml) -> Callable[[str], object]:
+    """`yaml.safe_load`, using libyaml's CSafeLoader when PyYAML has it."""
+    loader = getattr(yaml, "CSafeLoader", None)
+    if loader is None:
+        return yaml.safe_load
+    return lambda text: yaml.load(text, Loader=loader)
+
+
+def parse_simple(text: str) -> dict:
+    """`key: value` lines of a frontmatter block, without PyYAML (the hooks' parser).
+
+    `[a, b]` becomes a list, `null` or nothing None, and quotes around
+    values and list items are dropped; everything else stays text for
+    the schemas to read. Nested YAML is not understood.
+    """
+    result = {}
+    for line in text.strip().split("\n"):
+        if ":" not in line:
+            continue
+        key, value = line.split(":", 1)
+        key = key.strip()
+        value = value.strip()
+        if value.startswith("[") and value.endswith("]"):
+            inner = value[1:-1].strip()
+            result[key] = [v.strip().strip("\"'") for v in inner.split(",")] if inner else []
+        elif value.lower() == "null" or value == "":
+            result[key] = None
+        else:
+            result[key] = value.strip("\"'")
+    return result
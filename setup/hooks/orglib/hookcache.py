@@ -0,0 +1,127 @@
+"""
+Hook results cached between runs, keyed by a fingerprint of their inputs.
+
+Sessions are short and frequent, and most of them start against an org
+dir nobody has touched since the last one. `fingerprint()` stats the
+folders and files a hook reads (no file is opened) and folds their
+mtimes into a key; `ResultCache` keeps the hook's last result under
+`.org-cache/<name>.json` and hands it back while the key matches:
+
+    fp = fingerprint(root, folders=("tasks", "knowledge"), files=("context/voice.md",))
+    cache = ResultCache(root, "session-start")
+    text = cache.get(fp)
+    if text is None:
+        text = render()
+        cache.put(fp, text, valid_until=next_midnight)
+
+Any edit, new file, deletion or rename under a watched folder changes the
+key. Results that also depend on the clock carry a `valid_until`
+timestamp. A result is not stored while the newest input is younger than
+SETTLE_SECONDS: on filesystems with coarse mtimes, a second write inside
+the same tick would otherwise go unnoticed.
+"""
+
+import json
+import os
+import time
+from typing import Iterable, NamedTuple
+
+from .notecache import CACHE_DIR
+
+CACHE_VERSION = 1
+SETTLE_SECONDS = 2.0
+
+
+class Fingerprint(NamedTuple):
+    key: str
+    newest: float    # newest mtime seen, in seconds
+
+
+def _scan(path: str, acc: list[int], stats=None) -> None:
+    """Fold every entry below `path` into acc = [newest mtime_ns, entry count]."""
+    try:
+        it = os.scandir(path)
+    except OSError:
+        return
+    with it:
+        for entry in it:
+            if entry.name.startswith("."):
+                continue
+            try:
+                mtime = entry.stat(follow_symlinks=False).st_mtime_ns
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+            acc[1] += 1
+            if mtime > acc[0]:
+                acc[0] = mtime
+            if is_dir:
+                _scan(entry.path, acc, stats)
+    if stats is not None:
+        stats.count("dirs_listed")
+
+
+def fingerprint(root: str | os.PathLike, folders: Iterable[str] = (), files: Iterable[str] = (),
+                extra: Iterable[object] = (), stats=None) -> Fingerprint:
+    """Key over the mtimes of `folders` (recursively) and `files` under `root`.
+
+    `extra` values (settings, the hook's own mtime...) are mixed in as is.
+    """
+    root = os.fspath(root)
+    parts, newest = [], 0
+    for folder in folders:
+        path = os.path.join(root, *folder.split("/"))
+        try:
+            acc = [os.stat(path).st_mtime_ns, 0]
+        except OSError:
+            parts.append("-")
+            continue
+        _scan(path, acc, stats)
+        parts.append(f"{acc[0]}.{acc[1]}")
+        newest = max(newest, acc[0])
+    for rel in files:
+        try:
+            mtime = os.stat(os.path.join(root, *rel.split("/"))).st_mtime_ns
+        except OSError:
+            parts.append("-")
+            continue
+        parts.append(str(mtime))
+        newest = max(newest, mtime)
+    parts.extend(str(value) for value in extra)
+    return Fingerprint(":".join(parts), newest / 1e9)
+
+
+class ResultCache:
+    """One hook's last result, stored with the fingerprint it was built from."""
+
+    def __init__(self, root: str | os.PathLike, name: str):
+        self.path = os.path.join(os.fspath(root), CACHE_DIR, f"{name}.json")
+
+    def get(self, fp: Fingerprint, now: float | None = None):
+        """The cached value if it was stored under `fp` and is still valid, else None."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != CACHE_VERSION or data.get("key") != fp.key:
+            return None
+        valid_until = data.get("valid_until")
+        if valid_until is not None and (now or time.time()) >= valid_until:
+            return None
+        return data.get("value")
+
+    def put(self, fp: Fingerprint, value, valid_until: float | None = None,
+            now: float | None = None) -> bool:
+        """Store `value` under `fp`; False if inputs changed too recently to trust."""
+        from .output import write_atomic
+
+        if (now or time.time()) - fp.newest < SETTLE_SECONDS:
+            return False
+        data = {"version": CACHE_VERSION, "key": fp.key, "valid_until": valid_until, "value": value}
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            write_atomic(self.path, [json.dumps(data, ensure_ascii=False)])
+        except OSError:
+            return False
+        return True
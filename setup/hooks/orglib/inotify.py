@@ -0,0 +1,135 @@
+"""
+Recursive directory watching with Linux inotify, through ctypes.
+
+Only the org daemon uses this; the hooks never import it. `Watcher(root)`
+puts a watch on every directory below `root` that a VaultWalker would
+enter (so not hidden folders, node_modules or anything in `.orgignore`)
+and adds new directories as they appear, by the same rules. Watches are
+a per-user kernel limit (fs.inotify.max_user_watches), so ignored trees
+such as attachments or tool checkouts don't spend them. `fileno()` can go into a selector;
+`read()` drains what is queued and returns the changed paths, with
+OVERFLOW in the set if the kernel queue overflowed and events were lost.
+
+`Watcher.available()` is False off Linux (or without libc inotify), and
+callers fall back to fingerprinting the vault on demand.
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import struct
+import sys
+
+from .walk import VaultWalker
+
+IN_MODIFY = 0x002
+IN_ATTRIB = 0x004
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_FROM = 0x040
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_DELETE_SELF = 0x400
+IN_MOVE_SELF = 0x800
+IN_Q_OVERFLOW = 0x4000
+IN_IGNORED = 0x8000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+
+MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+        | IN_DELETE_SELF | IN_MOVE_SELF)
+EVENT = struct.Struct("iIII")
+
+# Marker path returned when events were lost
+OVERFLOW = ""
+
+_libc = None
+
+
+def _load():
+    global _libc
+    if _libc is None and sys.platform.startswith("linux"):
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            libc.inotify_init1.argtypes = [ctypes.c_int]
+            libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+            _libc = libc
+        except (OSError, AttributeError):
+            _libc = False
+    return _libc or None
+
+
+class Watcher:
+    """inotify watches on a directory tree."""
+
+    @staticmethod
+    def available() -> bool:
+        return _load() is not None
+
+    def __init__(self, root: str | os.PathLike, walker: VaultWalker | None = None):
+        libc = _load()
+        if libc is None:
+            raise OSError(errno.ENOSYS, "inotify is not available")
+        self.root = os.fspath(root)
+        self.walker = walker or VaultWalker(self.root)
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.paths: dict[int, str] = {}
+        self.add_tree("")
+
+    def fileno(self) -> int:
+        return self.fd
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+    def add_tree(self, rel: str) -> None:
+        """Watch the vault folder `rel` ('' for the root) and the folders below it the walker enters."""
+        stack = [rel]
+        while stack:
+            rel = stack.pop()
+            path = os.path.join(self.root, *rel.split("/")) if rel else self.root
+            wd = _libc.inotify_add_watch(self.fd, os.fsencode(path), MASK)
+            if wd < 0:
+                continue
+            self.paths[wd] = path
+            prefix = f"{rel}/" if rel else ""
+            stack.extend(prefix + name for name in self.walker.listdir(rel)[0])
+
+    def retarget(self, walker: VaultWalker) -> None:
+        """Use new ignore rules (after .orgignore changed) and watch what they newly allow."""
+        self.walker = walker
+        self.add_tree("")
+
+    def read(self) -> set[str]:
+        """Paths changed since the last read (OVERFLOW if some were lost)."""
+        changed = set()
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, size = EVENT.unpack_from(data, offset)
+                name = data[offset + EVENT.size:offset + EVENT.size + size].rstrip(b"\0")
+                offset += EVENT.size + size
+                if mask & IN_Q_OVERFLOW:
+                    changed.add(OVERFLOW)
+                    continue
+                folder = self.paths.get(wd)
+                if folder is None:
+                    continue
+                if mask & IN_IGNORED:
+                    del self.paths[wd]
+                    continue
+                name = os.fsdecode(name)
+                path = os.path.join(folder, name) if name else folder
+                changed.add(path)
+                if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                    rel = os.path.relpath(path, self.root).replace(os.sep, "/")
+                    if not self.walker.rules.ignored(rel, True):
+                        self.add_tree(rel)
@@ -0,0 +1,127 @@
+"""
+Content-hash manifest of generated files.
+
+Each generator keeps `<vault>/.org-manifests/<name>.json`, mapping every
+file it wrote (vault-relative) to the file's size, mtime and a hash of its
+content with the volatile lines removed (the `generated:` header and the
+"Last updated/generated" footer). Whether a page needs rewriting is then a
+hash compare in memory plus one stat to confirm nobody touched the file -
+no re-reading of existing pages.
+
+Two manifests (e.g. before and after a run) diff to the exact list of
+generated files that changed.
+"""
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from .output import write_atomic
+
+MANIFEST_DIR = ".org-manifests"
+MANIFEST_VERSION = 1
+
+# Lines that change on every run without the page changing
+VOLATILE = re.compile(r"^generated: .*$|Last (?:updated|generated): [\d: -]+", re.M)
+
+
+def stable_hash(content: str) -> str:
+    """Hash of `content` ignoring volatile header/footer fields."""
+    return hashlib.sha1(VOLATILE.sub("", content).encode("utf-8")).hexdigest()
+
+
+def diff_manifests(old: dict[str, str], new: dict[str, str]) -> tuple[list[str], list[str], list[str]]:
+    """(added, modified, removed) paths between two path -> hash maps."""
+    added = sorted(p for p in new if p not in old)
+    modified = sorted(p for p in new if p in old and old[p] != new[p])
+    removed = sorted(p for p in old if p not in new)
+    return added, modified, removed
+
+
+class OutputManifest:
+    """Hashes of one generator's outputs, persisted between runs."""
+
+    def __init__(self, root: Path, name: str):
+        self.root = Path(root)
+        self.path = self.root / MANIFEST_DIR / f"{name}.json"
+        self.files: dict[str, list] = self._load()  # rel -> [size, mtime_ns, hash]
+
+    def _load(self) -> dict:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("version") == MANIFEST_VERSION:
+                return data["files"]
+        except (OSError, ValueError, KeyError):
+            pass
+        return {}
+
+    def hashes(self) -> dict[str, str]:
+        """rel -> stable content hash, for diffing."""
+        return {rel: entry[2] for rel, entry in self.files.items()}
+
+    def is_current(self, rel: str, digest: str) -> bool:
+        """True if `rel` was written with this content and hasn't been touched since."""
+        entry = self.files.get(rel)
+        if entry is None or entry[2] != digest:
+            return False
+        try:
+            st = os.stat(self.root / rel)
+        except OSError:
+            return False
+        return entry[0] == st.st_size and entry[1] == st.st_mtime_ns
+
+    def _record(self, rel: str, digest: str) -> None:
+        st = os.stat(self.root / rel)
+        self.files[rel] = [st.st_size, st.st_mtime_ns, digest]
+
+    def write_text(self, rel: str, content: str) -> int | None:
+        """Write `content` unless it is current; returns bytes written or None."""
+        digest = stable_hash(content)
+        if self.is_current(rel, digest):
+            return None
+        written = write_atomic(self.root / rel, [content])
+        self._record(rel, digest)
+        return written
+
+    def write_chunks(self, rel: str, chunks: Iterable[str]) -> int | None:
+        """Stream `chunks` to `rel`, keeping the old file if the content is current."""
+        h = hashlib.sha1()
+
+        def hashed() -> Iterator[str]:
+            for chunk in chunks:
+                h.update(VOLATILE.sub("", chunk).encode("utf-8"))
+                yield chunk
+
+        digest = None
+
+        def keep() -> bool:
+            nonlocal digest
+            digest = h.hexdigest()
+            return not self.is_current(rel, digest)
+
+        written = write_atomic(self.root / rel, hashed(), keep=keep)
+        if written is not None:
+            self._record(rel, digest)
+        return written
+
+    def remove(self, rel: str) -> None:
+        """Delete a generated file and forget it."""
+        try:
+            os.unlink(self.root / rel)
+        except FileNotFoundError:
+            pass
+        self.files.pop(rel, None)
+
+    def prune(self, keep: Iterable[str]) -> None:
+        """Forget entries for files that are no longer generated."""
+        keep = set(keep)
+        for rel in [r for r in self.files if r not in keep]:
+            del self.files[rel]
+
+    def save(self) -> None:
+        self.path.parent.mkdir(exist_ok=True)
+        data = {"version": MANIFEST_VERSION, "files": dict(sorted(self.files.items()))}
+        write_atomic(self.path, [json.dumps(data, indent=1)])
@@ -0,0 +1,87 @@
+"""
+Machine-readable metrics as JSON lines.
+
+Each finished run appends one record to a metrics file:
+
+    {"ts": "2026-02-05T09:00:00", "tool": "generate-tag-pages", "vault": "...",
+     "run_id": "...", "wall_ms": 41.2, "phases": {"scan": 30.1, ...},
+     "counters": {"files_scanned": 812, "bytes_written": 20480, ...},
+     "peak_rss_kb": 23100, "python": "3.11.7", "platform": "linux"}
+
+Scripts take `--metrics-file PATH`; hooks (which have no command line)
+read the path from the CLAUDE_ORG_METRICS environment variable. The
+scripts fall back to the same variable. Nothing is written when neither
+is set.
+"""
+
+import json
+import os
+import platform
+import sys
+import uuid
+from datetime import datetime
+
+from .stats import Stats
+
+METRICS_ENV = "CLAUDE_ORG_METRICS"
+
+
+def peak_rss_kb() -> int | None:
+    """Peak resident set size of this process in KiB, where the OS reports it."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def metrics_path(cli_value: str | None = None) -> str | None:
+    """Where to write metrics: explicit option first, then the environment."""
+    return cli_value or os.environ.get(METRICS_ENV) or None
+
+
+def add_argument(parser) -> None:
+    """Add the standard --metrics-file option to an argparse parser."""
+    parser.add_argument(
+        "--metrics-file", metavar="PATH",
+        help=f"Append a JSON-lines metrics record (default: ${METRICS_ENV})",
+    )
+
+
+def new_run_id() -> str:
+    """Id shared by the records of one invocation (e.g. publish + its generators)."""
+    return uuid.uuid4().hex[:12]
+
+
+def record(stats: Stats, vault=None, run_id: str | None = None, **extra) -> dict:
+    """Metrics record for a finished run."""
+    rec = {
+        "ts": datetime.now().isoformat(timespec="seconds"),
+        "tool": stats.name,
+        "vault": str(vault) if vault is not None else None,
+        "run_id": run_id,
+        "wall_ms": round(stats.wall_ms, 2),
+        "phases": {name: round(ms, 2) for name, ms in stats.phases.items()},
+        "counters": stats.all_counters(),
+        "peak_rss_kb": peak_rss_kb(),
+        "python": platform.python_version(),
+        "platform": sys.platform,
+    }
+    rec.update(extra)
+    return rec
+
+
+def emit(path: str | None, stats: Stats, vault=None, run_id: str | None = None, **extra) -> bool:
+    """Append a record to `path`. Never raises: metrics must not break a run."""
+    if not path:
+        return False
+    try:
+        line = json.dumps(record(stats, vault, run_id, **extra), default=str)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+        return True
+    except (OSError, TypeError, ValueError) as e:
+        print(f"Warning: could not write metrics to {path}: {e}", file=sys.stderr)
+        return False
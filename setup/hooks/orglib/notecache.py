@@ -0,0 +1,78 @@
+"""
+Per-note records kept between runs in `.org-cache/`, keyed by mtime.
+
+The hooks' indexes (DateIndex.cached, ProjectIndex.cached) need a few
+frontmatter values from many notes on every run. `note_records()` stats
+each note, reuses the record saved for it last time if its mtime is
+unchanged, reads the header of new or modified notes only, and saves
+the records again if anything changed:
+
+    records = note_records(root, "dates.json", 1, walker.markdown(), parse, reader, stats)
+    for rel, (mtime_ns, *values) in records.items():
+        ...
+
+`parse(text, st)` turns a note's frontmatter text (None if it has none
+or can't be read) and its stat result into a JSON-able list; the record
+is that list after the mtime. Bump `version` when `parse` changes.
+"""
+
+import json
+import os
+from typing import Callable, Iterable
+
+from .frontmatter import FrontmatterReader
+
+CACHE_DIR = ".org-cache"
+
+# frontmatter text, stat -> values saved for the note
+Parse = Callable[[str | None, os.stat_result], list]
+
+
+def note_records(root: str | os.PathLike, name: str, version: int, notes: Iterable[tuple[str, str]],
+                 parse: Parse, reader: FrontmatterReader | None = None, stats=None) -> dict[str, list]:
+    """{rel: [mtime_ns, *parse(text, st)]} for `notes` ((rel, path) pairs), in their order."""
+    root = os.fspath(root)
+    reader = reader or FrontmatterReader()
+    cache_path = os.path.join(root, CACHE_DIR, name)
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            cache = json.load(f)
+        if cache.get("version") != version:
+            cache = {}
+    except (OSError, ValueError):
+        cache = {}
+    old = cache.get("notes", {})
+
+    records = {}
+    changed = False
+    for rel, path in notes:
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        if stats is not None:
+            stats.count("files_stat")
+        record = old.get(rel)
+        if record is None or record[0] != st.st_mtime_ns:
+            record = [st.st_mtime_ns, *parse(_header_text(path, reader, stats), st)]
+            changed = True
+        records[rel] = record
+    if changed or len(records) != len(old):
+        from .output import write_atomic  # tempfile only when the cache changed
+        try:
+            os.makedirs(os.path.join(root, CACHE_DIR), exist_ok=True)
+            write_atomic(cache_path, [json.dumps({"version": version, "notes": records})])
+        except OSError:
+            pass  # read-only org dir: still answer from memory
+    return records
+
+
+def _header_text(path: str, reader: FrontmatterReader, stats) -> str | None:
+    try:
+        header = reader.read(path)
+    except (OSError, UnicodeDecodeError):
+        return None
+    if stats is not None:
+        stats.count("files_read")
+        stats.count("bytes_read", header.bytes_read)
+    return header.text
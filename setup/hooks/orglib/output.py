@@ -0,0 +1,67 @@
+"""
+Atomic output files for the generators.
+
+`write_atomic(path, chunks)` streams an iterable of text chunks into a
+temporary file next to `path` and renames it over the target only once every
+chunk has been written. Obsidian (and Publish) therefore never sees a
+half-written page, and a renderer can yield sections as it computes them
+instead of building the whole document in memory.
+
+The temporary file is a dotfile ending in `.tmp`, so vault scans that look
+for `*.md` never pick it up. mkstemp creates it owner-only, so before the
+rename it gets the mode of the file it replaces, or the mode a plain
+`open()` would give a new file under the current umask.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Callable, Iterable
+
+
+def _umask() -> int:
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+# Read once: os.umask can only be read by setting it
+UMASK = _umask()
+
+
+def target_mode(path: Path) -> int:
+    """Permission bits for a file written to `path`: its current ones, else 0o666 minus the umask."""
+    try:
+        return os.stat(path).st_mode & 0o7777
+    except OSError:
+        return 0o666 & ~UMASK
+
+
+def write_atomic(path: Path, chunks: Iterable[str], encoding: str = "utf-8",
+                 keep: Callable[[], bool] | None = None) -> int | None:
+    """Write `chunks` to `path` via temp file + rename; returns bytes written.
+
+    `keep` is asked once every chunk is written; if it returns False the
+    temp file is dropped, `path` is left alone and None is returned.
+    """
+    path = Path(path)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    written = 0
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in chunks:
+                data = chunk.encode(encoding)
+                f.write(data)
+                written += len(data)
+        if keep is not None and not keep():
+            os.unlink(tmp)
+            return None
+        os.chmod(tmp, target_mode(path))
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    return written
@@ -0,0 +1,198 @@
+"""
+Project index: project READMEs and the tasks that roll up into them.
+
+A project is a folder `projects/<name>/` with a README.md; its frontmatter
+(status, title, tags, dates) describes the project. A task belongs to a
+project when its frontmatter says `project: <name>` (a wikilink or
+`projects/<name>/...` path works too) or when it lives under the
+project's folder. Only notes under projects/ and tasks/ are considered.
+
+    index = ProjectIndex.from_docs(vault.docs)      # generators
+    index = ProjectIndex.cached(org_dir)            # hooks
+    for name, rollup in index.rollups().items():
+        rollup.open        # {"active": 2, "blocked": 1}
+        rollup.last        # day ordinal of the latest project/task activity
+
+`rollups()` joins tasks to projects in one pass over the tasks with a
+dict lookup per task. Projects and tasks are added and removed one note
+at a time, and `cached()` keeps the per-note records in
+`.org-cache/projects.json` keyed by mtime, so only changed notes under
+projects/ and tasks/ are re-read (like DateIndex.cached).
+"""
+
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Iterable
+
+from .dates import day_ordinal, mtime_ordinal
+from .doc import as_str_tuple
+from .frontmatter import FrontmatterReader, parse_simple
+from .notecache import note_records
+from .schema import SCHEMAS
+from .vault import DEFAULT_EXCLUDED_DIRS
+from .walk import IgnoreRules, VaultWalker
+
+PROJECTS_DIR = "projects"
+CACHE_FILE = "projects.json"
+CACHE_VERSION = 3
+
+# Task statuses that don't count as open work
+CLOSED = frozenset({"complete", "completed", "done", "cancelled", "archived"})
+
+PROJECT_REF = re.compile(r"^\[\[|\]\]$|\|.*$")
+
+
+def project_name(value) -> str | None:
+    """Project name from a `project:` value: `atlas`, `[[atlas]]`, `projects/atlas/README`."""
+    if not value:
+        return None
+    if isinstance(value, (list, tuple)):
+        value = value[0] if value else None
+        if not value:
+            return None
+    text = PROJECT_REF.sub("", str(value).strip().strip("\"'")).strip()
+    if text.startswith(f"{PROJECTS_DIR}/"):
+        text = text.split("/")[1]
+    return text or None
+
+
+def folder_project(rel: str) -> str | None:
+    """`name` for notes under projects/<name>/."""
+    parts = rel.split("/")
+    return parts[1] if len(parts) > 2 and parts[0] == PROJECTS_DIR else None
+
+
+def is_readme(rel: str) -> bool:
+    parts = rel.split("/")
+    return len(parts) == 3 and parts[0] == PROJECTS_DIR and parts[2] == "README.md"
+
+
+def latest(*days) -> int | None:
+    days = [d for d in days if d is not None]
+    return max(days) if days else None
+
+
+@dataclass(slots=True)
+class Project:
+    name: str
+    rel: str
+    status: str | None
+    title: str
+    tags: tuple
+    touched: int | None     # day ordinal: latest of updated/completed/created, else mtime
+
+
+@dataclass(slots=True)
+class Rollup:
+    open: dict[str, int] = field(default_factory=dict)
+    last: int | None = None
+
+    @property
+    def open_total(self) -> int:
+        return sum(self.open.values())
+
+    def summary(self) -> str:
+        """`2 active, 1 blocked` (empty if nothing is open)."""
+        counts = sorted(self.open.items(), key=lambda item: (-item[1], item[0]))
+        return ", ".join(f"{n} {status}" for status, n in counts)
+
+
+class ProjectIndex:
+    """Projects by name, and (project, status, last activity) per task."""
+
+    def __init__(self):
+        self.projects: dict[str, Project] = {}
+        self.tasks: dict[str, tuple[str, str, int | None]] = {}
+        self._readmes: dict[str, str] = {}
+
+    def add_project(self, rel: str, status: str | None, title: str | None = None,
+                    tags: Iterable[str] = (), touched: int | None = None) -> None:
+        name = rel.split("/")[1]
+        self.remove(rel)
+        self.projects[name] = Project(name, rel, status, title or name.replace("-", " ").title(),
+                                      tuple(tags), touched)
+        self._readmes[rel] = name
+
+    def add_task(self, rel: str, project: str | None, status: str | None, touched: int | None = None) -> None:
+        self.remove(rel)
+        project = project or folder_project(rel)
+        if project is None:
+            return
+        if not status:
+            status = "complete" if "/completed/" in f"/{rel}" else "active"
+        self.tasks[rel] = (project, status, touched)
+
+    def remove(self, rel: str) -> None:
+        self.tasks.pop(rel, None)
+        name = self._readmes.pop(rel, None)
+        if name is not None:
+            self.projects.pop(name, None)
+
+    def add_doc(self, doc) -> None:
+        """Add an orglib Doc: a project README, a task, or nothing."""
+        touched = latest(day_ordinal(doc.updated), day_ordinal(doc.completed), day_ordinal(doc.created))
+        if touched is None and doc.mtime:
+            touched = mtime_ordinal(doc.mtime)
+        if is_readme(doc.rel):
+            self.add_project(doc.rel, doc.status, doc.title, doc.tags, touched)
+        elif doc.type == "task" and doc.rel.split("/")[0] in (PROJECTS_DIR, "tasks"):
+            self.add_task(doc.rel, project_name(doc.get("project")), doc.status, touched)
+
+    @classmethod
+    def from_docs(cls, docs: Iterable) -> "ProjectIndex":
+        """Index of orglib Docs (generators, from a VaultIndex)."""
+        index = cls()
+        for doc in docs:
+            index.add_doc(doc)
+        return index
+
+    def rollups(self) -> dict[str, Rollup]:
+        """Open tasks by status and latest activity per project, in one pass over tasks."""
+        result = {name: Rollup(last=p.touched) for name, p in self.projects.items()}
+        for project, status, touched in self.tasks.values():
+            rollup = result.get(project)
+            if rollup is None:
+                continue
+            if status not in CLOSED:
+                rollup.open[status] = rollup.open.get(status, 0) + 1
+            if touched is not None and (rollup.last is None or touched > rollup.last):
+                rollup.last = touched
+        return result
+
+    def with_status(self, status: str) -> list[Project]:
+        return [p for p in self.projects.values() if p.status == status]
+
+    @classmethod
+    def cached(cls, root: str | os.PathLike, reader: FrontmatterReader | None = None,
+               stats=None) -> "ProjectIndex":
+        """Index of projects/ and tasks/, refreshed from `.org-cache/projects.json`.
+
+        Every note in those folders is stat'ed; only new or modified ones
+        are read.
+        """
+        root = os.fspath(root)
+        walker = VaultWalker(root, IgnoreRules.load(root, [f"{d}/" for d in DEFAULT_EXCLUDED_DIRS]))
+        notes = (note for folder in (PROJECTS_DIR, "tasks") for note in walker.markdown(folder))
+        # rel -> [mtime_ns, type, status, title, project, tags, touched]
+        records = note_records(root, CACHE_FILE, CACHE_VERSION, notes, cls._parse_record, reader, stats)
+        index = cls()
+        for rel, (_, type_, status, title, project, tags, touched) in records.items():
+            if is_readme(rel):
+                index.add_project(rel, status, title, tags, touched)
+            elif type_ == "task":
+                index.add_task(rel, project, status, touched)
+        return index
+
+    @staticmethod
+    def _parse_record(text: str | None, st: os.stat_result) -> list:
+        """[type, status, title, project, tags, touched] for one note."""
+        keys = parse_simple(text) if text else {}
+        SCHEMAS.normalize("", keys)  # problems are check-frontmatter's to report
+        tags = list(as_str_tuple(keys.get("tags"), split=True))  # untyped notes aren't normalized
+        touched = latest(day_ordinal(keys.get("updated")), day_ordinal(keys.get("completed")),
+                         day_ordinal(keys.get("created")))
+        if touched is None:
+            touched = mtime_ordinal(st.st_mtime)
+        return [keys.get("type"), keys.get("status"), keys.get("title"),
+                project_name(keys.get("project")), tags, touched]
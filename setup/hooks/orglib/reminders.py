@@ -0,0 +1,206 @@
+"""
+Reminder upkeep: advance repeats, file away finished reminders.
+
+`maintain(org_dir)` makes one pass over `reminders/*.md`:
+
+- `completed` with a `repeat` (daily, weekly, monthly) and an occurrence
+  left before `repeat-until`: `remind-at` moves to the next occurrence
+  after now, `status` goes back to `pending` and `completed` is cleared.
+- `ongoing` with a `repeat` whose `remind-at` has passed: `remind-at`
+  moves to the next occurrence (or, past `repeat-until`, the reminder is
+  completed).
+- `completed` or `dismissed` with nothing left to repeat: moved to
+  `reminders/completed/`.
+
+Pending reminders are never touched, even when overdue: they stay in the
+SessionStart alert until someone acts on them. Headers are read with the
+shared FrontmatterReader and only files that change are read in full and
+rewritten (atomically), so a pass over an up-to-date folder costs one
+small read per reminder. Running it again changes nothing, and a pass
+cut short by `budget_ms` leaves the rest for the next one, which makes
+it safe for the Stop hook.
+"""
+
+import calendar
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+from .frontmatter import FrontmatterReader
+
+FOLDER = "reminders"
+COMPLETED_FOLDER = "reminders/completed"
+FINISHED = ("completed", "dismissed")
+REPEATS = ("daily", "weekly", "monthly")
+
+KEY_LINE = re.compile(r"^([\w-]+):[ \t]*([^\r\n]*?)[ \t]*\r?$", re.M)
+
+
+@dataclass(slots=True)
+class Changes:
+    """What a pass did, as vault-relative paths."""
+    advanced: list[str] = field(default_factory=list)
+    archived: list[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.advanced or self.archived)
+
+
+def header_keys(text: str) -> dict[str, str | None]:
+    """Flat key -> value of a frontmatter block (quotes stripped, null -> None)."""
+    keys = {}
+    for key, value in KEY_LINE.findall(text):
+        value = value.strip("\"'")
+        keys[key] = None if value in ("", "null", "~") else value
+    return keys
+
+
+def parse_when(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def format_like(original: str, when: datetime) -> str:
+    """`when` in the same shape as `original` (date only, minutes, seconds, Z)."""
+    if "T" not in original:
+        return when.date().isoformat()
+    seconds = len(original.split("T", 1)[1].rstrip("Z").split("+")[0].split("-")[0]) > 5
+    text = when.isoformat(timespec="seconds" if seconds else "minutes")
+    return text.replace("+00:00", "Z") if original.endswith("Z") else text
+
+
+def add_months(when: datetime, months: int) -> datetime:
+    month = when.month - 1 + months
+    year, month = when.year + month // 12, month % 12 + 1
+    return when.replace(year=year, month=month, day=min(when.day, calendar.monthrange(year, month)[1]))
+
+
+def next_occurrence(when: datetime, repeat: str, now: datetime) -> datetime:
+    """First occurrence of `repeat` starting at `when` that is after `now`."""
+    if repeat == "monthly":
+        months = max(1, (now.year - when.year) * 12 + now.month - when.month)
+        nxt = add_months(when, months)
+        while nxt <= now:
+            months += 1
+            nxt = add_months(when, months)
+        return nxt
+    step = timedelta(days=1 if repeat == "daily" else 7)
+    if when > now:
+        return when + step
+    return when + step * ((now - when) // step + 1)
+
+
+def set_keys(text: str, updates: dict[str, str]) -> str:
+    """Rewrite frontmatter values in a note, keeping every other line (and CRLF endings) as is."""
+    end = text.find("\n---", 3)
+    head, rest = text[:end], text[end:]
+    cr = "\r" if head.endswith("\r") else ""
+    for key, value in updates.items():
+        pattern = re.compile(rf"^{re.escape(key)}:[^\r\n]*", re.M)
+        if pattern.search(head):
+            head = pattern.sub(lambda _: f"{key}: {value}", head, count=1)
+        else:
+            head = f"{head}\n{key}: {value}{cr}"
+    return head + rest
+
+
+def archive_path(root: str, name: str, data: bytes) -> str | None:
+    """Free path in reminders/completed/ for `name`; None if an identical copy is there."""
+    folder = os.path.join(root, *COMPLETED_FOLDER.split("/"))
+    stem, ext = os.path.splitext(name)
+    n = 1
+    while True:
+        target = os.path.join(folder, name if n == 1 else f"{stem}-{n}{ext}")
+        try:
+            with open(target, "rb") as f:
+                if f.read() == data:
+                    return None
+        except FileNotFoundError:
+            return target
+        n += 1
+
+
+def maintain(org_dir: str, now: datetime | None = None, stats=None,
+             reader: FrontmatterReader | None = None, budget_ms: float | None = None) -> Changes:
+    """One upkeep pass over `<org_dir>/reminders/` (see module docstring)."""
+    from .output import write_atomic
+
+    deadline = None if budget_ms is None else time.perf_counter() + budget_ms / 1000
+    now = now or datetime.now()
+    reader = reader or FrontmatterReader()
+    changes = Changes()
+    folder = os.path.join(org_dir, FOLDER)
+    try:
+        entries = sorted(e.name for e in os.scandir(folder) if e.is_file() and e.name.endswith(".md"))
+    except OSError:
+        return changes
+
+    for name in entries:
+        if name == "README.md":
+            continue
+        if deadline is not None and time.perf_counter() > deadline:
+            break
+        path = os.path.join(folder, name)
+        rel = f"{FOLDER}/{name}"
+        try:
+            header = reader.read(path)
+        except (OSError, UnicodeDecodeError):
+            continue
+        if stats is not None:
+            stats.files_scanned += 1
+            stats.count("files_read")
+            stats.count("bytes_read", header.bytes_read)
+        if header.text is None:
+            continue
+        keys = header_keys(header.text)
+        if keys.get("type") != "reminder":
+            continue
+        status = keys.get("status") or "pending"
+        repeat = (keys.get("repeat") or "").lower()
+        remind_raw = keys.get("remind-at")
+        remind_at = parse_when(remind_raw)
+        until = parse_when(keys.get("repeat-until"))
+
+        updates = None
+        finished = status in FINISHED
+        if repeat in REPEATS and remind_at is not None and status in ("completed", "ongoing"):
+            local_now = now.astimezone(remind_at.tzinfo) if remind_at.tzinfo else now
+            if status == "completed" or remind_at <= local_now:
+                nxt = next_occurrence(remind_at, repeat, local_now)
+                if until is None or nxt.date() <= until.date():
+                    updates = {"remind-at": format_like(remind_raw, nxt)}
+                    if status == "completed":
+                        updates.update({"status": "pending", "completed": "null"})
+                    finished = False
+                elif status == "ongoing":
+                    updates = {"status": "completed", "completed": now.date().isoformat()}
+                    finished = True
+
+        try:
+            if updates is not None:
+                with open(path, encoding="utf-8", newline="") as f:
+                    text = f.read()
+                write_atomic(path, [set_keys(text, updates)])
+                if not finished:
+                    changes.advanced.append(rel)
+            if finished:
+                with open(path, "rb") as f:
+                    data = f.read()
+                target = archive_path(org_dir, name, data)
+                if target is None:
+                    os.unlink(path)
+                else:
+                    os.makedirs(os.path.dirname(target), exist_ok=True)
+                    os.replace(path, target)
+                changes.archived.append(rel)
+        except OSError:
+            continue
+        if stats is not None and (updates is not None or finished):
+            stats.files_written += 1
+    return changes
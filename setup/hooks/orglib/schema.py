@@ -0,0 +1,232 @@
+"""
+Frontmatter schemas per note type, compiled into one normalizer each.
+
+Frontmatter comes in loosely: dates are `date` objects from YAML and text
+from the hooks' line parser (`parse_simple`), `blocked-by` is a string or a list, tags
+are a list or a comma/space-separated string, statuses vary in case. The
+schemas below say what each type's keys should hold. Each is compiled
+once into a tuple of (key, coerce) steps, and running it on a note's
+frontmatter fixes the values in place and returns what was wrong:
+
+    problems = SCHEMAS.normalize("reminders/call-dentist.md", frontmatter)
+    for p in problems:
+        p.rel, p.key, p.problem     # "reminders/call-dentist.md", "remind-at", "not a date and time: 'soon'"
+
+After normalization, for the keys a schema lists:
+  - dates (`created`, `completed`, ...) are text starting with a valid
+    YYYY-MM-DD
+  - date-times (`remind-at`, `snoozed-until`) are text that
+    `datetime.fromisoformat` accepts once a trailing `Z` is replaced
+  - lists (`tags`, `blocked-by`, ...) are lists of non-empty strings;
+    a string is split on commas, and tags on spaces too
+  - choices (`status`, `repeat`, ...) are lowercase strings
+Values that can't be read as their kind are reported and set to None, so
+code reading them needs no try/except. Choices outside the allowed set
+are reported but kept, since statuses decide which folder a note is
+listed under. Missing required keys are reported too. Notes of other
+types (or none) pass through untouched.
+
+VaultIndex runs `SCHEMAS` during its scan and keeps the problems in
+`violations`; the hooks run it on each note they load, and the
+DateIndex and ProjectIndex caches on each note they re-read.
+"""
+
+import re
+from datetime import date, datetime
+from typing import Callable, Iterable, NamedTuple
+
+DAY = re.compile(r"\d{4}-\d{2}-\d{2}")
+LIST_SPLIT = re.compile(r"\s*,\s*")
+TAG_SPLIT = re.compile(r"[,\s]+")
+NULLS = (None, "", "null", "~", [], ())
+
+
+class Violation(NamedTuple):
+    rel: str
+    key: str
+    problem: str
+
+
+class Invalid(ValueError):
+    """A value that can't be read as its kind; the key is set to None."""
+
+
+def as_day(value) -> str:
+    """YYYY-MM-DD text (or longer text starting with a valid one)."""
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    text = str(value).strip()
+    if DAY.match(text):
+        try:
+            date.fromisoformat(text[:10])
+            return text
+        except ValueError:
+            pass
+    raise Invalid(f"not a date: {text!r}")
+
+
+def as_moment(value) -> str:
+    """ISO date-time text, as written (`2026-02-06T09:00`)."""
+    if isinstance(value, datetime):
+        return value.isoformat(timespec="minutes" if not value.second else "seconds")
+    if isinstance(value, date):
+        return value.isoformat()
+    text = str(value).strip()
+    try:
+        datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        raise Invalid(f"not a date and time: {text!r}") from None
+    return text
+
+
+def as_text(value) -> str:
+    if isinstance(value, (dict, list, tuple)):
+        raise Invalid(f"expected text: {value!r}")
+    return str(value).strip()
+
+
+def as_list(value, split: re.Pattern = LIST_SPLIT) -> list[str]:
+    """List from a list, or from a comma-separated string (`[a, b]` too).
+
+    Items may contain spaces: `blocked-by: waiting on legal` is one item.
+    """
+    if isinstance(value, str):
+        items = split.split(value.strip().strip("[]"))
+    elif isinstance(value, (list, tuple)):
+        items = value
+    elif isinstance(value, dict):
+        raise Invalid(f"expected a list: {value!r}")
+    else:
+        items = [value]
+    return [str(v).strip().strip("\"'") for v in items if v is not None and str(v).strip().strip("\"'")]
+
+
+def as_tags(value) -> list[str]:
+    """List like `as_list`, but a string splits on spaces too (`tags: a b`), as Doc does."""
+    return as_list(value, TAG_SPLIT)
+
+
+def one_of(*choices: str) -> Callable:
+    """Lowercase choice; values outside `choices` are reported (via Unexpected) but kept."""
+    allowed = frozenset(choices)
+    expected = ", ".join(choices)
+
+    def choice(value) -> str:
+        text = as_text(value).lower()
+        if text not in allowed:
+            raise Unexpected(text, f"expected one of {expected}: {text!r}")
+        return text
+    return choice
+
+
+class Unexpected(ValueError):
+    """A readable value outside the allowed set; it is kept as `value`."""
+
+    def __init__(self, value, message: str):
+        super().__init__(message)
+        self.value = value
+
+
+TASK_STATUSES = ("active", "blocked", "review", "backlog", "incubating", "paused", "complete")
+REMINDER_STATUSES = ("pending", "snoozed", "ongoing", "completed", "dismissed")
+PROJECT_STATUSES = ("active", "planning", "paused", "complete", "archived")
+PRIORITIES = ("critical", "urgent", "high", "medium", "normal", "low")
+INBOX_SOURCES = ("capture", "email", "ticket", "idea", "decision", "investigation")
+
+# type -> (required keys, {key: kind}); see templates/ and the folder READMEs
+SPECS: dict[str, tuple[tuple[str, ...], dict[str, Callable]]] = {
+    "task": (("status", "created"), {
+        "status": one_of(*TASK_STATUSES),
+        "created": as_day, "updated": as_day, "completed": as_day,
+        "tags": as_tags, "blocks": as_list, "blocked-by": as_list,
+        "priority": one_of(*PRIORITIES),
+        "project": as_text, "review-needed": as_text,
+    }),
+    "reminder": (("status", "remind-at"), {
+        "status": one_of(*REMINDER_STATUSES),
+        "created": as_day, "completed": as_day, "repeat-until": as_day,
+        "remind-at": as_moment, "snoozed-until": as_moment,
+        "repeat": one_of("daily", "weekly", "monthly", "custom"),
+        "tags": as_tags,
+    }),
+    "inbox": (("created", "source"), {
+        "created": as_day,
+        "source": one_of(*INBOX_SOURCES),
+        "tags": as_tags,
+    }),
+    "knowledge": (("created",), {
+        "created": as_day, "updated": as_day,
+        "tags": as_tags,
+    }),
+    "project": (("status",), {
+        "status": one_of(*PROJECT_STATUSES),
+        "created": as_day, "updated": as_day, "completed": as_day,
+        "tags": as_tags,
+    }),
+}
+
+
+class Schema:
+    """Compiled normalizer for one note type."""
+
+    def __init__(self, type_: str, required: Iterable[str], kinds: dict[str, Callable]):
+        self.type = type_
+        self.required = tuple(required)
+        self.steps = tuple(kinds.items())
+
+    def normalize(self, rel: str, frontmatter: dict) -> list[Violation]:
+        """Coerce `frontmatter` in place; returns its problems."""
+        problems = []
+        for key, coerce in self.steps:
+            value = frontmatter.get(key)
+            if value in NULLS:
+                if key in frontmatter:
+                    frontmatter[key] = None
+                if key in self.required:
+                    problems.append(Violation(rel, key, "missing"))
+                continue
+            try:
+                frontmatter[key] = coerce(value)
+            except Unexpected as e:
+                frontmatter[key] = e.value
+                problems.append(Violation(rel, key, str(e)))
+            except Invalid as e:
+                frontmatter[key] = None
+                problems.append(Violation(rel, key, str(e)))
+        return problems
+
+
+class SchemaSet:
+    """One compiled Schema per note type; other types pass through."""
+
+    def __init__(self, specs: dict = SPECS):
+        self.by_type = {type_: Schema(type_, required, kinds) for type_, (required, kinds) in specs.items()}
+
+    def normalize(self, rel: str, frontmatter: dict) -> list[Violation]:
+        schema = self.by_type.get(frontmatter.get("type"))
+        return schema.normalize(rel, frontmatter) if schema is not None else []
+
+
+SCHEMAS = SchemaSet()
+
+
+def report(violations: list[Violation], limit: int = 20) -> list[str]:
+    """Summary lines: totals, counts per key and problem, then the first `limit` problems."""
+    if not violations:
+        return []
+    notes = len({v.rel for v in violations})
+    lines = [f"{len(violations)} frontmatter problem(s) in {notes} note(s):"]
+    kinds: dict[tuple[str, str], int] = {}
+    for v in violations:
+        kind = (v.key, v.problem.split(":")[0])
+        kinds[kind] = kinds.get(kind, 0) + 1
+    for (key, problem), n in sorted(kinds.items(), key=lambda item: (-item[1], item[0])):
+        lines.append(f"  {n:>6}  {key}: {problem}")
+    if limit:
+        lines.append("")
+        lines += [f"  {v.rel}: {v.key}: {v.problem}" for v in violations[:limit]]
+        if len(violations) > limit:
+            lines.append(f"  ... and {len(violations) - limit} more")
+    return lines
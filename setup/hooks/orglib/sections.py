@@ -0,0 +1,114 @@
+"""
+Markdown sections by heading name, from a one-pass heading index.
+
+The hooks quote a few sections of context files (`## Active Projects`
+from current-state.md, `## How to Collaborate` from voice.md, `## Root
+Level` from knowledge/README.md) and may be configured to quote more.
+Rather than one DOTALL regex over the whole file per section, a file's
+headings are tokenized once into byte offsets:
+
+    index = HeadingIndex.load("context/voice.md")
+    index.section("How to Collaborate")          # body text, or None
+
+A section runs from the line after its heading to the next heading of
+the same or a higher level. Headings inside fenced code blocks are not
+headings. If a name occurs twice, the first wins. Indexes are cached per
+path and reused while the file's mtime and size are unchanged, which
+matters in the org daemon where one process serves many sessions.
+"""
+
+import os
+import re
+from typing import NamedTuple
+
+HEADING = re.compile(rb"^(#{1,6})[ \t]+(.*?)[ \t#]*\r?$")
+FENCE = re.compile(rb"^[ \t]*(```|~~~)")
+
+
+class Heading(NamedTuple):
+    level: int
+    title: str
+    start: int       # offset of the heading line
+    body: int        # offset of the line after it
+    end: int         # offset where the section ends
+
+
+class HeadingIndex:
+    """Headings of one markdown file, with the byte range of each section."""
+
+    _cache: dict[str, tuple[int, int, "HeadingIndex"]] = {}
+
+    def __init__(self, data: bytes):
+        self.data = data
+        self.headings: list[Heading] = []
+        self.by_title: dict[str, Heading] = {}
+        self._tokenize()
+
+    def _tokenize(self) -> None:
+        found, fenced, pos = [], False, 0
+        data = self.data
+        for line in data.splitlines(keepends=True):
+            start, pos = pos, pos + len(line)
+            if FENCE.match(line):
+                fenced = not fenced
+            elif not fenced and line.startswith(b"#"):
+                match = HEADING.match(line.rstrip(b"\n"))
+                if match:
+                    found.append((len(match.group(1)), match.group(2).decode("utf-8", "replace"), start, pos))
+        # Each section ends where the next heading at its level or above starts
+        open_sections: list[int] = []
+        ends = [len(data)] * len(found)
+        for i, (level, _, start, _) in enumerate(found):
+            while open_sections and found[open_sections[-1]][0] >= level:
+                ends[open_sections.pop()] = start
+            open_sections.append(i)
+        for (level, title, start, body), end in zip(found, ends):
+            heading = Heading(level, title, start, body, end)
+            self.headings.append(heading)
+            self.by_title.setdefault(title, heading)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike, stats=None) -> "HeadingIndex | None":
+        """Index of the file at `path` (None if it can't be read), cached per mtime."""
+        path = os.fspath(path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        cached = cls._cache.get(path)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            if stats is not None:
+                stats.count("cache_hits")
+            return cached[2]
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        if stats is not None:
+            stats.count("files_read")
+            stats.count("bytes_read", len(data))
+        index = cls(data)
+        cls._cache[path] = (st.st_mtime_ns, st.st_size, index)
+        return index
+
+    def __contains__(self, title: str) -> bool:
+        return title in self.by_title
+
+    def section(self, title: str, heading: bool = False) -> str | None:
+        """Text of the section named `title` (with its heading line if `heading`)."""
+        h = self.by_title.get(title)
+        if h is None:
+            return None
+        text = self.data[h.start if heading else h.body:h.end].decode("utf-8", "replace")
+        return text.replace("\r\n", "\n")
+
+
+def parse_section_specs(value: str | None) -> list[tuple[str, str]]:
+    """`file#Heading;file#Heading` -> [(file, heading)] (malformed items skipped)."""
+    specs = []
+    for item in (value or "").split(";"):
+        path, sep, title = item.strip().partition("#")
+        if sep and path.strip() and title.strip():
+            specs.append((path.strip(), title.strip()))
+    return specs
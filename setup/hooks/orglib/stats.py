@@ -0,0 +1,66 @@
+"""Structured work/timing counters reported by generators and hooks."""
+
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+
+@dataclass
+class Stats:
+    """What a run did: files touched, other counters and milliseconds per phase.
+
+    Conventional counter names: files_stat, files_read, bytes_read,
+    cache_hits, bytes_written (see metrics.py for how they are emitted).
+    """
+    name: str
+    files_scanned: int = 0
+    files_parsed: int = 0
+    files_written: int = 0
+    phases: dict[str, float] = field(default_factory=dict)
+    counters: dict[str, int] = field(default_factory=dict)
+    started: float = field(default_factory=time.perf_counter, repr=False)
+
+    def count(self, counter: str, n: int = 1) -> None:
+        self.counters[counter] = self.counters.get(counter, 0) + n
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time a block; repeated phases accumulate."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            self.phases[name] = self.phases.get(name, 0.0) + elapsed
+
+    def absorb(self, other: "Stats") -> None:
+        """Fold another run's counters and phases into this one."""
+        self.files_scanned += other.files_scanned
+        self.files_parsed += other.files_parsed
+        self.files_written += other.files_written
+        for name, ms in other.phases.items():
+            self.phases[name] = self.phases.get(name, 0.0) + ms
+        for counter, n in other.counters.items():
+            self.count(counter, n)
+
+    @property
+    def total_ms(self) -> float:
+        return sum(self.phases.values())
+
+    @property
+    def wall_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
+
+    def all_counters(self) -> dict[str, int]:
+        return {
+            "files_scanned": self.files_scanned,
+            "files_parsed": self.files_parsed,
+            "files_written": self.files_written,
+            **self.counters,
+        }
+
+    def summary(self) -> str:
+        """One-line report, e.g. 'scanned 48, parsed 48, written 3 | scan 12ms, write 1ms'."""
+        counts = f"scanned {self.files_scanned}, parsed {self.files_parsed}, written {self.files_written}"
+        phases = ", ".join(f"{name} {ms:.0f}ms" for name, ms in self.phases.items())
+        return f"{counts} | {phases}" if phases else counts
@@ -0,0 +1,220 @@
+"""
+Task status timelines and weekly velocity.
+
+Frontmatter only records where a task is now, plus its `created` and
+`completed` days. From those a timeline is derived: an open task has been
+in its current status since `created`, and a completed one was `active`
+from `created` until `completed`. That is enough for throughput and cycle
+time, but time spent `active` or `blocked` is only approximate.
+
+The optional event log fills the gap. When `.org-cache/events.jsonl`
+exists, the dashboard generator appends one line per status change it
+observes between runs:
+
+    {"day": "2026-03-02", "task": "fix-login", "from": "active", "to": "blocked"}
+
+A task's first line has `"from": null` and records its status when
+logging started. The log is append-only; the last status seen for each
+task comes from replaying it.
+
+`Velocity` aggregates timelines and inbox items into weekly buckets in a
+single pass over the tasks.
+"""
+
+import json
+import os
+from datetime import date
+from statistics import median
+from typing import Iterable
+
+from .doc import Doc
+from .dates import day_ordinal
+from .notecache import CACHE_DIR
+
+EVENT_LOG = "events.jsonl"
+COMPLETE = "complete"
+SPARK = "▁▂▃▄▅▆▇█"
+
+# (day ordinal, old status or None, new status)
+Event = tuple[int, str | None, str]
+
+
+def sparkline(values: list[float]) -> str:
+    """One block character per value, scaled to the largest."""
+    top = max(values, default=0)
+    if top <= 0:
+        return SPARK[0] * len(values)
+    return "".join(SPARK[min(len(SPARK) - 1, int(v / top * (len(SPARK) - 1) + 0.5))] for v in values)
+
+
+def is_task(doc: Doc) -> bool:
+    return doc.type == "task" or (doc.type is None and doc.folder.split("/")[0] == "tasks")
+
+
+class EventLog:
+    """Append-only log of observed task status changes."""
+
+    def __init__(self, root: str | os.PathLike):
+        self.path = os.path.join(os.fspath(root), CACHE_DIR, EVENT_LOG)
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def read(self) -> dict[str, list[Event]]:
+        """task name -> events in log order (malformed lines are skipped)."""
+        events: dict[str, list[Event]] = {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        day = day_ordinal(record["day"])
+                        task, new = record["task"], record["to"]
+                    except (ValueError, KeyError, TypeError):
+                        continue
+                    if day is not None:
+                        events.setdefault(task, []).append((day, record.get("from"), new))
+        except OSError:
+            pass
+        return events
+
+    def record(self, docs: Iterable[Doc], today: date | None = None,
+               known: dict[str, list[Event]] | None = None) -> int:
+        """Append a line for every task whose status differs from the log's.
+
+        Returns the number of lines written.
+        """
+        today = (today or date.today()).isoformat()
+        known = self.read() if known is None else known
+        lines = []
+        for doc in docs:
+            if not is_task(doc) or not doc.status:
+                continue
+            name = doc.name
+            history = known.get(name)
+            last = history[-1][2] if history else None
+            if doc.status != last:
+                lines.append(json.dumps({"day": today, "task": name, "from": last, "to": doc.status}))
+                known.setdefault(name, []).append((day_ordinal(today), last, doc.status))
+        if lines:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+        return len(lines)
+
+
+def segments(doc: Doc, events: list[Event], today: int) -> list[tuple[str, int, int]]:
+    """(status, start, end) day-ordinal spans of one task, oldest first.
+
+    `end` is exclusive; the current status runs through `today`.
+    """
+    created = day_ordinal(doc.created)
+    completed = day_ordinal(doc.completed)
+    if events:
+        status = events[0][1] or events[0][2]
+        start = created if created is not None else events[0][0]
+    else:
+        if created is None:
+            return []
+        status = "active" if doc.status == COMPLETE else (doc.status or "active")
+        start = created
+    changes = [(day, new) for day, _, new in events]
+    if completed is not None and doc.status == COMPLETE and not any(n == COMPLETE for _, n in changes):
+        changes.append((completed, COMPLETE))
+    changes.sort(key=lambda c: c[0])
+
+    spans = []
+    for day, new in changes:
+        if new == status:
+            continue
+        day = max(day, start)
+        if day > start:
+            spans.append((status, start, day))
+        status, start = new, day
+    if status != COMPLETE:
+        spans.append((status, start, max(start, today + 1)))
+    return spans
+
+
+class Velocity:
+    """Weekly buckets (oldest first) from `start` for `weeks` weeks."""
+
+    def __init__(self, start: date, weeks: int, today: date | None = None):
+        self.start = start.toordinal()
+        self.weeks = weeks
+        self.today = (today or date.today()).toordinal()
+        self.completed = [0] * weeks
+        self.created = [0] * weeks
+        self.active_days = [0] * weeks
+        self.blocked_days = [0] * weeks
+        self.captured = [0] * weeks
+        self.cycle_days: list[int] = []
+        self.inbox_ages: list[int] = []
+
+    def _week(self, day: int | None) -> int | None:
+        if day is None:
+            return None
+        week = (day - self.start) // 7
+        return week if 0 <= week < self.weeks else None
+
+    def _spread(self, buckets: list[int], start: int, end: int) -> None:
+        """Add the days of [start, end) to the weeks they fall in."""
+        end = min(end, self.start + 7 * self.weeks)
+        day = max(start, self.start)
+        while day < end:
+            week = (day - self.start) // 7
+            week_end = min(end, self.start + 7 * (week + 1))
+            buckets[week] += week_end - day
+            day = week_end
+
+    def add_task(self, doc: Doc, events: list[Event]) -> None:
+        created = day_ordinal(doc.created)
+        week = self._week(created)
+        if week is not None:
+            self.created[week] += 1
+        completed = day_ordinal(doc.completed) if doc.status == COMPLETE else None
+        week = self._week(completed)
+        if week is not None:
+            self.completed[week] += 1
+            if created is not None and completed >= created:
+                self.cycle_days.append(completed - created)
+        for status, start, end in segments(doc, events, self.today):
+            if status == "active":
+                self._spread(self.active_days, start, end)
+            elif status == "blocked":
+                self._spread(self.blocked_days, start, end)
+
+    def add_inbox(self, doc: Doc) -> None:
+        created = day_ordinal(doc.created)
+        week = self._week(created)
+        if week is not None:
+            self.captured[week] += 1
+        if created is not None:
+            self.inbox_ages.append(max(0, self.today - created))
+
+    @classmethod
+    def build(cls, tasks: Iterable[Doc], inbox: Iterable[Doc], start: date, weeks: int,
+              events: dict[str, list[Event]] | None = None, today: date | None = None) -> "Velocity":
+        velocity = cls(start, weeks, today)
+        events = events or {}
+        for doc in tasks:
+            velocity.add_task(doc, events.get(doc.name, []))
+        for doc in inbox:
+            velocity.add_inbox(doc)
+        return velocity
+
+    def rows(self) -> list[tuple[str, list[int]]]:
+        """(label, weekly values) for the sparkline table."""
+        return [
+            ("Tasks completed", self.completed),
+            ("Tasks created", self.created),
+            ("Task-days active", self.active_days),
+            ("Task-days blocked", self.blocked_days),
+            ("Inbox captured", self.captured),
+        ]
+
+    def median_cycle(self) -> float | None:
+        return median(self.cycle_days) if self.cycle_days else None
+
+    def median_inbox_age(self) -> float | None:
+        return median(self.inbox_ages) if self.inbox_ages else None
@@ -0,0 +1,120 @@
+"""
+One-pass parsed view of an org dir.
+
+Every markdown note is read and parsed once into a compact Doc, so
+generators that share an index never re-read or re-parse a file. Docs are
+addressed by integer id (their position in `docs`); folder groupings and
+other derived views hold ids, not copies.
+"""
+
+import sys
+from pathlib import Path
+from typing import Callable
+
+from .archive import ARCHIVE_DIR
+from .doc import Doc
+from .frontmatter import FrontmatterReader
+from .schema import SCHEMAS, SchemaSet, Violation
+from .stats import Stats
+from .walk import IgnoreRules, VaultWalker
+
+# Folder names skipped on top of .orgignore (hidden folders and
+# node_modules are always skipped by the walker)
+DEFAULT_EXCLUDED_DIRS = frozenset({"tags", "setup"})
+
+# Vault-relative folders always skipped: archive/ holds finished work moved
+# out by scripts/archive.py (its notes are reached through archive/index.json)
+EXCLUDED_PATHS = (f"/{ARCHIVE_DIR}/",)
+
+
+class VaultIndex:
+    """All notes of a vault, parsed once and grouped by folder.
+
+    `parse` turns frontmatter text into a dict (the generators pass
+    `yaml_loader(yaml)`). Only each note's header is read (see
+    frontmatter.py). Read and parse failures are collected in `errors`
+    (relative path -> message) rather than printed, so each consumer can
+    report the ones it cares about; unparseable notes are kept with empty
+    frontmatter. Folders are pruned by `.orgignore`, `excluded_dirs`
+    (folder names, at any depth) and EXCLUDED_PATHS (archive/ at the root),
+    so a scan costs what the live folders hold.
+
+    Frontmatter is normalized by `schemas` (schema.py) before it becomes
+    a Doc, so Doc values of typed notes have their schema's shapes; what
+    didn't fit is listed in `violations`. Pass `schemas=None` to skip it.
+    """
+
+    def __init__(self, root: Path, parse: Callable[[str], dict],
+                 excluded_dirs: frozenset[str] = DEFAULT_EXCLUDED_DIRS,
+                 schemas: SchemaSet | None = SCHEMAS):
+        self.root = Path(root)
+        self.parse = parse
+        self.excluded_dirs = excluded_dirs
+        self.schemas = schemas
+        self.walker = VaultWalker(self.root, IgnoreRules.load(self.root, [*(f"{d}/" for d in excluded_dirs), *EXCLUDED_PATHS]))
+        self.reader = FrontmatterReader()
+        self.stats = Stats("index")
+        self.docs: list[Doc] = []
+        self.errors: dict[str, str] = {}
+        self.violations: list[Violation] = []
+        self._by_rel: dict[str, int] = {}
+        self._by_folder: dict[str, list[int]] = {}
+        with self.stats.phase("scan"):
+            self._scan()
+
+    def _scan(self) -> None:
+        for rel, path in self.walker.markdown():
+            self.stats.files_scanned += 1
+            doc = self._load(rel, path, len(self.docs))
+            if doc is not None:
+                self.docs.append(doc)
+                self._by_rel[doc.rel] = doc.id
+                folder = sys.intern(doc.folder)
+                self._by_folder.setdefault(folder, []).append(doc.id)
+        self.stats.count("dirs_listed", self.walker.dirs_listed)
+
+    def _load(self, rel: str, filepath: str, doc_id: int) -> Doc | None:
+        try:
+            header = self.reader.read(filepath)
+            self.stats.count("files_read")
+            self.stats.count("files_stat")
+            self.stats.count("bytes_read", header.bytes_read)
+        except (OSError, UnicodeDecodeError) as e:
+            self.errors[rel] = str(e)
+            return None
+
+        frontmatter = {}
+        if header.text is not None:
+            try:
+                parsed = self.parse(header.text)
+                frontmatter = parsed if isinstance(parsed, dict) else {}
+                self.stats.files_parsed += 1
+            except Exception as e:
+                self.errors[rel] = str(e)
+        if frontmatter and self.schemas is not None:
+            problems = self.schemas.normalize(rel, frontmatter)
+            if problems:
+                self.violations += problems
+                self.stats.count("schema_violations", len(problems))
+
+        return Doc.from_frontmatter(doc_id, rel, frontmatter, header.mtime)
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    def path(self, doc: Doc) -> Path:
+        """Absolute path of a doc."""
+        return self.root / doc.rel
+
+    def get(self, rel: str) -> Doc | None:
+        """Doc by vault-relative path."""
+        doc_id = self._by_rel.get(rel)
+        return None if doc_id is None else self.docs[doc_id]
+
+    def folder(self, rel_folder: str) -> list[Doc]:
+        """Docs directly inside a vault-relative folder ('' for the root)."""
+        return [self.docs[i] for i in self._by_folder.get(rel_folder.strip("/"), ())]
+
+    def folders(self) -> list[str]:
+        """Every folder that directly contains at least one doc."""
+        return list(self._by_folder)
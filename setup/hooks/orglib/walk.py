@@ -0,0 +1,186 @@
+"""
+One vault walker for every script and hook, honoring `.orgignore`.
+
+`.orgignore` sits in the org dir root and uses gitignore syntax:
+
+    # attachments and tooling
+    screenshots/
+    tools/
+    *.excalidraw.md
+    /drafts/
+    !drafts/keep.md
+
+Patterns without a slash match a name at any depth; a leading or inner
+slash anchors the pattern to the org dir; a trailing slash matches
+directories only; `*`, `?`, `[...]` and `**` work as in git, and `!`
+re-includes (the last matching pattern wins). Hidden entries (`.git`,
+`.obsidian`, `.trash`, ...) and `node_modules` are always ignored.
+
+Patterns are compiled once into regexes - a single alternation per kind
+when there is no negation - and ignored directories are pruned before
+anything below them is listed.
+"""
+
+import os
+import re
+from typing import Iterable, Iterator
+
+IGNORE_FILE = ".orgignore"
+BUILTIN_PATTERNS = (".*", "node_modules/")
+
+
+def _translate(glob: str) -> str:
+    """Regex body for a gitignore glob (no anchoring)."""
+    out = []
+    i, n = 0, len(glob)
+    while i < n:
+        c = glob[i]
+        if c == "*":
+            if glob.startswith("**/", i):
+                out.append("(?:.*/)?")
+                i += 3
+                continue
+            if glob.startswith("**", i):
+                out.append(".*")
+                i += 2
+                continue
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            end = glob.find("]", i + 2)
+            if end == -1:
+                out.append(re.escape(c))
+            else:
+                body = glob[i + 1:end]
+                if body[0] in "!^":
+                    body = "^" + body[1:]
+                out.append(f"[{body.replace(chr(92), chr(92) * 2)}]")
+                i = end
+        elif c == "\\" and i + 1 < n:
+            i += 1
+            out.append(re.escape(glob[i]))
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+
+class IgnoreRules:
+    """Compiled gitignore-style patterns; `ignored(rel, is_dir)` tests one path."""
+
+    def __init__(self, patterns: Iterable[str]):
+        self.rules: list[tuple[re.Pattern, bool, bool]] = []  # (regex, negate, dir_only)
+        for line in patterns:
+            line = line.rstrip("\n\r")
+            if not line.strip() or line.startswith("#"):
+                continue
+            line = line.rstrip(" ")
+            negate = line.startswith("!")
+            if negate:
+                line = line[1:]
+            dir_only = line.endswith("/")
+            line = line.rstrip("/")
+            anchored = "/" in line
+            body = _translate(line.lstrip("/"))
+            regex = f"^{body}$" if anchored else f"^(?:.*/)?{body}$"
+            self.rules.append((re.compile(regex), negate, dir_only))
+
+        # Fast path: without negations a path is ignored if anything matches
+        self._has_negation = any(negate for _, negate, _ in self.rules)
+        self._any_file = self._combine(r for r, _, dir_only in self.rules if not dir_only)
+        self._any_dir = self._combine(r for r, _, _ in self.rules)
+
+    @staticmethod
+    def _combine(regexes: Iterable[re.Pattern]) -> re.Pattern | None:
+        parts = [r.pattern for r in regexes]
+        return re.compile("|".join(f"(?:{p})" for p in parts)) if parts else None
+
+    @classmethod
+    def load(cls, root: str | os.PathLike, extra: Iterable[str] = ()) -> "IgnoreRules":
+        """Built-in patterns, then `<root>/.orgignore`, then `extra`."""
+        lines = list(BUILTIN_PATTERNS)
+        try:
+            with open(os.path.join(root, IGNORE_FILE), encoding="utf-8") as f:
+                lines.extend(f)
+        except OSError:
+            pass
+        lines.extend(extra)
+        return cls(lines)
+
+    def ignored(self, rel: str, is_dir: bool = False) -> bool:
+        """Whether a vault-relative posix path is ignored (its parents are not checked)."""
+        if not self._has_negation:
+            combined = self._any_dir if is_dir else self._any_file
+            return combined is not None and combined.match(rel) is not None
+        for regex, negate, dir_only in reversed(self.rules):
+            if dir_only and not is_dir:
+                continue
+            if regex.match(rel):
+                return not negate
+        return False
+
+
+class VaultWalker:
+    """os.scandir traversal of an org dir that never enters ignored folders."""
+
+    def __init__(self, root: str | os.PathLike, rules: IgnoreRules | None = None):
+        self.root = os.fspath(root)
+        self.rules = rules if rules is not None else IgnoreRules.load(self.root)
+        self.dirs_listed = 0
+
+    def _path(self, rel: str) -> str:
+        return os.path.join(self.root, *rel.split("/")) if rel else self.root
+
+    def _usable(self, rel: str) -> bool:
+        """`rel` and none of its parent folders are ignored."""
+        parts = rel.split("/") if rel else []
+        return not any(self.rules.ignored("/".join(parts[:i + 1]), True) for i in range(len(parts)))
+
+    def listdir(self, folder: str = "") -> tuple[list[str], list[str]]:
+        """(subfolder names, markdown file names) directly inside `folder`."""
+        dirs, files = [], []
+        if not self._usable(folder):
+            return dirs, files
+        self._list(folder, dirs, files)
+        return dirs, files
+
+    def _list(self, folder: str, dirs: list[str], files: list[str]) -> None:
+        try:
+            it = os.scandir(self._path(folder))
+        except OSError:
+            return
+        self.dirs_listed += 1
+        prefix = f"{folder}/" if folder else ""
+        with it:
+            for entry in it:
+                name = entry.name
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    continue
+                if is_dir:
+                    # Like os.walk: symlinked folders are not followed
+                    if not entry.is_symlink() and not self.rules.ignored(prefix + name, True):
+                        dirs.append(name)
+                elif name.endswith(".md") and not self.rules.ignored(prefix + name):
+                    files.append(name)
+
+    def markdown(self, folder: str = "", recursive: bool = True) -> Iterator[tuple[str, str]]:
+        """(vault-relative path, absolute path) of every markdown file under `folder`.
+
+        Top-down in directory order, like os.walk.
+        """
+        if not self._usable(folder):
+            return
+        stack = [folder]
+        while stack:
+            current = stack.pop()
+            dirs, files = [], []
+            self._list(current, dirs, files)
+            prefix = f"{current}/" if current else ""
+            for name in files:
+                rel = prefix + name
+                yield rel, self._path(rel)
+            if recursive:
+                stack.extend(prefix + d for d in reversed(dirs))
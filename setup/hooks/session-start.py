@@ -8,84 +8,170 @@ presents Claude with a concise orientation context.
 
 FEATURES:
 - Zero dependencies (regex-based YAML parser, no pip install needed)
-- Computes state from frontmatter (1->7 pattern)
+- Computes state from frontmatter (1->7 pattern), normalized by per-type
+  schemas (orglib/schema.py) so malformed dates are skipped, not fatal
 - Scans tasks, inbox (with subfolders), reminders, knowledge
-- Reads project info from context/current-state.md
+- Active projects from a project index over projects/*/README.md with open
+  tasks and last activity rolled up (.org-cache/projects.json, refreshed
+  incrementally); falls back to context/current-state.md without projects
 - Skips on resume (context already loaded)
-- Extracts collaboration style from context/voice.md
+- Extracts collaboration style from context/voice.md, plus any sections
+  listed in CLAUDE_ORG_SECTIONS ("file#Heading;..."), through one heading
+  index per file (orglib/sections.py)
+- Tasks completed this week and stale knowledge, from a date index cached
+  in .org-cache/dates.json (only notes changed since the last run are read)
+- Repeat starts reuse the last orientation from .org-cache/session-start.json
+  while nothing under tasks/, inbox/, reminders/, knowledge/ or the context
+  files has changed (a stat of each, no reads); set CLAUDE_ORG_HOOK_CACHE=0
+  to always rebuild
+- Asks the org daemon (org-daemon.py) first when one is running for the
+  org dir, and falls back to scanning when it isn't
+- Fits a size budget (CLAUDE_ORG_BUDGET, default 16000 characters; "4000t"
+  for tokens): tasks are ranked by priority and recency, and sections are
+  cut to "+N more" lowest priority first, reminders last (orglib/budget.py)
+- Optional JSON-lines metrics (set CLAUDE_ORG_METRICS=/path/to/metrics.jsonl)
 
 INSTALLATION:
-1. Copy to ~/.claude/hooks/session-start.py
+1. Copy to ~/.claude/hooks/session-start.py, with the orglib/ folder beside it
+   (python setup/install.py does both)
 2. Add to settings.json:
 
    {
      "hooks": {
-       "SessionStart": {
-         "command": "python ~/.claude/hooks/session-start.py",
-         "timeout": 5000
-       }
+       "SessionStart": [
+         {
+           "hooks": [
+             {
+               "type": "command",
+               "command": "python ~/.claude/hooks/session-start.py",
+               "timeout": 5
+             }
+           ]
+         }
+       ]
      }
    }
 
 3. Restart Claude Code
 """
 
+import io
 import json
 import sys
 import os
-import re
-import glob as glob_module
-from datetime import datetime, timedelta
+from contextlib import redirect_stdout
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+
+from orglib import DateIndex, Doc, FrontmatterReader, ProjectIndex, Stats, VaultWalker, daemon, metrics
+from orglib.budget import Orientation, Section, parse_budget, top
+from orglib.dates import day_ordinal
+from orglib.frontmatter import parse_simple
+from orglib.hookcache import ResultCache, fingerprint
+from orglib.schema import SCHEMAS
+from orglib.sections import HeadingIndex, parse_section_specs
 
 # Fix Windows console encoding
 if hasattr(sys.stdout, 'reconfigure'):
     sys.stdout.reconfigure(encoding='utf-8')
 
 # Customize this path to your org system location
-ORG_DIR = os.path.expanduser("~/Documents/claude-org")
+# (the CLAUDE_ORG_DIR environment variable overrides it)
+ORG_DIR = os.path.expanduser(os.environ.get("CLAUDE_ORG_DIR", "~/Documents/claude-org"))
 
+# Work counters for this invocation (emitted only if CLAUDE_ORG_METRICS is set)
+STATS = Stats("session-start")
 
-def parse_frontmatter(filepath: str) -> dict:
-    """Parse YAML frontmatter from a markdown file using regex (no PyYAML dependency)."""
+# One read buffer reused for every note
+READER = FrontmatterReader()
+
+# Knowledge not updated for this many days is reported as stale
+STALE_DAYS = 90
+
+# Size of the orientation in characters, or tokens with a "t" suffix
+# ("4000t"); "0" turns the limit off. Lower-priority sections are cut to
+# "+N more" first (see orglib/budget.py).
+BUDGET = parse_budget(os.environ.get("CLAUDE_ORG_BUDGET"), 16000)
+
+# Task `priority:` values, most urgent first; tasks without one count as medium
+PRIORITY_RANK = {'critical': 0, 'urgent': 0, 'high': 1, 'medium': 2, 'normal': 2, 'low': 3}
+DEFAULT_PRIORITY = 2
+
+# Active projects listed; the rest are counted
+PROJECT_LIMIT = 10
+
+# Overdue and due-today reminders listed; the rest are counted
+REMINDER_LIMIT = 5
+
+# Most lines quoted from one context section
+SECTION_LINES = 25
+
+# More sections to quote, as "file#Heading;file#Heading" relative to the
+# org dir, e.g. CLAUDE_ORG_SECTIONS="context/current-state.md#Open Questions"
+EXTRA_SECTIONS = parse_section_specs(os.environ.get("CLAUDE_ORG_SECTIONS"))
+
+# What the orientation is built from; a change to any of these (or to this
+# file) invalidates the cached orientation in .org-cache/session-start.json
+WATCHED_FOLDERS = ("tasks", "projects", "inbox", "reminders", "knowledge")
+WATCHED_FILES = ("context/current-state.md", "context/voice.md", ".orgignore",
+                 *dict.fromkeys(rel for rel, _ in EXTRA_SECTIONS))
+
+# Parsed notes by path. None in the hook; org-daemon.py sets a dict to keep
+# notes between queries and drops entries as files change.
+DOC_CACHE: dict[str, Doc] | None = None
+
+
+def parse_frontmatter(filepath: str) -> tuple[dict, float]:
+    """Parse YAML frontmatter from a markdown file line by line (no PyYAML dependency).
+
+    Returns the frontmatter and the file's mtime (0.0 if it can't be read).
+    """
+    STATS.files_scanned += 1
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # Reads and decodes only the frontmatter block, not the body
+        header = READER.read(filepath)
     except Exception:
-        return {}
+        return {}, 0.0
+    STATS.count('files_read')
+    STATS.count('bytes_read', header.bytes_read)
 
-    if not content.startswith('---'):
-        return {}
+    if header.text is None:
+        return {}, header.mtime
 
-    parts = content.split('---', 2)
-    if len(parts) < 3:
-        return {}
+    result = parse_simple(header.text)
+    STATS.files_parsed += 1
+    return result, header.mtime
 
-    yaml_content = parts[1].strip()
-    result = {}
-
-    for line in yaml_content.split('\n'):
-        if ':' in line:
-            key, value = line.split(':', 1)
-            key = key.strip()
-            value = value.strip()
-
-            # Parse lists: [item1, item2]
-            if value.startswith('[') and value.endswith(']'):
-                inner = value[1:-1].strip()
-                if inner:
-                    result[key] = [v.strip().strip('"\'') for v in inner.split(',')]
-                else:
-                    result[key] = []
-            # Parse null/empty
-            elif value.lower() == 'null' or value == '':
-                result[key] = None
-            # Parse quoted strings
-            else:
-                result[key] = value.strip('"\'')
-
-    result['_filepath'] = filepath
-    result['_filename'] = os.path.basename(filepath).replace('.md', '')
-    return result
+
+@lru_cache(maxsize=None)
+def walker(org_dir: str) -> VaultWalker:
+    """Folder listing for an org dir, honoring its .orgignore."""
+    return VaultWalker(org_dir)
+
+
+def notes_in(org_dir: str, folder: str) -> list[str]:
+    """Paths of the markdown notes directly inside a vault folder."""
+    return [path for _, path in walker(org_dir).markdown(folder, recursive=False)]
+
+
+def load_doc(filepath: str, org_dir: str) -> Doc:
+    """Parse a note into a compact Doc; the full frontmatter dict is not kept.
+
+    Frontmatter is normalized by its type's schema first (orglib/schema.py),
+    so e.g. a reminder's remind-at is either valid ISO text or None.
+    """
+    if DOC_CACHE is not None and filepath in DOC_CACHE:
+        STATS.count('cache_hits')
+        return DOC_CACHE[filepath]
+    rel = os.path.relpath(filepath, org_dir).replace(os.sep, '/')
+    frontmatter, mtime = parse_frontmatter(filepath)
+    problems = SCHEMAS.normalize(rel, frontmatter)
+    if problems:
+        STATS.count('schema_violations', len(problems))
+    doc = Doc.from_frontmatter(-1, rel, frontmatter, mtime)
+    if DOC_CACHE is not None:
+        DOC_CACHE[filepath] = doc
+    return doc
 
 
 def scan_tasks(org_dir: str) -> dict:
@@ -104,25 +190,23 @@ def scan_tasks(org_dir: str) -> dict:
     }
 
     # Scan root tasks folder
-    for filepath in glob_module.glob(os.path.join(tasks_dir, "*.md")):
+    for filepath in notes_in(org_dir, "tasks"):
         if os.path.basename(filepath) == 'README.md':
             continue
-        meta = parse_frontmatter(filepath)
-        if meta.get('type') != 'task':
+        doc = load_doc(filepath, org_dir)
+        if doc.type != 'task':
             continue
-        status = meta.get('status', 'active')
+        status = doc.status or 'active'
         if status in result:
-            result[status].append(meta)
+            result[status].append(doc)
 
     # Scan subfolders (review, backlog, incubating, paused)
     for subfolder in ['review', 'backlog', 'incubating', 'paused']:
-        subfolder_path = os.path.join(tasks_dir, subfolder)
-        if os.path.exists(subfolder_path):
-            for filepath in glob_module.glob(os.path.join(subfolder_path, "*.md")):
-                meta = parse_frontmatter(filepath)
-                if meta.get('type') != 'task':
-                    continue
-                result[subfolder].append(meta)
+        for filepath in notes_in(org_dir, f"tasks/{subfolder}"):
+            doc = load_doc(filepath, org_dir)
+            if doc.type != 'task':
+                continue
+            result[subfolder].append(doc)
 
     return result
 
@@ -148,25 +232,28 @@ def scan_inbox(org_dir: str) -> dict:
 
     # Scan each known subfolder
     for folder_name, category in folder_map.items():
-        folder_path = os.path.join(inbox_dir, folder_name)
-        if os.path.exists(folder_path):
-            for filepath in glob_module.glob(os.path.join(folder_path, "*.md")):
-                if os.path.basename(filepath) != 'README.md':
-                    counts[category] += 1
+        for filepath in notes_in(org_dir, f"inbox/{folder_name}"):
+            if os.path.basename(filepath) != 'README.md':
+                counts[category] += 1
 
     # Scan root inbox for any stray files
-    for filepath in glob_module.glob(os.path.join(inbox_dir, "*.md")):
+    for filepath in notes_in(org_dir, "inbox"):
         if os.path.basename(filepath) != 'README.md':
             counts['other'] += 1
 
     return counts
 
 
+def parse_moment(value: str) -> datetime:
+    """Naive datetime from schema-checked ISO text (a timezone is dropped)."""
+    return datetime.fromisoformat(value.replace('Z', '+00:00')).replace(tzinfo=None)
+
+
 def scan_reminders(org_dir: str) -> dict:
     """Scan reminders folder for due/overdue items."""
     reminders_dir = os.path.join(org_dir, "reminders")
     if not os.path.exists(reminders_dir):
-        return {'overdue': [], 'due_today': [], 'due_soon': []}
+        return {'overdue': [], 'due_today': [], 'due_soon': [], 'next_change': None}
 
     now = datetime.now()
     today = now.date()
@@ -176,16 +263,18 @@ def scan_reminders(org_dir: str) -> dict:
         'due_today': [],
         'due_soon': [],
     }
+    # Earliest future remind-at/snoozed-until: when these buckets next change
+    next_change = None
 
-    for filepath in glob_module.glob(os.path.join(reminders_dir, "*.md")):
+    for filepath in notes_in(org_dir, "reminders"):
         if os.path.basename(filepath) == 'README.md':
             continue
 
-        meta = parse_frontmatter(filepath)
-        if meta.get('type') != 'reminder':
+        meta = load_doc(filepath, org_dir)
+        if meta.type != 'reminder':
             continue
 
-        status = meta.get('status', 'pending')
+        status = meta.status or 'pending'
 
         # Skip completed/dismissed
         if status in ('completed', 'dismissed'):
@@ -195,39 +284,32 @@ def scan_reminders(org_dir: str) -> dict:
         if status == 'snoozed':
             snoozed_until = meta.get('snoozed-until')
             if snoozed_until:
-                try:
-                    snooze_dt = datetime.fromisoformat(snoozed_until.replace('Z', '+00:00'))
-                    if snooze_dt.tzinfo:
-                        snooze_dt = snooze_dt.replace(tzinfo=None)
-                    if snooze_dt <= now:
-                        result['due_today'].append(meta)
-                except Exception:
-                    pass
+                snooze_dt = parse_moment(snoozed_until)
+                if snooze_dt <= now:
+                    result['due_today'].append(meta)
+                elif next_change is None or snooze_dt < next_change:
+                    next_change = snooze_dt
             continue
 
         # Handle ongoing - skip (not time-based)
         if status == 'ongoing':
             continue
 
-        # Parse remind-at datetime
+        # remind-at datetime (missing or unreadable ones were dropped by the schema)
         remind_at = meta.get('remind-at')
         if not remind_at:
             continue
 
-        try:
-            remind_dt = datetime.fromisoformat(remind_at.replace('Z', '+00:00'))
-            if remind_dt.tzinfo:
-                remind_dt = remind_dt.replace(tzinfo=None)
-            remind_date = remind_dt.date()
-
-            if remind_dt < now:
-                result['overdue'].append(meta)
-            elif remind_date == today:
-                result['due_today'].append(meta)
-            elif remind_dt < now + timedelta(hours=24):
-                result['due_soon'].append(meta)
-        except Exception:
-            pass
+        remind_dt = parse_moment(remind_at)
+        if remind_dt < now:
+            result['overdue'].append(meta)
+            continue
+        if next_change is None or remind_dt < next_change:
+            next_change = remind_dt
+        if remind_dt.date() == today:
+            result['due_today'].append(meta)
+        elif remind_dt < now + timedelta(hours=24):
+            result['due_soon'].append(meta)
 
     # Sort each list by remind-at
     def sort_key(r):
@@ -237,6 +319,7 @@ def scan_reminders(org_dir: str) -> dict:
     for key in result:
         result[key].sort(key=sort_key)
 
+    result['next_change'] = next_change
     return result
 
 
@@ -249,13 +332,14 @@ def scan_knowledge_folders(org_dir: str) -> dict:
     folders = {}
     root_files = []
 
-    for entry in os.scandir(knowledge_dir):
-        if entry.is_dir() and not entry.name.startswith('.'):
-            count = len([f for f in os.listdir(entry.path) if f.endswith('.md')])
-            if count > 0:
-                folders[entry.name] = count
-        elif entry.is_file() and entry.name.endswith('.md') and entry.name != 'README.md':
-            root_files.append(entry.name.replace('.md', ''))
+    subfolders, files = walker(org_dir).listdir("knowledge")
+    for name in subfolders:
+        count = len(walker(org_dir).listdir(f"knowledge/{name}")[1])
+        if count > 0:
+            folders[name] = count
+    for name in files:
+        if name != 'README.md':
+            root_files.append(name.replace('.md', ''))
 
     return {'folders': folders, 'root_files': root_files}
 
@@ -278,86 +362,171 @@ def main():
     if not os.path.exists(claude_md):
         sys.exit(0)
 
-    print('<session-context source="SessionStart hook">')
-    print('## Auto-loaded Orientation')
-    print('')
-
-    # === COMPUTED STATE FROM FRONTMATTER (1->7 pattern) ===
-    print('## Current State')
-    print('')
+    # A running org daemon has everything in memory already
+    with STATS.phase('daemon'):
+        answer = daemon.request(org_dir, 'orientation')
+    if answer is not None:
+        STATS.count('daemon_hits')
+        sys.stdout.write(answer)
+        return
+
+    if os.environ.get("CLAUDE_ORG_HOOK_CACHE", "1") == "0":
+        orient(org_dir)
+        return
+
+    # Same inputs, same orientation: reuse the last one until a watched
+    # file changes or the clock moves past what it showed
+    with STATS.phase('fingerprint'):
+        fp = fingerprint(org_dir, WATCHED_FOLDERS, WATCHED_FILES,
+                         extra=(os.stat(__file__).st_mtime_ns, STALE_DAYS, EXTRA_SECTIONS, BUDGET), stats=STATS)
+    cache = ResultCache(org_dir, 'session-start')
+    cached = cache.get(fp)
+    if cached is not None:
+        STATS.count('cache_hits')
+        sys.stdout.write(cached)
+        return
+
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        valid_until = orient(org_dir)
+    text = buffer.getvalue()
+    sys.stdout.write(text)
+    with STATS.phase('cache'):
+        cache.put(fp, text, valid_until)
+
+
+def task_lines(docs: list, limit: int | None, line) -> list[str]:
+    """Lines for the best-ranked tasks (see task_rank), at most `limit` of them."""
+    return [line(t) for t in top(docs, limit, key=task_rank)]
+
+
+def task_rank(doc: Doc) -> tuple:
+    """Sort key: `priority:` first, then most recently updated/created, then mtime."""
+    priority = PRIORITY_RANK.get(doc.get('priority'), DEFAULT_PRIORITY)  # lowercased by the schema
+    days = [d for d in (day_ordinal(doc.updated), day_ordinal(doc.created)) if d is not None]
+    return (priority, -max(days, default=0), -doc.mtime, doc.name)
+
+
+def limited(limit: int | None, cap: int) -> int:
+    return cap if limit is None else min(limit, cap)
+
+
+def orient(org_dir: str) -> float:
+    """Print the orientation block; returns the time (epoch seconds) it goes stale."""
+    out = Orientation(BUDGET)
+    out.add(Section(0, [
+        '<session-context source="SessionStart hook">',
+        '## Auto-loaded Orientation',
+        '',
+        # === COMPUTED STATE FROM FRONTMATTER (1->7 pattern) ===
+        '## Current State',
+        '',
+    ]))
 
     # Tasks by status
-    tasks_by_status = scan_tasks(org_dir)
+    with STATS.phase('tasks'):
+        tasks_by_status = scan_tasks(org_dir)
 
-    print('### Active Tasks')
     active = tasks_by_status.get('active', [])
     if active:
-        for t in active:
-            tags = t.get('tags', [])
+        def active_line(t):
+            tags = t.tags
             tag_str = f" [{', '.join(tags)}]" if tags else ""
-            print(f"- **{t['_filename']}**{tag_str} - See `tasks/{t['_filename']}.md`")
+            return f"- **{t.name}**{tag_str} - See `tasks/{t.name}.md`"
+        out.add(Section(2, ['### Active Tasks'], task_lines(active, out.limit, active_line),
+                        total=len(active), tail=['']))
     else:
-        print('_No active tasks_')
-    print('')
+        out.add(Section(2, ['### Active Tasks', '_No active tasks_', '']))
 
     # Blocked tasks
     blocked = tasks_by_status.get('blocked', [])
     if blocked:
-        print('### Blocked Tasks')
-        for t in blocked:
-            blocked_by = t.get('blocked-by', [])
+        def blocked_line(t):
+            blocked_by = t.blocked_by
             blocked_str = ', '.join(blocked_by) if blocked_by else 'unknown'
-            print(f"- **{t['_filename']}** - blocked by: {blocked_str}")
-        print('')
+            return f"- **{t.name}** - blocked by: {blocked_str}"
+        out.add(Section(3, ['### Blocked Tasks'], task_lines(blocked, out.limit, blocked_line),
+                        total=len(blocked), tail=['']))
 
     # Review tasks
     review = tasks_by_status.get('review', [])
     if review:
-        print('### Tasks Needing Review')
-        for t in review:
-            review_needed = t.get('review-needed', 'decision needed')
-            print(f"- **{t['_filename']}** - {review_needed}")
-        print('')
+        def review_line(t):
+            review_needed = t.get('review-needed') or 'decision needed'
+            return f"- **{t.name}** - {review_needed}"
+        out.add(Section(4, ['### Tasks Needing Review'], task_lines(review, out.limit, review_line),
+                        total=len(review), tail=['']))
 
     # Summary of other categories
     backlog_count = len(tasks_by_status.get('backlog', []))
     incubating_count = len(tasks_by_status.get('incubating', []))
     paused_count = len(tasks_by_status.get('paused', []))
     if backlog_count or incubating_count or paused_count:
-        print(f'**Other:** {backlog_count} backlog, {incubating_count} incubating, {paused_count} paused')
-        print('')
-
-    # Active Projects (from context/current-state.md)
-    current_state_md = os.path.join(org_dir, "context", "current-state.md")
-    if os.path.exists(current_state_md):
-        with open(current_state_md, 'r', encoding='utf-8') as f:
-            state_content = f.read()
-
-        project_match = re.search(r'## Active Projects\n(.*?)(?=\n## |\Z)', state_content, re.DOTALL)
-        if project_match:
-            print('### Active Projects')
-            print(project_match.group(1).strip())
-            print('')
-
-    # Knowledge Base (computed from folder structure)
-    kb_info = scan_knowledge_folders(org_dir)
+        out.add(Section(5, [f'**Other:** {backlog_count} backlog, {incubating_count} incubating, {paused_count} paused',
+                            '']))
+
+    # Active Projects: from the project index (README frontmatter plus task
+    # rollups, as on the dashboard); vaults without project READMEs fall
+    # back to the hand-kept section of context/current-state.md
+    with STATS.phase('projects'):
+        projects = ProjectIndex.cached(org_dir, reader=READER, stats=STATS)
+        rollups = projects.rollups()
+    active_projects = projects.with_status('active')
+    if active_projects:
+        lines = []
+        for p in top(active_projects, limited(out.limit, PROJECT_LIMIT),
+                     key=lambda p: (-(rollups[p.name].last or 0), p.name)):
+            rollup = rollups[p.name]
+            open_tasks = f"{rollup.open_total} open ({rollup.summary()})" if rollup.open else "no open tasks"
+            last = f", last activity {date.fromordinal(rollup.last)}" if rollup.last else ""
+            lines.append(f"- **{p.name}** - {open_tasks}{last} - See `{p.rel}`")
+        out.add(Section(6, ['### Active Projects'], lines, total=len(active_projects), tail=['']))
+    else:
+        state = HeadingIndex.load(os.path.join(org_dir, "context", "current-state.md"), stats=STATS)
+        section = state.section('Active Projects') if state else None
+        if section is not None:
+            out.add(Section(6, ['### Active Projects'], section.strip().split('\n'),
+                            more='_(+{n} more lines in `context/current-state.md`)_', tail=['']))
+
+    # Knowledge Base (computed from folder structure): the biggest folders
+    # are kept when it doesn't all fit, listed alphabetically
+    with STATS.phase('knowledge'):
+        kb_info = scan_knowledge_folders(org_dir)
     if kb_info and kb_info.get('folders'):
-        print('### Knowledge Base')
-        print('See `knowledge/README.md` for full index.')
-        print('')
-        print('| Folder | Files |')
-        print('|--------|-------|')
-        for folder, count in sorted(kb_info['folders'].items()):
-            print(f"| `{folder}/` | {count} |")
-        if kb_info.get('root_files'):
-            print(f"| *(root)* | {len(kb_info['root_files'])} |")
-        print('')
+        folders = kb_info['folders']
+        biggest = top(folders.items(), out.limit, key=lambda item: (-item[1], item[0]))
+        root_row = [f"| *(root)* | {len(kb_info['root_files'])} |"] if kb_info.get('root_files') else []
+        out.add(Section(10, ['### Knowledge Base', 'See `knowledge/README.md` for full index.', '',
+                             '| Folder | Files |', '|--------|-------|'],
+                        [f"| `{folder}/` | {count} |" for folder, count in biggest],
+                        total=len(folders), more='| *+{n} more* | |', tail=root_row + [''],
+                        order=lambda row: row.split('`')[1]))
+
+    # Completed this week / stale knowledge (range queries on the date index)
+    with STATS.phase('dates'):
+        dates = DateIndex.cached(org_dir, reader=READER, stats=STATS)
+    today = datetime.now().date()
+    monday = today - timedelta(days=today.weekday())
+    done = dates.count('completed', monday, today + timedelta(days=1),
+                       where=lambda _, entry: entry[0] == 'task')
+    stale = list(dates.between('touched', end=today - timedelta(days=STALE_DAYS),
+                               where=lambda rel, entry: rel.startswith('knowledge/') and entry[0] == 'knowledge'))
+    if done or stale:
+        activity = ['### Activity']
+        if done:
+            activity.append(f'**Completed this week:** {done} task(s)')
+        if stale:
+            oldest = ', '.join(f"`{rel}`" for _, rel in stale[:3])
+            more = f' (+{len(stale) - 3} more)' if len(stale) > 3 else ''
+            activity.append(f'**Stale knowledge:** {len(stale)} note(s) not updated in {STALE_DAYS}+ days - oldest: {oldest}{more}')
+        out.add(Section(7, activity + ['']))
 
     # Inbox summary (by folder)
-    inbox_counts = scan_inbox(org_dir)
+    with STATS.phase('inbox'):
+        inbox_counts = scan_inbox(org_dir)
     total_inbox = sum(inbox_counts.values())
     if total_inbox > 0:
-        print('### Inbox')
+        inbox = ['### Inbox']
         display_map = [
             ('email', 'Pending Emails'),
             ('ticket', 'Pending Tickets'),
@@ -370,51 +539,63 @@ def main():
         for key, label in display_map:
             count = inbox_counts.get(key, 0)
             if count > 0:
-                print(f"**{label}:** {count}")
-        print('')
+                inbox.append(f"**{label}:** {count}")
+        out.add(Section(8, inbox + ['']))
 
-    # Due reminders alert
-    reminders = scan_reminders(org_dir)
+    # Due reminders alert: the most urgent section, so it's the last to be cut
+    with STATS.phase('reminders'):
+        reminders = scan_reminders(org_dir)
     total_due = len(reminders['overdue']) + len(reminders['due_today'])
 
     if total_due > 0:
-        print(f'### ACTION REQUIRED: {total_due} Due Reminder(s)')
-        print('')
-
-        if reminders['overdue']:
-            print('**Overdue:**')
-            for r in reminders['overdue'][:5]:
-                remind_at = r.get('remind-at', 'unknown')
-                print(f"- [{remind_at}] **{r['_filename']}**")
-            print('')
-
-        if reminders['due_today']:
-            print('**Due Today:**')
-            for r in reminders['due_today'][:5]:
+        head = [f'### ACTION REQUIRED: {total_due} Due Reminder(s)', '']
+        footer = ['Use `org_reminder_list` to see all reminders.', '']
+
+        overdue = reminders['overdue']
+        if overdue:
+            out.add(Section(1, head + ['**Overdue:**'],
+                            [f"- [{r.get('remind-at', 'unknown')}] **{r.name}**" for r in overdue[:REMINDER_LIMIT]],
+                            total=len(overdue), tail=[''] + ([] if reminders['due_today'] else footer)))
+            head = []
+
+        due_today = reminders['due_today']
+        if due_today:
+            def due_line(r):
                 remind_at = r.get('remind-at', '')
                 time_part = remind_at.split('T')[1][:5] if 'T' in remind_at else ''
-                print(f"- [{time_part}] **{r['_filename']}**")
-            print('')
-
-        print('Use `org_reminder_list` to see all reminders.')
-        print('')
+                return f"- [{time_part}] **{r.name}**"
+            out.add(Section(1, head + ['**Due Today:**'], [due_line(r) for r in due_today[:REMINDER_LIMIT]],
+                            total=len(due_today), tail=[''] + footer))
 
     # Collaboration style from voice.md
-    voice_md = os.path.join(org_dir, "context", "voice.md")
-    if os.path.exists(voice_md):
-        with open(voice_md, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        match = re.search(r'## How to Collaborate\n(.*?)(?=\n## |\Z)', content, re.DOTALL)
-        if match:
-            print('### Collaboration Style')
-            print('')
-            lines = match.group(0).split('\n')[:25]
-            print('\n'.join(lines))
-            print('')
-
-    print('</session-context>')
-
+    voice = HeadingIndex.load(os.path.join(org_dir, "context", "voice.md"), stats=STATS)
+    style = voice.section('How to Collaborate', heading=True) if voice else None
+    if style is not None:
+        out.add(Section(9, ['### Collaboration Style', ''], style.rstrip('\n').split('\n')[:SECTION_LINES],
+                        more='_(+{n} more lines in `context/voice.md`)_', tail=['']))
+
+    # Extra sections from CLAUDE_ORG_SECTIONS
+    for rel, title in EXTRA_SECTIONS:
+        index = HeadingIndex.load(os.path.join(org_dir, *rel.split('/')), stats=STATS)
+        text = index.section(title) if index else None
+        if text is not None and text.strip():
+            out.add(Section(11, [f'### {title}', ''], text.strip('\n').split('\n')[:SECTION_LINES],
+                            more=f'_(+{{n}} more lines in `{rel}`)_', tail=['']))
+
+    out.add(Section(0, ['</session-context>']))
+    with STATS.phase('render'):
+        print(out.render(), end='')
+
+    # Due/overdue reminders and "this week" move with the clock
+    tomorrow = datetime.combine(today + timedelta(days=1), datetime.min.time())
+    changes = [tomorrow]
+    if reminders['next_change'] is not None:
+        changes.append(reminders['next_change'])
+    return min(changes).timestamp()
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    finally:
+        # Also on early sys.exit(0), so skipped runs are measured too
+        metrics.emit(metrics.metrics_path(), STATS, ORG_DIR)
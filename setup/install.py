@@ -3,26 +3,233 @@
 Install hooks for the claude-org system.
 
 The stop hook is essential - it's what makes the system self-maintaining.
+
+Steps:
+1. Copy the hooks and orglib/ to ~/.claude/hooks/ and byte-compile them,
+   so the first session doesn't pay for compiling orglib
+2. Merge SessionStart and Stop entries into ~/.claude/settings.json as
+   matcher groups (a backup is kept as settings.json.bak; other settings
+   are untouched, and older flat entries are converted)
+3. Run both hooks against the org dir and report cold and warm latency
+   against the 5000 ms hook timeout
+
+Hooks are started with `python -S` (no site-packages scan; they only use
+the standard library) and, on Python 3.11+, `-X frozen_modules=on`. The
+flags are probed first and left out if the hooks don't import with them.
+
+Usage:
+  python setup/install.py
+  python setup/install.py --org-dir ~/org       # measure against another org dir
+  python setup/install.py --print-only          # show settings, don't edit them
+  python setup/install.py --skip-check          # don't run the hooks
 """
 
+import argparse
+import compileall
+import json
 import os
+import statistics
+import subprocess
 import sys
 import shutil
+import tempfile
+import time
 from pathlib import Path
 
+# Hook event -> script
+HOOKS = {
+    "SessionStart": "session-start.py",
+    "Stop": "maintenance-check.py",
+}
+
+TIMEOUT_MS = 5000
+# settings.json takes hook timeouts in seconds
+TIMEOUT_S = TIMEOUT_MS // 1000
+
+# Warn when a hook run takes more than this share of its timeout
+BUDGET_SHARE = 0.5
+
+# Warm runs per hook
+WARM_RUNS = 5
+
 def get_claude_dir():
     """Get the Claude configuration directory."""
     if sys.platform == "win32":
         return Path(os.environ.get("USERPROFILE", "")) / ".claude"
     return Path.home() / ".claude"
 
+def display_path(path):
+    """Path as written into settings.json (forward slashes on Windows)."""
+    return str(path).replace("\\", "/") if sys.platform == "win32" else str(path)
+
+def fast_flags(hooks_dest):
+    """Interpreter flags for quicker hook startup, if the hooks import with them."""
+    flags = ["-S"]
+    if sys.version_info >= (3, 11):
+        flags += ["-X", "frozen_modules=on"]
+    probe = f"import sys; sys.path.insert(0, {str(hooks_dest)!r}); import json, socket, orglib, orglib.daemon"
+    result = subprocess.run([sys.executable, *flags, "-c", probe], capture_output=True)
+    return flags if result.returncode == 0 else []
+
+def hook_command(hooks_dest, script, flags):
+    parts = [f'"{display_path(sys.executable)}"', *flags, f'"{display_path(hooks_dest / script)}"']
+    return " ".join(parts)
+
+def hook_entry(command, timeout=TIMEOUT_S):
+    return {"type": "command", "command": command, "timeout": timeout}
+
+def hook_group(command, timeout=TIMEOUT_S):
+    """A matcher group running one command (the form settings.json documents)."""
+    return {"hooks": [hook_entry(command, timeout)]}
+
+def merge_settings(settings, commands):
+    """Add or update our hook entries in a settings dict; returns what changed.
+
+    Every event is written as a list of matcher groups with the timeout in
+    seconds. Our command is updated in place if it's already there and
+    added as a new group if not. An event in the older flat form
+    ({"command", "timeout"} in milliseconds) is converted to a group
+    first, keeping whatever hook it held.
+    """
+    hooks = settings.setdefault("hooks", {})
+    changes = []
+    for event, command in commands.items():
+        script = HOOKS[event]
+        current = hooks.get(event)
+        if current is None:
+            hooks[event] = [hook_group(command)]
+            changes.append(f"added {event}")
+            continue
+        if isinstance(current, dict):
+            timeout = current.get("timeout")
+            seconds = -(-timeout // 1000) if isinstance(timeout, int) else TIMEOUT_S
+            current = hooks[event] = [hook_group(current["command"], seconds)] if current.get("command") else []
+            changes.append(f"converted {event} to matcher groups")
+        if not isinstance(current, list):
+            changes.append(f"kept {event}: unrecognized entry")
+            continue
+        entries = [h for group in current if isinstance(group, dict)
+                   for h in group.get("hooks", []) if isinstance(h, dict)]
+        ours = [h for h in entries if script in h.get("command", "")]
+        for h in ours:
+            if h["command"] != command:
+                h["command"] = command
+                changes.append(f"updated {event}")
+        if not ours:
+            current.append(hook_group(command))
+            changes.append(f"added {event}")
+    return changes
+
+def write_settings(settings_path, commands):
+    """Merge our hooks into settings.json; returns change notes, or None if it can't be parsed."""
+    settings = {}
+    if settings_path.exists():
+        try:
+            settings = json.loads(settings_path.read_text(encoding="utf-8") or "{}")
+        except ValueError:
+            return None
+        if not isinstance(settings, dict):
+            return None
+    changes = merge_settings(settings, commands)
+    if any(not c.startswith("kept") for c in changes):
+        if settings_path.exists():
+            shutil.copy2(settings_path, settings_path.with_name(settings_path.name + ".bak"))
+        settings_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = settings_path.with_name(settings_path.name + ".tmp")
+        tmp.write_text(json.dumps(settings, indent=2) + "\n", encoding="utf-8")
+        os.replace(tmp, settings_path)
+    return changes
+
+def print_snippet(commands):
+    print(json.dumps({"hooks": {event: [hook_group(command)]
+                                for event, command in commands.items()}}, indent=2))
+
+def count_notes(org_dir):
+    total = 0
+    for _, dirs, files in os.walk(org_dir):
+        dirs[:] = [d for d in dirs if not d.startswith(".") and d != "node_modules"]
+        total += sum(1 for f in files if f.endswith(".md"))
+    return total
+
+def run_hook(command_args, stdin, env):
+    """Milliseconds for one hook run, and whether it succeeded."""
+    started = time.perf_counter()
+    result = subprocess.run(command_args, input=stdin, capture_output=True, text=True, env=env,
+                            timeout=TIMEOUT_MS / 1000 * 4)
+    return (time.perf_counter() - started) * 1000, result.returncode == 0
+
+def measure(hooks_dest, flags, org_dir):
+    """{event: {"cold", "warm", "uncached"} ms} for both hooks against org_dir."""
+    env = dict(os.environ, CLAUDE_ORG_DIR=str(org_dir),
+               # The check must not edit the vault
+               CLAUDE_ORG_REMINDER_UPKEEP="0")
+    env.pop("CLAUDE_ORG_METRICS", None)
+    with tempfile.NamedTemporaryFile("w", suffix=".jsonl", delete=False) as f:
+        f.write("{}\n" * 20)
+        transcript = f.name
+    inputs = {
+        "SessionStart": json.dumps({"source": "startup"}),
+        "Stop": json.dumps({"transcript_path": transcript}),
+    }
+    results = {}
+    try:
+        for event, script in HOOKS.items():
+            args = [sys.executable, *flags, str(hooks_dest / script)]
+            cold, ok = run_hook(args, inputs[event], env)
+            warm = [run_hook(args, inputs[event], env)[0] for _ in range(WARM_RUNS)]
+            # What a session sees right after an edit: no cached result
+            uncached = [run_hook(args, inputs[event], dict(env, CLAUDE_ORG_HOOK_CACHE="0"))[0]
+                        for _ in range(WARM_RUNS)]
+            results[event] = {"ok": ok, "cold": cold, "warm": statistics.median(warm),
+                              "uncached": statistics.median(uncached)}
+    finally:
+        os.unlink(transcript)
+    return results
+
+def report_latency(results, org_dir):
+    notes = count_notes(org_dir)
+    print(f"Hook latency against {org_dir} ({notes} notes, timeout {TIMEOUT_MS} ms):")
+    print()
+    print(f"  {'hook':<14} {'cold':>9} {'warm':>9} {'uncached':>9}")
+    slow = []
+    for event, r in results.items():
+        status = "" if r["ok"] else "  FAILED"
+        print(f"  {event:<14} {r['cold']:>7.0f}ms {r['warm']:>7.0f}ms {r['uncached']:>7.0f}ms{status}")
+        worst = max(r["cold"], r["uncached"])
+        if worst > TIMEOUT_MS * BUDGET_SHARE:
+            slow.append((event, worst))
+    print()
+    for event, worst in slow:
+        verb = "exceeds" if worst > TIMEOUT_MS else "uses more than half of"
+        print(f"WARNING: {event} took {worst:.0f} ms, which {verb} its {TIMEOUT_MS} ms budget.")
+    if slow:
+        print("  This vault is large for the hooks. To bring it down:")
+        print("  - python scripts/archive.py       (move old finished work out of the live folders)")
+        print("  - add bulky folders to .orgignore")
+        print("  - run hooks/org-daemon.py         (keeps the vault in memory between sessions)")
+        print()
+    if any(not r["ok"] for r in results.values()):
+        print("WARNING: a hook exited with an error; run it by hand to see why.")
+        print()
+
 def main():
+    parser = argparse.ArgumentParser(description="Install the claude-org hooks")
+    parser.add_argument("--claude-dir", type=Path, default=get_claude_dir(),
+                        help="Claude configuration directory (default: ~/.claude)")
+    parser.add_argument("--org-dir", type=Path,
+                        default=Path(os.path.expanduser(os.environ.get("CLAUDE_ORG_DIR", "~/Documents/claude-org"))),
+                        help="Org dir the hooks are measured against (default: ~/Documents/claude-org)")
+    parser.add_argument("--print-only", action="store_true",
+                        help="Print the settings.json entries instead of merging them")
+    parser.add_argument("--skip-check", action="store_true", help="Don't run the hooks to measure latency")
+    args = parser.parse_args()
+
     # Find setup directory (where this script lives)
     setup_dir = Path(__file__).parent
     hooks_src = setup_dir / "hooks"
 
     # Target directories
-    claude_dir = get_claude_dir()
+    claude_dir = args.claude_dir
     hooks_dest = claude_dir / "hooks"
 
     print("Claude-Org Infrastructure Installation")
@@ -41,28 +248,48 @@ def main():
         hooks_copied.append(hook_file.name)
         print(f"  Copied: {hook_file.name}")
 
+    # Copy shared helpers the hooks import
+    lib_src = hooks_src / "orglib"
+    if lib_src.is_dir():
+        shutil.copytree(lib_src, hooks_dest / "orglib", dirs_exist_ok=True,
+                        ignore=shutil.ignore_patterns("__pycache__"))
+        print("  Copied: orglib/")
+
+    # Byte-compile now rather than on the first session (which may not be
+    # allowed to write __pycache__ at all)
+    if compileall.compile_dir(str(hooks_dest / "orglib"), quiet=1, force=True):
+        print("  Compiled: orglib/")
+    else:
+        print("  WARNING: orglib/ did not compile cleanly")
+
+    flags = fast_flags(hooks_dest)
+    commands = {event: hook_command(hooks_dest, script, flags) for event, script in HOOKS.items()}
     print()
-    print("Installation complete.")
-    print()
-    print("IMPORTANT: Add to your Claude Code settings.json:")
+    print(f"Interpreter flags: {' '.join(flags) if flags else '(none: the hooks did not import with -S)'}")
     print()
 
-    # Generate platform-appropriate paths
-    if sys.platform == "win32":
-        hook_path = str(hooks_dest / "maintenance-check.py").replace("\\", "/")
+    settings_path = claude_dir / "settings.json"
+    changes = None if args.print_only else write_settings(settings_path, commands)
+    if changes is None:
+        if not args.print_only:
+            print(f"WARNING: {settings_path} is not valid JSON; it was left alone.")
+        print("Add to your Claude Code settings.json:")
+        print()
+        print_snippet(commands)
     else:
-        hook_path = str(hooks_dest / "maintenance-check.py")
-
-    print(f'''{{
-  "hooks": {{
-    "Stop": {{
-      "command": "python \\"{hook_path}\\"",
-      "timeout": 5000
-    }}
-  }}
-}}''')
+        print(f"Settings: {settings_path}")
+        for change in changes or ["already up to date"]:
+            print(f"  {change}")
     print()
-    print("Then restart Claude Code.")
+
+    if not args.skip_check:
+        if (args.org_dir / "CLAUDE.md").exists():
+            report_latency(measure(hooks_dest, flags, args.org_dir), args.org_dir)
+        else:
+            print(f"Skipping the latency check: no org dir at {args.org_dir} (see --org-dir).")
+            print()
+
+    print("Installation complete. Restart Claude Code for the hooks to take effect.")
     print()
     print("The stop hook is essential - it's what makes maintenance automatic.")
 